@@ -0,0 +1,237 @@
+import dataclasses
+import logging
+import os
+import time
+import tomllib
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+from brui_core.browser.launch_presets import parse_extra_args
+
+logger = logging.getLogger(__name__)
+
+# Environment variable naming the TOML config file; DEFAULT_CONFIG_FILE is used if it exists
+CONFIG_FILE_ENV = "BRUI_CORE_CONFIG"
+DEFAULT_CONFIG_FILE = "brui_core.toml"
+
+# The config file is stat()ed at most this often; environment changes are seen immediately
+CONFIG_STAT_INTERVAL = 1.0
+
+
+@dataclass(frozen=True, slots=True)
+class BrowserConfig:
+    """Resolved browser configuration: defaults, then the TOML file, then environment variables."""
+
+    chrome_profile_directory: str = "Profile 1"
+    remote_debugging_port: int = 9222
+    user_data_dir: Optional[str] = None
+    download_directory: Optional[str] = None
+    profile_template_dir: Optional[str] = None
+    profile_clone_root: Optional[str] = None
+    launch_preset: str = "default"
+    launch_extra_args: Tuple[str, ...] = ()
+    hot_spare: bool = False
+    # [pool]
+    pool_size: int = 1
+    pool_base_port: Optional[int] = None
+    # [contexts]: isolated BrowserContexts kept warm per browser, and uses before one is replaced
+    # (1: a fresh context per lease; reusing contexts also reuses their web storage and cache)
+    context_pool_size: int = 2
+    context_max_uses: int = 1
+    # [pages]: pre-created pages per context, leases before a page is closed, idle eviction (s)
+    page_pool_size: int = 1
+    page_max_uses: int = 50
+    page_idle_timeout: float = 60.0
+    # [scheduler]: page admission control per browser; None means unbounded (admission control is opt-in)
+    max_concurrent_pages: Optional[int] = None
+    max_queued_pages: Optional[int] = None
+    # [timeouts], in seconds
+    startup_timeout: float = 20.0
+    probe_timeout: float = 0.25
+
+
+def _parse_bool(value: Any) -> bool:
+    if isinstance(value, str):
+        return value.strip().lower() in ("1", "true", "yes", "on")
+    return bool(value)
+
+
+def _parse_args(value: Any) -> Tuple[str, ...]:
+    return tuple(parse_extra_args(value))
+
+
+# Converters for fields whose TOML/env value needs more than passing through
+_FIELD_PARSERS: Dict[str, Callable[[Any], Any]] = {
+    "remote_debugging_port": int,
+    "hot_spare": _parse_bool,
+    "launch_extra_args": _parse_args,
+    "pool_size": int,
+    "pool_base_port": int,
+    "context_pool_size": int,
+    "context_max_uses": int,
+    "page_pool_size": int,
+    "page_max_uses": int,
+    "page_idle_timeout": float,
+    "max_concurrent_pages": int,
+    "max_queued_pages": int,
+    "startup_timeout": float,
+    "probe_timeout": float,
+}
+
+# TOML table -> {key in table: BrowserConfig field}
+_TOML_TABLES: Dict[str, Dict[str, str]] = {
+    "browser": {field.name: field.name for field in dataclasses.fields(BrowserConfig)},
+    "pool": {"size": "pool_size", "base_port": "pool_base_port"},
+    "contexts": {"pool_size": "context_pool_size", "max_uses": "context_max_uses"},
+    "pages": {"pool_size": "page_pool_size", "max_uses": "page_max_uses", "idle_timeout": "page_idle_timeout"},
+    "scheduler": {"max_concurrent_pages": "max_concurrent_pages", "max_queue": "max_queued_pages"},
+    "timeouts": {"startup": "startup_timeout", "probe": "probe_timeout"},
+}
+
+ENV_OVERRIDES: Dict[str, str] = {
+    "CHROME_PROFILE_DIRECTORY": "chrome_profile_directory",
+    "CHROME_REMOTE_DEBUGGING_PORT": "remote_debugging_port",
+    "CHROME_USER_DATA_DIR": "user_data_dir",
+    "CHROME_DOWNLOAD_DIRECTORY": "download_directory",
+    "CHROME_PROFILE_TEMPLATE_DIR": "profile_template_dir",
+    "CHROME_PROFILE_CLONE_ROOT": "profile_clone_root",
+    "CHROME_LAUNCH_PRESET": "launch_preset",
+    "CHROME_EXTRA_ARGS": "launch_extra_args",
+    "CHROME_HOT_SPARE": "hot_spare",
+    "BRUI_POOL_SIZE": "pool_size",
+    "BRUI_CONTEXT_POOL_SIZE": "context_pool_size",
+    "BRUI_MAX_CONCURRENT_PAGES": "max_concurrent_pages",
+}
+
+_ENV_KEYS = tuple(ENV_OVERRIDES)
+
+
+def _apply(values: Dict[str, Any], field: str, raw: Any, source: str):
+    parser = _FIELD_PARSERS.get(field)
+    try:
+        values[field] = parser(raw) if parser else raw
+    except (TypeError, ValueError):
+        logger.error(f"Invalid value for {field} in {source}: {raw!r}")
+        return
+    logger.debug(f"Overriding {field} from {source}: {values[field]!r}")
+
+
+def read_config_file(path: str) -> Dict[str, Any]:
+    """Read BrowserConfig field values from a TOML file. Unknown tables and keys are ignored with a warning."""
+    with open(path, "rb") as config_file:
+        document = tomllib.load(config_file)
+
+    values: Dict[str, Any] = {}
+    for table_name, table in document.items():
+        fields = _TOML_TABLES.get(table_name)
+        if fields is None or not isinstance(table, dict):
+            logger.warning(f"Ignoring unknown config table [{table_name}] in {path}")
+            continue
+        for key, raw in table.items():
+            if key not in fields:
+                logger.warning(f"Ignoring unknown config key {table_name}.{key} in {path}")
+                continue
+            _apply(values, fields[key], raw, path)
+    return values
+
+
+def build_browser_config(path: Optional[str] = None, environ: Optional[Mapping[str, str]] = None) -> BrowserConfig:
+    """Build a BrowserConfig from an optional TOML file and environment variables, bypassing the cache."""
+    if environ is None:
+        environ = os.environ
+    values: Dict[str, Any] = {}
+    if path is not None:
+        try:
+            values.update(read_config_file(path))
+        except FileNotFoundError:
+            pass
+        except (OSError, tomllib.TOMLDecodeError) as e:
+            logger.error(f"Failed to read config file {path}: {str(e)}")
+    for name, field in ENV_OVERRIDES.items():
+        if name in environ:
+            _apply(values, field, environ[name], name)
+    return BrowserConfig(**values)
+
+
+def _stat_mtime(path: str) -> Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+class _ConfigCache:
+    # Shared by the event loops of several threads without a lock: each piece of state that
+    # must stay consistent is one tuple, replaced with a single (atomic) assignment
+    def __init__(self):
+        # (config file path, its mtime)
+        self.stat: Optional[Tuple[str, Optional[int]]] = None
+        self.next_stat = 0.0
+        # (cache key, config built for it)
+        self.entry: Optional[Tuple[tuple, BrowserConfig]] = None
+        # (config, read-only view of it)
+        self.view: Optional[Tuple[BrowserConfig, Mapping[str, Mapping[str, Any]]]] = None
+
+    def get(self) -> BrowserConfig:
+        path = os.environ.get(CONFIG_FILE_ENV, DEFAULT_CONFIG_FILE)
+        now = time.monotonic()
+        stat = self.stat
+        if stat is None or path != stat[0] or now >= self.next_stat:
+            stat = self.stat = (path, _stat_mtime(path))
+            self.next_stat = now + CONFIG_STAT_INTERVAL
+        mtime = stat[1]
+
+        environ = os.environ
+        key = (path, mtime, tuple(environ.get(name) for name in _ENV_KEYS))
+        entry = self.entry
+        if entry is not None and entry[0] == key:
+            return entry[1]
+
+        config = build_browser_config(path if mtime is not None else None)
+        if entry is not None:
+            logger.info(f"Browser configuration reloaded (config file: {path if mtime is not None else None})")
+        self.entry = (key, config)
+        return config
+
+    def get_view(self) -> Mapping[str, Mapping[str, Any]]:
+        config = self.get()
+        view = self.view
+        if view is None or view[0] is not config:
+            view = self.view = (config, MappingProxyType({"browser": MappingProxyType(
+                {field.name: getattr(config, field.name) for field in dataclasses.fields(config)}
+            )}))
+        return view[1]
+
+    def invalidate(self):
+        self.stat = None
+        self.entry = None
+        self.view = None
+
+
+_cache = _ConfigCache()
+
+
+def load_browser_config() -> BrowserConfig:
+    """
+    Return the current BrowserConfig.
+
+    The result is memoized: it is rebuilt only when an environment override changes or
+    the TOML file's mtime changes (checked at most every CONFIG_STAT_INTERVAL seconds),
+    so calling this from hot paths costs a few dict lookups.
+    """
+    return _cache.get()
+
+
+def reload_browser_config() -> BrowserConfig:
+    """Drop the memoized configuration and load it again."""
+    _cache.invalidate()
+    return _cache.get()
+
+
+def get_browser_config() -> Mapping[str, Mapping[str, Any]]:
+    """
+    Get browser configuration with environment variable overrides, as a read-only
+    {"browser": {...}} mapping. Prefer load_browser_config() for typed access.
+    """
+    return _cache.get_view()
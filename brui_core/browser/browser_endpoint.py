@@ -0,0 +1,52 @@
+from typing import NamedTuple, Optional, Union
+from urllib.parse import urlsplit
+
+
+class BrowserEndpoint(NamedTuple):
+    """A Chrome DevTools endpoint: a host and debugging port, optionally with its websocket URL."""
+    host: str
+    port: int
+    ws_url: Optional[str] = None
+
+    @property
+    def key(self) -> str:
+        """Stable identity of the endpoint, used to key managers."""
+        return self.ws_url or f"{self.host}:{self.port}"
+
+    @property
+    def connect_url(self) -> str:
+        """What to hand to connect_over_cdp(): the websocket URL if known, else the HTTP discovery URL."""
+        return self.ws_url or f"http://{self.host}:{self.port}"
+
+    def __str__(self) -> str:
+        return self.key
+
+
+def parse_endpoint(endpoint: Union[str, int, BrowserEndpoint]) -> BrowserEndpoint:
+    """
+    Parse "host:port", a bare port, "http://host:port" or a "ws://host:port/devtools/browser/..."
+    URL into a BrowserEndpoint.
+
+    Raises:
+        ValueError: If no port can be determined
+    """
+    if isinstance(endpoint, BrowserEndpoint):
+        return endpoint
+    if isinstance(endpoint, int):
+        return BrowserEndpoint("127.0.0.1", endpoint)
+
+    endpoint = endpoint.strip()
+    if endpoint.isdigit():
+        return BrowserEndpoint("127.0.0.1", int(endpoint))
+    if "://" not in endpoint:
+        endpoint = f"http://{endpoint}"
+
+    url = urlsplit(endpoint)
+    try:
+        port = url.port
+    except ValueError:
+        port = None
+    if not url.hostname or port is None:
+        raise ValueError(f"Browser endpoint needs a host and port: {endpoint!r}")
+    ws_url = endpoint if url.scheme in ("ws", "wss") else None
+    return BrowserEndpoint(url.hostname, port, ws_url)
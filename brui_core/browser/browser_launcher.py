@@ -1,28 +1,39 @@
 import os
 import sys
 import subprocess
-import socket
 import asyncio
+import json
+import select
+import signal
 import time
 import logging
-import copy
-from typing import Set, Optional, NamedTuple
-
-# Static configuration
-CONFIG = {
-    "browser": {
-        "chrome_profile_directory": "Profile 1",
-        "remote_debugging_port": 9222,
-        "user_data_dir": None
-    }
-}
+import threading
+from typing import Set, Optional, NamedTuple, BinaryIO, Callable, List
+
+from brui_core.browser.process_scanner import ChromeProcess, ChromeProcessTable, scan_processes
+from brui_core.browser.profile_cloner import ProfileClone, clone_profile
+from brui_core.browser.launch_presets import get_launch_preset_args
+# get_browser_config is re-exported here for existing callers
+from brui_core.browser.browser_config import get_browser_config, load_browser_config  # noqa: F401
+
+# Chrome binds the DevTools port to the IPv4 loopback; a numeric host also avoids a DNS lookup per probe
+DEBUG_PORT_HOST = "127.0.0.1"
+CDP_VERSION_MAX_BYTES = 64 * 1024
+
+# Chrome prints this line to stderr once the DevTools endpoint is accepting connections
+DEVTOOLS_LISTENING_PREFIX = b"DevTools listening on "
 
 logger = logging.getLogger(__name__)
 
-class ChromeProcess(NamedTuple):
-    pid: int
-    ppid: int
-    cmd: str
+class LaunchedBrowser(NamedTuple):
+    process: subprocess.Popen
+    remote_debugging_port: int
+    user_data_dir: Optional[str]
+    ws_endpoint: Optional[str] = None
+    # Process group Chrome runs in; launch_browser() makes Chrome its own session and group leader
+    process_group: Optional[int] = None
+    # Set when user_data_dir was cloned from a profile template and must be removed after exit
+    profile_clone: Optional[ProfileClone] = None
 
 def get_chrome_startup_path() -> str:
     """
@@ -39,46 +50,28 @@ def get_chrome_process_path() -> str:
     """
     return '/opt/google/chrome/chrome'
 
-def get_chrome_pids() -> Set[ChromeProcess]:
+def get_chrome_log_path(remote_debugging_port: Optional[int] = None) -> str:
     """
-    Get all Chrome process PIDs using Linux specific commands.
-    Returns a set of ChromeProcess objects containing pid, ppid, and command.
+    Returns the file Chrome's output is logged to (CHROME_LOG_PATH, default /tmp/brui-chrome.log).
+    When several instances run side by side, pass the port to get a per-instance file.
     """
-    try:
-        chrome_path = get_chrome_process_path()
-        chrome_processes = set()
-
-        # Linux (GNU) ps syntax
-        cmd = ['ps', '-eo', 'pid=,ppid=,cmd=']
-
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        
-        if result.returncode != 0:
-            logger.error(f"Failed to get process list: {result.stderr}")
-            return set()
+    log_path = os.environ.get("CHROME_LOG_PATH", "/tmp/brui-chrome.log")
+    if remote_debugging_port is None or not log_path:
+        return log_path
+    root, ext = os.path.splitext(log_path)
+    return f"{root}-{remote_debugging_port}{ext}"
 
-        # Process each line of output
-        for line in result.stdout.splitlines():
-            try:
-                # Split line but preserve command with all its arguments
-                parts = line.strip().split(maxsplit=2)
-                if len(parts) == 3:
-                    pid, ppid, command = parts
-                    # Only include processes that match our Chrome path
-                    if chrome_path in command:
-                        chrome_processes.add(ChromeProcess(
-                            pid=int(pid),
-                            ppid=int(ppid),
-                            cmd=command
-                        ))
-            except (ValueError, IndexError) as e:
-                logger.debug(f"Error processing process info: {e}")
-                continue
-                    
-        return chrome_processes
+def get_chrome_pids() -> ChromeProcessTable:
+    """
+    Get all Chrome processes on the host.
+    Reads /proc directly when available (falling back to `ps` elsewhere) and returns
+    a ChromeProcessTable: a set of ChromeProcess objects indexed by pid and parent pid.
+    """
+    try:
+        return scan_processes(get_chrome_process_path())
     except Exception as e:
         logger.error(f"Error getting Chrome processes: {e}")
-        return set()
+        return ChromeProcessTable()
 
 def find_main_chrome_parent(processes: Set[ChromeProcess]) -> Optional[ChromeProcess]:
     """
@@ -88,14 +81,11 @@ def find_main_chrome_parent(processes: Set[ChromeProcess]) -> Optional[ChromePro
     if not processes:
         return None
 
-    # Create mapping of pid to process
-    pid_to_process = {p.pid: p for p in processes}
-    
-    # Find processes whose parent is also a Chrome process
-    child_processes = {p for p in processes if p.ppid in pid_to_process}
-    
+    if not isinstance(processes, ChromeProcessTable):
+        processes = ChromeProcessTable(processes)
+
     # The main Chrome process should be a parent but not a child
-    parent_candidates = processes - child_processes
+    parent_candidates = processes.roots()
     
     if not parent_candidates:
         return None
@@ -104,11 +94,41 @@ def find_main_chrome_parent(processes: Set[ChromeProcess]) -> Optional[ChromePro
     # (usually the main browser process has fewer arguments)
     return min(parent_candidates, key=lambda p: len(p.cmd))
 
+def open_pidfd(pid: int) -> Optional[int]:
+    """
+    Return a pidfd for `pid`, or None where pidfds are unsupported (non-Linux, kernel < 5.3).
+    A pidfd becomes readable once the process exits, so exits can be awaited without polling.
+    """
+    if not hasattr(os, "pidfd_open"):
+        return None
+    try:
+        return os.pidfd_open(pid)
+    except ProcessLookupError:
+        raise
+    except OSError as e:
+        logger.debug(f"pidfd_open unavailable for {pid}: {e}")
+        return None
+
 def wait_for_process_termination(pid: int, timeout: int = 5) -> bool:
     """
     Wait for a process to terminate completely.
     Returns True if process terminated, False if timeout occurred.
+
+    Blocks on a pidfd where supported and only falls back to polling os.kill(pid, 0) elsewhere.
     """
+    try:
+        pidfd = open_pidfd(pid)
+    except ProcessLookupError:
+        return True
+
+    if pidfd is not None:
+        try:
+            poller = select.poll()
+            poller.register(pidfd, select.POLLIN)
+            return bool(poller.poll(timeout * 1000))
+        finally:
+            os.close(pidfd)
+
     end_time = time.time() + timeout
     while time.time() < end_time:
         try:
@@ -121,9 +141,56 @@ def wait_for_process_termination(pid: int, timeout: int = 5) -> bool:
             return False
     return False
 
+def watch_process_exit(process: subprocess.Popen) -> asyncio.Future:
+    """
+    Return a future resolved with the process' return code once it exits.
+
+    The exit is observed through a pidfd registered with the running event loop, and the
+    child is reaped as soon as it exits so no zombie is left behind. Where pidfds are not
+    available a daemon thread blocks in Popen.wait() instead. Cancelling the future stops watching.
+    """
+    loop = asyncio.get_running_loop()
+    exit_future = loop.create_future()
+    if process.poll() is not None:
+        exit_future.set_result(process.returncode)
+        return exit_future
+
+    try:
+        pidfd = open_pidfd(process.pid)
+    except ProcessLookupError:
+        exit_future.set_result(process.wait())
+        return exit_future
+
+    if pidfd is not None:
+        def on_exit():
+            _resolve_future(exit_future, process.wait())
+
+        def release_pidfd(_future: asyncio.Future):
+            loop.remove_reader(pidfd)
+            os.close(pidfd)
+
+        loop.add_reader(pidfd, on_exit)
+        exit_future.add_done_callback(release_pidfd)
+        return exit_future
+
+    def wait_in_thread():
+        returncode = process.wait()
+        try:
+            loop.call_soon_threadsafe(_resolve_future, exit_future, returncode)
+        except RuntimeError:
+            # The watching event loop is gone; the child has been reaped regardless
+            pass
+
+    # A daemon thread rather than the loop's executor, so a still-running Chrome never blocks loop shutdown
+    threading.Thread(target=wait_in_thread, name=f"brui-chrome-exit-{process.pid}", daemon=True).start()
+    return exit_future
+
 def kill_all_chrome_processes():
     """
     Enhanced function to kill Chrome processes by targeting the main parent first.
+
+    This kills every Chrome process on the host. To stop a single instance use
+    terminate_launched_browser() or kill_chrome_for_port() instead.
     """
     try:
         # Get all Chrome processes
@@ -166,52 +233,273 @@ def kill_all_chrome_processes():
         logger.error(f"Error during Chrome process termination: {e}")
         raise
 
-async def is_browser_opened_in_debug_mode():
+async def fetch_cdp_version(remote_debugging_port: Optional[int] = None, timeout: Optional[float] = None,
+                            remote_host: str = DEBUG_PORT_HOST) -> Optional[dict]:
+    """
+    Fetch the DevTools /json/version document without blocking the event loop.
+
+    Returns the parsed JSON document, or None if the port is closed, the browser does not
+    answer within `timeout` seconds, or the response is not a valid CDP version document.
+    """
+    if remote_debugging_port is None or timeout is None:
+        config = load_browser_config()
+        if remote_debugging_port is None:
+            remote_debugging_port = config.remote_debugging_port
+        if timeout is None:
+            timeout = config.probe_timeout
+
+    async def request_version() -> Optional[dict]:
+        reader, writer = await asyncio.open_connection(remote_host, remote_debugging_port)
+        try:
+            writer.write(
+                f"GET /json/version HTTP/1.1\r\nHost: {remote_host}:{remote_debugging_port}\r\n"
+                f"Connection: close\r\n\r\n".encode()
+            )
+            await writer.drain()
+            head = await reader.readuntil(b"\r\n\r\n")
+            status_line, *header_lines = head.decode("latin-1").split("\r\n")
+            status = status_line.split()
+            if len(status) < 2 or status[1] != "200":
+                return None
+            headers = {}
+            for line in header_lines:
+                name, _, value = line.partition(":")
+                headers[name.strip().lower()] = value.strip()
+            if "content-length" in headers:
+                # Read exactly the body: the server may keep the connection open despite Connection: close
+                length = int(headers["content-length"])
+                if length > CDP_VERSION_MAX_BYTES:
+                    return None
+                body = await reader.readexactly(length)
+            else:
+                # No length given: the body ends when the server closes; cap it so a bogus peer can't flood us
+                body = b""
+                while len(body) <= CDP_VERSION_MAX_BYTES:
+                    chunk = await reader.read(CDP_VERSION_MAX_BYTES)
+                    if not chunk:
+                        break
+                    body += chunk
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+
+        version = json.loads(body)
+        if not isinstance(version, dict) or "webSocketDebuggerUrl" not in version:
+            return None
+        return version
+
+    try:
+        return await asyncio.wait_for(request_version(), timeout)
+    except (asyncio.TimeoutError, OSError, ValueError, asyncio.IncompleteReadError,
+            asyncio.LimitOverrunError) as error:
+        logger.debug(f"CDP version check on port {remote_debugging_port} failed: {error!r}")
+        return None
+
+async def is_browser_opened_in_debug_mode(remote_debugging_port: Optional[int] = None,
+                                          timeout: Optional[float] = None,
+                                          check_cdp: bool = False,
+                                          remote_host: str = DEBUG_PORT_HOST):
     """
     Check if the browser is opened in debug mode by attempting to connect to the debug port.
+
+    The probe uses asyncio streams, so it never blocks the event loop.
+
+    Args:
+        remote_debugging_port (Optional[int]): Port to probe. Defaults to the configured port.
+        timeout (Optional[float]): Seconds to wait for the connection (and CDP response) before
+            reporting down. Defaults to the configured probe timeout.
+        check_cdp (bool): Also require a valid /json/version response, so a port held open
+            by a hung browser is reported as down.
+        remote_host (str): Host the debug port listens on.
     """
+    if remote_debugging_port is None or timeout is None:
+        config = load_browser_config()
+        if remote_debugging_port is None:
+            remote_debugging_port = config.remote_debugging_port
+        if timeout is None:
+            timeout = config.probe_timeout
+
+    if check_cdp:
+        return await fetch_cdp_version(remote_debugging_port, timeout=timeout, remote_host=remote_host) is not None
+
     try:
-        config = get_browser_config()
-        remote_host = "localhost"
-        remote_debugging_port = config["browser"].get("remote_debugging_port", 9222)
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-            sock.settimeout(1)
-            result = sock.connect_ex((remote_host, remote_debugging_port))
-            return result == 0
-    except (ConnectionRefusedError, OSError) as error:
-        logger.error(f"Debug mode check error: {error}")
+        _, writer = await asyncio.wait_for(asyncio.open_connection(remote_host, remote_debugging_port), timeout)
+    except (asyncio.TimeoutError, OSError) as error:
+        logger.debug(f"Debug port {remote_debugging_port} is not accepting connections: {error!r}")
         return False
 
-async def wait_for_browser_start(timeout=20, retry_interval=1):
+    writer.close()
+    try:
+        await writer.wait_closed()
+    except OSError:
+        pass
+    return True
+
+async def wait_for_browser_start(timeout: Optional[float] = None, retry_interval=0.1, remote_debugging_port: Optional[int] = None,
+                                 initial_interval=0.01):
     """
     Wait for the browser to start and listen on the debug port.
+
+    The port is polled with exponential backoff starting at `initial_interval` and capped
+    at `retry_interval`, so a browser that becomes ready is noticed within ~100ms.
     
     Args:
-        timeout (int): Maximum time to wait in seconds
-        retry_interval (int): Time between retry attempts in seconds
+        timeout (Optional[float]): Maximum time to wait in seconds. Defaults to the configured startup timeout.
+        retry_interval (float): Maximum time between retry attempts in seconds
+        remote_debugging_port (Optional[int]): Port to wait for. Defaults to the configured port.
+        initial_interval (float): Delay before the first retry in seconds
     
     Raises:
         TimeoutError: If browser doesn't start within timeout period
     """
-    start_time = asyncio.get_event_loop().time()
-    while not await is_browser_opened_in_debug_mode():
-        if asyncio.get_event_loop().time() - start_time > timeout:
-            config = get_browser_config()
-            remote_debugging_port = config["browser"].get("remote_debugging_port", 9222)
+    if remote_debugging_port is None or timeout is None:
+        config = load_browser_config()
+        if remote_debugging_port is None:
+            remote_debugging_port = config.remote_debugging_port
+        if timeout is None:
+            timeout = config.startup_timeout
+
+    loop = asyncio.get_running_loop()
+    start_time = loop.time()
+    interval = min(initial_interval, retry_interval)
+    while not await is_browser_opened_in_debug_mode(remote_debugging_port):
+        if loop.time() - start_time > timeout:
             raise TimeoutError(f"Timed out waiting for port {remote_debugging_port} to listen")
-        await asyncio.sleep(retry_interval)
+        await asyncio.sleep(interval)
+        interval = min(interval * 2, retry_interval)
+
+def _resolve_future(future: asyncio.Future, value: Optional[str]):
+    if not future.done():
+        future.set_result(value)
+
+def watch_devtools_endpoint(stream: BinaryIO, sink: Optional[BinaryIO], on_endpoint: Callable[[Optional[str]], None]):
+    """
+    Drain Chrome's stderr, copying it to `sink`, and report the DevTools websocket URL.
+
+    `on_endpoint` is called exactly once: with the ws:// URL from the
+    "DevTools listening on ..." line, or with None if the stream closes without one
+    (for example when Chrome hands the launch off to an already-running instance).
+    Draining continues until EOF so Chrome never blocks on a full pipe.
+    """
+    reported = False
+    try:
+        for line in iter(stream.readline, b""):
+            if not isinstance(line, bytes):
+                break
+            if sink is not None:
+                sink.write(line)
+                sink.flush()
+            if not reported and line.startswith(DEVTOOLS_LISTENING_PREFIX):
+                reported = True
+                on_endpoint(line[len(DEVTOOLS_LISTENING_PREFIX):].strip().decode())
+    except (OSError, ValueError) as e:
+        logger.debug(f"Stopped reading Chrome stderr: {e}")
+    finally:
+        if not reported:
+            on_endpoint(None)
+        if sink is not None:
+            sink.close()
+
+def _start_devtools_watcher(process: subprocess.Popen, sink: Optional[BinaryIO]) -> asyncio.Future:
+    """Start a daemon thread running watch_devtools_endpoint() and return a future for the ws URL."""
+    loop = asyncio.get_running_loop()
+    endpoint_future = loop.create_future()
+
+    def on_endpoint(ws_endpoint: Optional[str]):
+        try:
+            loop.call_soon_threadsafe(_resolve_future, endpoint_future, ws_endpoint)
+        except RuntimeError:
+            # The launching event loop has already been closed; nobody is waiting anymore
+            pass
 
-async def launch_browser():
+    threading.Thread(
+        target=watch_devtools_endpoint,
+        args=(process.stderr, sink, on_endpoint),
+        name=f"brui-chrome-stderr-{process.pid}",
+        daemon=True,
+    ).start()
+    return endpoint_future
+
+async def wait_for_devtools_endpoint(endpoint_future: asyncio.Future, remote_debugging_port: int,
+                                    timeout: Optional[float] = None) -> Optional[str]:
+    """
+    Wait until Chrome reports its DevTools endpoint on stderr, falling back to port polling.
+
+    Returns the websocket URL Chrome printed or, when the port opened first, the one its
+    /json/version document reports. None if neither source yields it.
+
+    Raises:
+        TimeoutError: If neither signal arrives within `timeout` seconds
+    """
+    poll_task = asyncio.ensure_future(
+        wait_for_browser_start(timeout=timeout, remote_debugging_port=remote_debugging_port)
+    )
+    try:
+        done, _ = await asyncio.wait({endpoint_future, poll_task}, return_when=asyncio.FIRST_COMPLETED)
+        if endpoint_future in done and endpoint_future.result():
+            return endpoint_future.result()
+        # stderr closed without an endpoint line, or the port opened first: the poll decides
+        await poll_task
+        if endpoint_future.done() and endpoint_future.result():
+            return endpoint_future.result()
+        version = await fetch_cdp_version(remote_debugging_port)
+        return version.get("webSocketDebuggerUrl") if version else None
+    finally:
+        poll_task.cancel()
+
+async def launch_browser(
+    remote_debugging_port: Optional[int] = None,
+    user_data_dir: Optional[str] = None,
+    chrome_profile_directory: Optional[str] = None,
+    log_path: Optional[str] = None,
+    profile_template_dir: Optional[str] = None,
+    preset: Optional[str] = None,
+    extra_args: Optional[List[str]] = None,
+) -> LaunchedBrowser:
     """
     Launches a new instance of Chrome in debug mode.
     Before launching, it assumes that any necessary cleanup (like killing existing Chrome processes)
     has already been performed if needed.
+
+    Any argument left as None falls back to the browser configuration, so several
+    instances can be launched side by side by giving each its own port and user data dir.
+
+    `preset` names a launch preset from brui_core.browser.launch_presets ("default",
+    "headless", "lean", "lean-headless", or a registered one) and `extra_args` are appended
+    after it; both default to the launch_preset/launch_extra_args configuration.
+
+    When a profile template is given (or configured) and no explicit user_data_dir is passed,
+    the template is cloned into a fresh user data dir for this instance. The clone is removed
+    by terminate_launched_browser() or remove_profile_clone() once Chrome has exited.
+
+    Readiness is detected from the "DevTools listening on ws://..." line Chrome prints on
+    stderr; stderr is still copied to the log file. Port polling is used only as a fallback.
+
+    Returns:
+        LaunchedBrowser: The Chrome process handle together with its port, user data dir
+        and DevTools websocket URL (None if Chrome did not report one).
     """
     # Fetch current configuration values when needed
-    config = get_browser_config()
-    chrome_profile_directory = config["browser"].get("chrome_profile_directory", "Default")
-    remote_debugging_port = config["browser"].get("remote_debugging_port", 9222)
-    user_data_dir = config["browser"].get("user_data_dir")
+    config = load_browser_config()
+    if chrome_profile_directory is None:
+        chrome_profile_directory = config.chrome_profile_directory
+    if remote_debugging_port is None:
+        remote_debugging_port = config.remote_debugging_port
+    profile_clone = None
+    if user_data_dir is None:
+        if profile_template_dir is None:
+            profile_template_dir = config.profile_template_dir
+        if profile_template_dir:
+            loop = asyncio.get_running_loop()
+            profile_clone = await loop.run_in_executor(
+                None, clone_profile, profile_template_dir, config.profile_clone_root
+            )
+            user_data_dir = profile_clone.path
+        else:
+            user_data_dir = config.user_data_dir
 
     if not user_data_dir:
         # Default to None to use the system default user data directory (preserving user profiles)
@@ -231,8 +519,16 @@ async def launch_browser():
     if user_data_dir:
         args.append(f"--user-data-dir={user_data_dir}")
 
-    popen_kwargs = {}
-    log_path = os.environ.get("CHROME_LOG_PATH", "/tmp/brui-chrome.log")
+    if preset is None:
+        preset = config.launch_preset
+    if extra_args is None:
+        extra_args = config.launch_extra_args
+    args.extend(get_launch_preset_args(preset, extra_args))
+
+    # A new session makes Chrome a process group leader, so shutdown can target exactly its tree
+    popen_kwargs = {"stderr": subprocess.PIPE, "start_new_session": True}
+    if log_path is None:
+        log_path = get_chrome_log_path()
     log_file = None
     if log_path:
         log_dir = os.path.dirname(log_path)
@@ -240,43 +536,124 @@ async def launch_browser():
             os.makedirs(log_dir, exist_ok=True)
         log_file = open(log_path, "wb")
         popen_kwargs["stdout"] = log_file
-        popen_kwargs["stderr"] = log_file
 
-    subprocess.Popen([executable_path] + args, **popen_kwargs)
+    try:
+        process = subprocess.Popen([executable_path] + args, **popen_kwargs)
+    except Exception:
+        if log_file:
+            log_file.close()
+        if profile_clone:
+            profile_clone.remove()
+        raise
 
-    if log_file:
-        log_file.close()
-    await wait_for_browser_start()
+    # The watcher thread owns the log file from here on and closes it when stderr reaches EOF
+    endpoint_future = _start_devtools_watcher(process, log_file)
+    launched = LaunchedBrowser(
+        process=process,
+        remote_debugging_port=remote_debugging_port,
+        user_data_dir=user_data_dir,
+        process_group=process.pid,
+        profile_clone=profile_clone,
+    )
+    try:
+        ws_endpoint = await wait_for_devtools_endpoint(endpoint_future, remote_debugging_port)
+    except BaseException:
+        # Nobody will own or reap this instance, so don't leave it (or its clone) behind
+        await terminate_launched_browser(launched)
+        raise
+    logger.info(f"Chrome ready on port {remote_debugging_port} (ws endpoint: {ws_endpoint})")
+    return launched._replace(ws_endpoint=ws_endpoint)
 
-def get_browser_config():
+def _signal_process_group(process_group: int, sig: int) -> bool:
+    """Send `sig` to a process group. Returns False if the group no longer has any members."""
+    try:
+        os.killpg(process_group, sig)
+        return True
+    except ProcessLookupError:
+        return False
+
+async def terminate_launched_browser(launched: LaunchedBrowser, timeout: float = 5):
     """
-    Get browser configuration with environment variable overrides.
+    Terminate a Chrome instance started by launch_browser() without touching other Chrome processes.
+
+    SIGTERM goes to Chrome's own process group, the main process' exit is awaited
+    asynchronously for up to `timeout` seconds, and SIGKILL then clears whatever is left
+    of the group. Processes outside the group are never signalled.
     """
-    # Use deepcopy to prevent side-effects from modifying the config dict
-    browser_config = copy.deepcopy(CONFIG)
-    
-    # Override chrome_profile_directory if CHROME_PROFILE_DIRECTORY environment variable is set
-    if "CHROME_PROFILE_DIRECTORY" in os.environ:
-        browser_config["browser"]["chrome_profile_directory"] = os.environ["CHROME_PROFILE_DIRECTORY"]
-        logger.debug(f"Overriding chrome_profile_directory from environment: {browser_config['browser']['chrome_profile_directory']}")
-    
-    # Override remote_debugging_port if CHROME_REMOTE_DEBUGGING_PORT environment variable is set
-    if "CHROME_REMOTE_DEBUGGING_PORT" in os.environ:
+    process = launched.process
+    process_group = launched.process_group
+
+    if process.poll() is None:
+        if process_group is None or not _signal_process_group(process_group, signal.SIGTERM):
+            try:
+                process.terminate()
+            except ProcessLookupError:
+                pass
         try:
-            port = int(os.environ["CHROME_REMOTE_DEBUGGING_PORT"])
-            browser_config["browser"]["remote_debugging_port"] = port
-            logger.debug(f"Overriding remote_debugging_port from environment: {port}")
-        except ValueError:
-            logger.error(f"Invalid port number in CHROME_REMOTE_DEBUGGING_PORT: {os.environ['CHROME_REMOTE_DEBUGGING_PORT']}")
-    
-    # Override user_data_dir if CHROME_USER_DATA_DIR environment variable is set
-    if "CHROME_USER_DATA_DIR" in os.environ:
-        browser_config["browser"]["user_data_dir"] = os.environ["CHROME_USER_DATA_DIR"]
-        logger.debug(f"Overriding user_data_dir from environment: {browser_config['browser']['user_data_dir']}")
+            await asyncio.wait_for(watch_process_exit(process), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Chrome process {process.pid} did not exit after SIGTERM, sending SIGKILL")
+
+    # Kill the leader if it ignored SIGTERM, along with any helpers that outlived it
+    if process_group is not None:
+        _signal_process_group(process_group, signal.SIGKILL)
+    if process.poll() is None:
+        process.kill()
+    await watch_process_exit(process)
+    await remove_profile_clone(launched)
+
+async def remove_profile_clone(launched: LaunchedBrowser):
+    """Delete the cloned user data dir of an exited Chrome instance, if it used one."""
+    if launched.profile_clone is None:
+        return
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(None, launched.profile_clone.remove)
+
+def kill_chrome_for_port(remote_debugging_port: int, timeout: float = 5) -> bool:
+    """
+    Kill the Chrome instance serving `remote_debugging_port`, leaving every other Chrome alone.
 
-    # Override download_directory if CHROME_DOWNLOAD_DIRECTORY is set
-    if "CHROME_DOWNLOAD_DIRECTORY" in os.environ:
-        browser_config["browser"]["download_directory"] = os.environ["CHROME_DOWNLOAD_DIRECTORY"]
-        logger.debug(f"Overriding download_directory from environment: {browser_config['browser']['download_directory']}")
+    Used for browsers this process did not launch itself. The instance is identified by its
+    --remote-debugging-port flag; its process group is signalled when Chrome leads its own
+    group, otherwise the main process and its descendants are.
 
-    return browser_config
+    Returns:
+        bool: True if a matching Chrome instance was found.
+    """
+    processes = get_chrome_pids()
+    port_flag = f"--remote-debugging-port={remote_debugging_port}"
+    owners = [p for p in processes.roots() if port_flag in p.cmd.split()]
+    if not owners:
+        logger.info(f"No Chrome process found for debugging port {remote_debugging_port}")
+        return False
+
+    for owner in owners:
+        descendants = processes.descendants(owner.pid)
+        try:
+            owns_group = os.getpgid(owner.pid) == owner.pid
+        except ProcessLookupError:
+            owns_group = False
+
+        logger.info(f"Terminating Chrome process {owner.pid} for port {remote_debugging_port}")
+        try:
+            if owns_group:
+                os.killpg(owner.pid, signal.SIGTERM)
+            else:
+                os.kill(owner.pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+
+        if not wait_for_process_termination(owner.pid, timeout):
+            logger.warning(f"Chrome process {owner.pid} did not exit after SIGTERM, sending SIGKILL")
+            try:
+                os.kill(owner.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+        if owns_group:
+            _signal_process_group(owner.pid, signal.SIGKILL)
+        for process in descendants:
+            try:
+                os.kill(process.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                continue
+    return True
@@ -1,60 +1,316 @@
 import asyncio
 import logging
-from typing import Optional
+import tempfile
+import threading
+from contextlib import asynccontextmanager
+from typing import Dict, Hashable, Optional, Tuple, Union
 
-from playwright.async_api import async_playwright
-from playwright.async_api import Browser, BrowserContext
+from playwright.async_api import Browser, BrowserContext, Playwright
 
 from brui_core.browser.browser_launcher import (
+    LaunchedBrowser,
     is_browser_opened_in_debug_mode,
     launch_browser,
-    get_browser_config,
-    kill_all_chrome_processes
+    kill_chrome_for_port
 )
+from brui_core.browser.browser_config import load_browser_config
+from brui_core.browser.browser_endpoint import BrowserEndpoint, parse_endpoint
+from brui_core.browser.browser_supervisor import BrowserSupervisor, SupervisorEvent
+from brui_core.browser.context_pool import ContextPool
+from brui_core.browser.hot_spare import HotSpare
+from brui_core.browser.page_pool import PagePool
+from brui_core.browser.page_scheduler import PageScheduler
+from brui_core.browser.playwright_driver import get_playwright
 from brui_core.singleton_meta import SingletonMeta
 
 logger = logging.getLogger(__name__)
 
+# One lock per debugging port, shared by the managers of every thread and event loop
+_port_launch_locks: Dict[int, threading.Lock] = {}
+_port_launch_locks_guard = threading.Lock()
+
+@asynccontextmanager
+async def port_launch_lock(remote_debugging_port: int, poll_interval: float = 0.01):
+    """
+    Hold the cross-thread launch lock of a debugging port, so managers on different event
+    loops never launch two Chromes for the same port. Waiting polls instead of blocking,
+    which keeps the event loop responsive and the wait cancellable.
+    """
+    with _port_launch_locks_guard:
+        lock = _port_launch_locks.setdefault(remote_debugging_port, threading.Lock())
+    while not lock.acquire(blocking=False):
+        await asyncio.sleep(poll_interval)
+    try:
+        yield
+    finally:
+        lock.release()
+
 class BrowserManager(metaclass=SingletonMeta):
-    def __init__(self):
+    """
+    Launches, supervises and connects to the Chrome behind one debugging port.
+
+    There is one manager per event loop: `BrowserManager()` returns the running loop's
+    instance (or a loop-less one when called outside a loop), and `BrowserManager(key=...)`
+    one per explicit key. Managers on different loops share the same Chrome process; each
+    keeps its own CDP connection, since Playwright objects are bound to one loop.
+
+    `BrowserManager(endpoint=...)` returns a manager for an existing browser at that
+    DevTools endpoint (see brui_core.browser.manager_registry). Such a manager only
+    connects: it never launches or kills Chrome, so the browser may live on another host.
+    """
+
+    @classmethod
+    def _scope_key(cls, key: Optional[Hashable]) -> Optional[Hashable]:
+        if key is not None:
+            return key
+        try:
+            return asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+
+    @classmethod
+    def singleton_key(cls, key: Optional[Hashable] = None,
+                      endpoint: Union[None, str, int, BrowserEndpoint] = None) -> Optional[Hashable]:
+        scope = cls._scope_key(key)
+        if endpoint is None:
+            return scope
+        return (scope, parse_endpoint(endpoint).key)
+
+    def singleton_expired(self) -> bool:
+        # A manager bound to a closed event loop can never be used again
+        return isinstance(self.key, asyncio.AbstractEventLoop) and self.key.is_closed()
+
+    def __init__(self, key: Optional[Hashable] = None, endpoint: Union[None, str, int, BrowserEndpoint] = None):
+        self.key = self._scope_key(key)
+        # Existing browser this manager connects to; None means the configured, self-launched one
+        self.endpoint: Optional[BrowserEndpoint] = parse_endpoint(endpoint) if endpoint is not None else None
         self.browser_launch_lock = asyncio.Lock()
-        self.playwright: Optional[async_playwright] = None
+        # The event loop's shared Playwright driver; it outlives reconnects and is never stopped here
+        self.playwright: Optional[Playwright] = None
         self.browser: Optional[Browser] = None
+        # DevTools websocket URL reported by the last browser we launched, if any
+        self.ws_endpoint: Optional[str] = None
+        # Chrome process started by this manager, if any
+        self.launched: Optional[LaunchedBrowser] = None
+        # Cached liveness of self.browser, maintained from the "disconnected" event and Chrome's exit
+        self.browser_connected = False
+        # Keeps the Chrome we launch reaped and restarts it on crash
+        self.supervisor = BrowserSupervisor(launch=self._launch_browser)
+        self.supervisor.add_listener(self._on_supervisor_event)
+        # Port and user data dir of the primary browser once a hot spare has been promoted (None: from config)
+        self.active_port: Optional[int] = None
+        self.active_user_data_dir: Optional[str] = None
+        # Warm standby browser, see enable_hot_spare()
+        self.hot_spare_enabled = False
+        self.hot_spare_slot: Optional[Tuple[int, str]] = None
+        self.hot_spare: Optional[HotSpare] = None
+        self.hot_spare_task: Optional[asyncio.Task] = None
+        # Isolated contexts on the current browser, see acquire_context()
+        self.context_pool: Optional[ContextPool] = None
+        # Leased pages per context, see get_page_pool()
+        self.page_pools: Dict[BrowserContext, PagePool] = {}
+        # Admission control for pages opened on this browser
+        config = load_browser_config()
+        self.page_scheduler = PageScheduler(config.max_concurrent_pages, max_queue=config.max_queued_pages)
+
+    @property
+    def remote_debugging_port(self) -> int:
+        """Debugging port of the primary browser."""
+        if self.endpoint is not None:
+            return self.endpoint.port
+        if self.active_port is not None:
+            return self.active_port
+        return load_browser_config().remote_debugging_port
+
+    @property
+    def user_data_dir(self) -> Optional[str]:
+        """User data dir of the primary browser."""
+        if self.active_port is not None:
+            return self.active_user_data_dir
+        return load_browser_config().user_data_dir
+
+    def _on_browser_disconnected(self, browser: Browser):
+        if browser is self.browser:
+            logger.warning("Browser connection lost; the next connect will probe and reconnect")
+            self.browser_connected = False
+
+    def _on_supervisor_event(self, event: SupervisorEvent, launched: Optional[LaunchedBrowser]):
+        if event is SupervisorEvent.STARTED:
+            self.launched = launched
+            self.ws_endpoint = launched.ws_endpoint
+        elif event in (SupervisorEvent.EXITED, SupervisorEvent.GAVE_UP, SupervisorEvent.STOPPED):
+            self.launched = None
+            self.ws_endpoint = None
+            self.browser_connected = False
+
+    async def _launch_browser(self) -> LaunchedBrowser:
+        return await launch_browser()
+
+    async def is_browser_running(self, check_cdp: bool = False) -> bool:
+        """
+        Check whether the browser's debug port is up.
 
-    async def is_browser_running(self) -> bool:
+        Args:
+            check_cdp (bool): Also require a /json/version response, so a hung browser counts as down
+        """
         try:
-            return await is_browser_opened_in_debug_mode()
+            if self.endpoint is not None:
+                return await is_browser_opened_in_debug_mode(
+                    self.endpoint.port, check_cdp=check_cdp, remote_host=self.endpoint.host
+                )
+            return await is_browser_opened_in_debug_mode(self.active_port, check_cdp=check_cdp)
         except Exception as e:
             logger.error(f"Error checking if browser is running: {str(e)}")
             return False
 
     async def reset_browser_state(self):
         """Reset the browser state and clean up existing connections"""
+        self.browser_connected = False
         try:
             if self.browser is not None:
                 await self.browser.close()
                 self.browser = None
-            if self.playwright is not None:
-                await self.playwright.stop()
-                self.playwright = None
         except Exception as e:
             logger.error(f"Error resetting browser state: {str(e)}")
             # Still reset the state even if cleanup fails
             self.browser = None
-            self.playwright = None
 
     async def ensure_browser_launched(self):
         """Ensure browser is launched, resetting state if necessary"""
+        # A live CDP connection implies a live browser; only probe once it has been lost
+        if self.browser is not None and self.browser_connected:
+            return
+        if self.endpoint is not None:
+            if not await self.is_browser_running():
+                raise ConnectionError(f"No browser is reachable at {self.endpoint}")
+            return
         if not await self.is_browser_running():
-            async with self.browser_launch_lock:
-                if not await self.is_browser_running():  # Double-check after acquiring lock
+            async with self.browser_launch_lock, port_launch_lock(self.remote_debugging_port):
+                # Double-check after acquiring the locks; another loop may have launched it meanwhile
+                if not await self.is_browser_running():
+                    if self._promote_hot_spare():
+                        return
                     # Reset state before launching new browser
                     await self.reset_browser_state()
                     try:
-                        await launch_browser()
+                        await self.supervisor.ensure_running()
                     except Exception as e:
                         logger.error(f"Failed to launch browser: {str(e)}")
                         raise
+        if self.hot_spare_enabled or load_browser_config().hot_spare:
+            self.enable_hot_spare()
+
+    def enable_hot_spare(self, remote_debugging_port: Optional[int] = None, user_data_dir: Optional[str] = None):
+        """
+        Keep a pre-launched, pre-connected standby Chrome next to the primary one.
+
+        When the primary browser is found dead, the standby is promoted in place (a reference
+        swap, no launch on the request path) and a new standby is launched in the background
+        on the slot the failed primary used. A standby that loses its connection is
+        stopped and replaced in the background.
+        Also enabled by CHROME_HOT_SPARE=1. Must be called from the running event loop.
+
+        Args:
+            remote_debugging_port: Standby port. Defaults to the primary port + 1.
+            user_data_dir: Standby profile dir. Defaults to "<primary dir>-spare", or a temp dir.
+        """
+        self.hot_spare_enabled = True
+        if self.hot_spare_slot is None or remote_debugging_port is not None or user_data_dir is not None:
+            if remote_debugging_port is None:
+                remote_debugging_port = self.remote_debugging_port + 1
+            if user_data_dir is None:
+                primary_dir = self.user_data_dir
+                # Chrome locks its profile dir, so the standby can never share the primary's
+                user_data_dir = f"{primary_dir}-spare" if primary_dir else tempfile.mkdtemp(prefix="brui-spare-")
+            self.hot_spare_slot = (remote_debugging_port, user_data_dir)
+        if self.hot_spare_task is not None and not self.hot_spare_task.done():
+            return
+        if self.hot_spare is not None and not self.hot_spare.is_ready():
+            # HotSpare never reconnects on its own, so a standby that lost its connection
+            # (or its Chrome) would otherwise stay useless for the life of the manager
+            logger.warning(f"Hot spare browser on port {self.hot_spare.remote_debugging_port} is down; replacing it")
+            stale, self.hot_spare = self.hot_spare, None
+            self._schedule_hot_spare(*self.hot_spare_slot, stale=stale)
+        elif self.hot_spare is None:
+            self._schedule_hot_spare(*self.hot_spare_slot)
+
+    def _schedule_hot_spare(self, remote_debugging_port: int, user_data_dir: str,
+                            retired: Optional[BrowserSupervisor] = None, retired_browser: Optional[Browser] = None,
+                            stale: Optional[HotSpare] = None):
+        if self.hot_spare_task is not None and not self.hot_spare_task.done():
+            return
+        self.hot_spare_task = asyncio.create_task(
+            self._start_hot_spare(remote_debugging_port, user_data_dir, retired, retired_browser, stale)
+        )
+
+    async def _start_hot_spare(self, remote_debugging_port: int, user_data_dir: str,
+                               retired: Optional[BrowserSupervisor], retired_browser: Optional[Browser],
+                               stale: Optional[HotSpare] = None):
+        try:
+            if stale is not None:
+                await stale.stop()
+            if retired_browser is not None:
+                try:
+                    await retired_browser.close()
+                except Exception as e:
+                    logger.debug(f"Error closing retired browser connection: {str(e)}")
+            if retired is not None:
+                # The failed primary must release its port and profile before the slot is reused
+                await retired.stop()
+            hot_spare = HotSpare(remote_debugging_port, user_data_dir)
+            try:
+                await hot_spare.start(await self._ensure_playwright())
+            except asyncio.CancelledError:
+                # Don't leave a half-started standby Chrome behind
+                await hot_spare.stop()
+                raise
+            self.hot_spare = hot_spare
+            hot_spare.browser.on("disconnected", lambda _browser: self._on_hot_spare_disconnected(hot_spare))
+        except Exception as e:
+            logger.error(f"Failed to start hot spare browser on port {remote_debugging_port}: {str(e)}")
+
+    def _on_hot_spare_disconnected(self, hot_spare: HotSpare):
+        # Only the current standby matters; a promoted or stopped one is not replaced
+        if self.hot_spare is hot_spare and self.hot_spare_enabled:
+            self.enable_hot_spare()
+
+    def _promote_hot_spare(self) -> bool:
+        """
+        Swap a ready hot spare in as the primary browser. Runs without awaiting, so no other
+        coroutine can observe a half-promoted state. Returns False if no spare is ready.
+        """
+        hot_spare = self.hot_spare
+        if hot_spare is None or not hot_spare.is_ready():
+            return False
+
+        retired = self.supervisor
+        retired_browser = self.browser
+        retired_slot = (self.remote_debugging_port, self.user_data_dir)
+        retired.remove_listener(self._on_supervisor_event)
+
+        self.hot_spare = None
+        self.supervisor = hot_spare.supervisor
+        self.supervisor.add_listener(self._on_supervisor_event)
+        self.launched = self.supervisor.launched
+        self.ws_endpoint = self.launched.ws_endpoint if self.launched else None
+        self.active_port = hot_spare.remote_debugging_port
+        self.active_user_data_dir = hot_spare.user_data_dir
+        self.browser = hot_spare.browser
+        self.browser.on("disconnected", self._on_browser_disconnected)
+        self.browser_connected = True
+        logger.warning(f"Promoted hot spare browser on port {self.active_port} to primary")
+
+        if retired_slot[1] is None:
+            # The retired primary ran on the default profile, which a debuggable Chrome can't use
+            retired_slot = (retired_slot[0], tempfile.mkdtemp(prefix="brui-spare-"))
+        self.hot_spare_slot = retired_slot
+        self._schedule_hot_spare(*retired_slot, retired=retired, retired_browser=retired_browser)
+        return True
+
+    async def _ensure_playwright(self) -> Playwright:
+        # Restarted by the shared driver only if the driver process itself has died
+        self.playwright = await get_playwright()
+        return self.playwright
 
     async def get_browser_context(self, browser: Browser) -> BrowserContext:
         """
@@ -99,6 +355,68 @@ class BrowserManager(metaclass=SingletonMeta):
             logger.error(f"Failed to access browser context: {str(e)}")
             raise
 
+    async def get_context_pool(self) -> ContextPool:
+        """
+        Return the pool of isolated contexts for the current browser, creating it (and starting
+        to warm it) on first use or after the browser connection was replaced.
+        """
+        browser = await self.connect_browser()
+        if self.context_pool is None or self.context_pool.browser is not browser:
+            stale_pool = self.context_pool
+            config = load_browser_config()
+            self.context_pool = ContextPool(browser, size=config.context_pool_size,
+                                            max_uses=config.context_max_uses)
+            self.context_pool.warm()
+            if stale_pool is not None:
+                await stale_pool.close()
+        return self.context_pool
+
+    async def acquire_context(self) -> BrowserContext:
+        """Take an isolated, pre-warmed BrowserContext. Return it with release_context()."""
+        pool = await self.get_context_pool()
+        return await pool.acquire()
+
+    async def release_context(self, context: BrowserContext, recycle: bool = False):
+        """Return a context from acquire_context(); `recycle` closes it instead of clearing it for reuse."""
+        pool = self.context_pool
+        if pool is None or context not in pool.in_use:
+            # Its browser connection has been replaced since; the context is gone with it
+            try:
+                await context.close()
+            except Exception as e:
+                logger.debug(f"Error closing orphaned browser context: {str(e)}")
+            return
+        await pool.release(context, recycle=recycle)
+
+    def get_page_pool(self, context: BrowserContext) -> PagePool:
+        """
+        Return the page pool of `context`, creating it on first use. The pool is dropped
+        when the context closes. The pool is shared by every user of the context, so
+        options such as clearing storage are passed per release.
+        """
+        pool = self.page_pools.get(context)
+        if pool is None or pool.closed:
+            config = load_browser_config()
+            pool = PagePool(context, size=config.page_pool_size, max_uses=config.page_max_uses,
+                            idle_timeout=config.page_idle_timeout)
+            if context not in self.page_pools:
+                context.on("close", self._on_context_closed)
+            self.page_pools[context] = pool
+            pool.warm()
+        return pool
+
+    def _on_context_closed(self, context: BrowserContext):
+        pool = self.page_pools.pop(context, None)
+        if pool is not None:
+            pool.closed = True
+
+    async def close_page_pools(self):
+        """Close every page pool and the pages in it."""
+        pools = list(self.page_pools.values())
+        self.page_pools.clear()
+        for pool in pools:
+            await pool.close()
+
     async def connect_browser(self, reconnect=False) -> Browser:
         """
         Connect to the browser, launching it if necessary
@@ -109,26 +427,27 @@ class BrowserManager(metaclass=SingletonMeta):
         Returns:
             Connected browser instance
         """
+        # Hot path: liveness is tracked from events, so a healthy connection costs no probe at all
+        if not reconnect and self.browser is not None and self.browser_connected:
+            return self.browser
+
         await self.ensure_browser_launched()
         
         try:
-            # If we have a browser already and not forcing reconnection, return it
-            if self.browser is not None and not reconnect:
+            # If we have a healthy browser already and not forcing reconnection, return it
+            if self.browser is not None and self.browser_connected and not reconnect:
                 return self.browser
                 
-            # Reset browser reference if reconnecting
-            if reconnect and self.browser is not None:
+            # Drop the browser reference if reconnecting or if the connection was lost
+            if self.browser is not None:
                 self.browser = None
                 
-            # If Playwright is None, initialize it
-            if self.playwright is None:
-                self.playwright = await async_playwright().start()
+            await self._ensure_playwright()
                 
-            # Fetch configuration for remote debugging port at runtime
-            config = get_browser_config()
-            remote_debugging_port = config["browser"].get("remote_debugging_port", 9222)
-            endpoint_url = f"http://localhost:{remote_debugging_port}"
-            self.browser = await self.playwright.chromium.connect_over_cdp(endpoint_url)
+            browser = await self._connect_over_cdp()
+            browser.on("disconnected", self._on_browser_disconnected)
+            self.browser = browser
+            self.browser_connected = True
             return self.browser
             
         except Exception as e:
@@ -137,14 +456,60 @@ class BrowserManager(metaclass=SingletonMeta):
             await self.reset_browser_state()
             raise
 
+    async def _connect_over_cdp(self) -> Browser:
+        """
+        Connect Playwright over CDP, going straight to the websocket endpoint reported at launch
+        when we have one so the HTTP /json/version discovery round-trip is skipped.
+        """
+        if self.endpoint is not None:
+            return await self.playwright.chromium.connect_over_cdp(self.endpoint.connect_url)
+        if self.ws_endpoint:
+            try:
+                return await self.playwright.chromium.connect_over_cdp(self.ws_endpoint)
+            except Exception as e:
+                logger.warning(f"Stale DevTools endpoint {self.ws_endpoint}, falling back to discovery: {str(e)}")
+                self.ws_endpoint = None
+
+        endpoint_url = f"http://localhost:{self.remote_debugging_port}"
+        return await self.playwright.chromium.connect_over_cdp(endpoint_url)
+
     async def stop_browser(self):
-        """Stop the browser and clean up resources"""
+        """
+        Stop the browser and clean up resources.
+
+        Only the Chrome instance this manager talks to is terminated: the process group of
+        the Chrome it launched, or the instance serving its debugging port otherwise.
+        Endpoint managers only disconnect.
+        """
+        if self.hot_spare_task is not None:
+            self.hot_spare_task.cancel()
+            await asyncio.gather(self.hot_spare_task, return_exceptions=True)
+            self.hot_spare_task = None
+        # Forgotten before it is stopped, so its disconnect is not taken for a lost standby
+        hot_spare, self.hot_spare = self.hot_spare, None
+        if hot_spare is not None:
+            await hot_spare.stop()
+        await self.close_page_pools()
+        if self.context_pool is not None:
+            await self.context_pool.close()
+            self.context_pool = None
         await self.reset_browser_state()
+        # The shared driver stays up for other connections; see playwright_driver.stop_playwright()
+        self.playwright = None
+        if self.endpoint is not None:
+            # Not ours to kill; the connection has been closed above
+            logger.info(f"Disconnected from browser at {self.endpoint}")
+            return
+        launched_here = self.launched is not None
         try:
-            # Run the synchronous kill function in a separate thread to avoid blocking the event loop
-            loop = asyncio.get_running_loop()
-            await loop.run_in_executor(None, kill_all_chrome_processes)
-            logger.info("Successfully terminated all Chrome processes via BrowserManager.")
+            # Stop supervising first so the shutdown is not treated as a crash and restarted
+            await self.supervisor.stop()
+            if not launched_here:
+                remote_debugging_port = self.remote_debugging_port
+                # Run the synchronous kill function in a separate thread to avoid blocking the event loop
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(None, kill_chrome_for_port, remote_debugging_port)
+            logger.info("Successfully terminated Chrome via BrowserManager.")
         except Exception as e:
-            logger.error(f"Error terminating Chrome processes during stop_browser: {e}")
+            logger.error(f"Error terminating Chrome during stop_browser: {e}")
             raise
@@ -0,0 +1,195 @@
+import asyncio
+import logging
+import os
+import tempfile
+from contextlib import asynccontextmanager
+from typing import List, Optional
+
+from playwright.async_api import Browser
+
+from brui_core.browser.browser_launcher import (
+    LaunchedBrowser,
+    get_chrome_log_path,
+    is_browser_opened_in_debug_mode,
+    launch_browser,
+    terminate_launched_browser,
+)
+from brui_core.browser.browser_config import load_browser_config
+from brui_core.browser.playwright_driver import get_playwright
+
+logger = logging.getLogger(__name__)
+
+
+class PooledBrowser:
+    """A single Chrome instance owned by a BrowserPool."""
+
+    def __init__(self, index: int, remote_debugging_port: int, user_data_dir: str):
+        self.index = index
+        self.remote_debugging_port = remote_debugging_port
+        self.user_data_dir = user_data_dir
+        self.launched: Optional[LaunchedBrowser] = None
+        self.browser: Optional[Browser] = None
+        self.leases = 0
+
+    def is_connected(self) -> bool:
+        return self.browser is not None and self.browser.is_connected()
+
+    def __repr__(self) -> str:
+        return (f"PooledBrowser(index={self.index}, port={self.remote_debugging_port}, "
+                f"leases={self.leases}, connected={self.is_connected()})")
+
+
+class BrowserLease:
+    """
+    One lease of a pooled browser, returned by BrowserPool.lease(). It identifies the
+    instance rather than its Browser object, which is replaced when the instance reconnects.
+    """
+
+    def __init__(self, instance: PooledBrowser, browser: Browser):
+        self.instance = instance
+        # The connection at lease time
+        self.browser = browser
+        self.released = False
+
+    def __repr__(self) -> str:
+        return f"BrowserLease(instance={self.instance.index}, released={self.released})"
+
+
+class BrowserPool:
+    """
+    Launches several Chrome instances, each on its own debugging port and user data dir,
+    and hands out their Playwright connections through lease()/release().
+
+    lease() always picks the instance with the fewest active leases, so load spreads
+    evenly across browsers instead of piling onto a single renderer process.
+    """
+
+    def __init__(self, size: Optional[int] = None, base_port: Optional[int] = None, user_data_root: Optional[str] = None,
+                 profile_template_dir: Optional[str] = None):
+        """
+        Args:
+            size: Number of Chrome instances. Defaults to the configured pool size.
+            base_port: Debugging port of the first instance; the others use consecutive ports.
+                Defaults to the configured pool base port, else the configured debugging port.
+            user_data_root: Directory holding one user data dir per instance.
+            profile_template_dir: If set, every launch gets a fresh clone of this profile
+                template instead of a persistent per-instance user data dir.
+        """
+        config = load_browser_config()
+        if size is None:
+            size = config.pool_size
+        if size < 1:
+            raise ValueError("BrowserPool size must be at least 1")
+
+        if base_port is None:
+            base_port = config.pool_base_port or config.remote_debugging_port
+        if user_data_root is None:
+            user_data_root = config.user_data_dir
+        if user_data_root is None:
+            # Chrome refuses remote debugging on the default profile, so every instance needs its own dir
+            user_data_root = tempfile.mkdtemp(prefix="brui-pool-")
+
+        self.size = size
+        self.profile_template_dir = profile_template_dir
+        self.instances: List[PooledBrowser] = [
+            PooledBrowser(
+                index=i,
+                remote_debugging_port=base_port + i,
+                user_data_dir=os.path.join(user_data_root, f"instance-{i}"),
+            )
+            for i in range(size)
+        ]
+        self.playwright = None
+        self.pool_lock = asyncio.Lock()
+        self.started = False
+
+    async def start(self):
+        """Launch and connect every instance in the pool concurrently."""
+        async with self.pool_lock:
+            if self.started:
+                return
+            await asyncio.gather(*(self._ensure_instance(instance) for instance in self.instances))
+            self.started = True
+            logger.info(f"BrowserPool started with {self.size} instances")
+
+    async def _ensure_instance(self, instance: PooledBrowser):
+        """Launch the instance if its port is closed and (re)connect over CDP if needed."""
+        if instance.is_connected():
+            return
+        if not await is_browser_opened_in_debug_mode(instance.remote_debugging_port):
+            logger.info(f"Launching pooled Chrome instance on port {instance.remote_debugging_port}")
+            instance.launched = await launch_browser(
+                remote_debugging_port=instance.remote_debugging_port,
+                user_data_dir=None if self.profile_template_dir else instance.user_data_dir,
+                log_path=get_chrome_log_path(instance.remote_debugging_port),
+                profile_template_dir=self.profile_template_dir,
+            )
+        endpoint_url = f"http://localhost:{instance.remote_debugging_port}"
+        if instance.launched is not None and instance.launched.ws_endpoint:
+            endpoint_url = instance.launched.ws_endpoint
+        # All instances share the event loop's Playwright driver
+        self.playwright = await get_playwright()
+        instance.browser = await self.playwright.chromium.connect_over_cdp(endpoint_url)
+
+    def _select_instance(self) -> PooledBrowser:
+        return min(self.instances, key=lambda instance: (not instance.is_connected(), instance.leases))
+
+    async def lease(self) -> BrowserLease:
+        """
+        Lease the least-loaded browser in the pool, starting the pool on first use.
+        Every lease must be paired with a release() of the returned lease.
+        """
+        if not self.started:
+            await self.start()
+
+        instance = self._select_instance()
+        # Count the lease before awaiting so concurrent callers see the updated load
+        instance.leases += 1
+        try:
+            if not instance.is_connected():
+                async with self.pool_lock:
+                    await self._ensure_instance(instance)
+        except Exception as e:
+            instance.leases -= 1
+            logger.error(f"Failed to lease browser from instance {instance}: {str(e)}")
+            raise
+        return BrowserLease(instance, instance.browser)
+
+    async def release(self, lease: BrowserLease):
+        """Return a lease obtained from lease() to the pool. Releasing it again does nothing."""
+        if lease.instance not in self.instances:
+            logger.warning("Released a lease that does not belong to this pool")
+            return
+        if lease.released:
+            return
+        lease.released = True
+        if lease.instance.leases > 0:
+            lease.instance.leases -= 1
+
+    @asynccontextmanager
+    async def leased(self):
+        """Async context manager wrapping lease()/release(), yielding the leased Browser."""
+        lease = await self.lease()
+        try:
+            yield lease.browser
+        finally:
+            await self.release(lease)
+
+    async def stop(self):
+        """Disconnect from and terminate every Chrome instance this pool launched."""
+        async with self.pool_lock:
+            for instance in self.instances:
+                try:
+                    if instance.browser is not None:
+                        await instance.browser.close()
+                except Exception as e:
+                    logger.error(f"Error closing pooled browser {instance}: {str(e)}")
+                instance.browser = None
+                instance.leases = 0
+                if instance.launched is not None:
+                    await terminate_launched_browser(instance.launched)
+                    instance.launched = None
+            # The shared driver stays up for other connections
+            self.playwright = None
+            self.started = False
+            logger.info("BrowserPool stopped")
@@ -0,0 +1,185 @@
+import asyncio
+import logging
+from enum import Enum
+from typing import Awaitable, Callable, List, Optional
+
+from brui_core.browser.browser_launcher import (
+    LaunchedBrowser,
+    launch_browser,
+    remove_profile_clone,
+    terminate_launched_browser,
+    watch_process_exit,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class SupervisorEvent(Enum):
+    STARTED = "started"
+    EXITED = "exited"
+    RESTARTING = "restarting"
+    GAVE_UP = "gave_up"
+    STOPPED = "stopped"
+
+
+SupervisorListener = Callable[[SupervisorEvent, Optional[LaunchedBrowser]], None]
+
+
+class BrowserSupervisor:
+    """
+    Owns a Chrome process launched through launch_browser() and keeps it alive.
+
+    The process handle is kept, so Chrome is always reaped, and its exit is awaited through
+    a pidfd on the event loop rather than discovered by the next failing probe. A crash
+    (non-zero exit) triggers a restart with exponential backoff, bounded by `max_restarts`
+    consecutive crashes; a clean exit (code 0) is reported but not restarted.
+
+    Listeners registered with add_listener() receive (SupervisorEvent, LaunchedBrowser) for
+    every lifecycle transition.
+    """
+
+    def __init__(
+        self,
+        launch: Callable[[], Awaitable[LaunchedBrowser]] = launch_browser,
+        max_restarts: int = 5,
+        backoff_initial: float = 0.1,
+        backoff_max: float = 10.0,
+        stable_uptime: float = 30.0,
+    ):
+        self.launch = launch
+        self.max_restarts = max_restarts
+        self.backoff_initial = backoff_initial
+        self.backoff_max = backoff_max
+        # A process that stayed up this long resets the consecutive-crash count
+        self.stable_uptime = stable_uptime
+        self.launched: Optional[LaunchedBrowser] = None
+        self.listeners: List[SupervisorListener] = []
+        self.supervise_task: Optional[asyncio.Task] = None
+        self.running = asyncio.Event()
+        self.restart_requested = asyncio.Event()
+        self.stopping = False
+
+    def add_listener(self, listener: SupervisorListener):
+        self.listeners.append(listener)
+
+    def remove_listener(self, listener: SupervisorListener):
+        if listener in self.listeners:
+            self.listeners.remove(listener)
+
+    def _emit(self, event: SupervisorEvent, launched: Optional[LaunchedBrowser]):
+        logger.info(f"Browser supervisor event: {event.value} "
+                    f"(pid={launched.process.pid if launched else None})")
+        for listener in list(self.listeners):
+            try:
+                listener(event, launched)
+            except Exception as e:
+                logger.error(f"Browser supervisor listener failed on {event.value}: {str(e)}")
+
+    def is_supervising(self) -> bool:
+        return self.supervise_task is not None and not self.supervise_task.done()
+
+    async def start(self) -> LaunchedBrowser:
+        """Launch Chrome and start supervising it."""
+        if self.is_supervising():
+            return await self.ensure_running()
+
+        self.stopping = False
+        launched = await self.launch()
+        self._on_started(launched)
+        self.supervise_task = asyncio.create_task(self._supervise(launched))
+        return launched
+
+    async def ensure_running(self) -> LaunchedBrowser:
+        """
+        Return the running Chrome, starting it if needed. If a crash restart is pending,
+        the backoff is cut short because a caller is now waiting for the browser.
+        """
+        if not self.is_supervising():
+            return await self.start()
+        if not self.running.is_set():
+            self.restart_requested.set()
+            running_waiter = asyncio.ensure_future(self.running.wait())
+            try:
+                await asyncio.wait({running_waiter, self.supervise_task}, return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                running_waiter.cancel()
+            if not self.running.is_set():
+                raise RuntimeError("Browser supervisor gave up restarting Chrome")
+        return self.launched
+
+    def _on_started(self, launched: LaunchedBrowser):
+        self.launched = launched
+        self.running.set()
+        self._emit(SupervisorEvent.STARTED, launched)
+
+    async def _supervise(self, launched: LaunchedBrowser):
+        loop = asyncio.get_running_loop()
+        consecutive_crashes = 0
+        started_at = loop.time()
+
+        while True:
+            returncode = await watch_process_exit(launched.process)
+            self.running.clear()
+            if self.stopping:
+                return
+
+            self._emit(SupervisorEvent.EXITED, launched)
+            # A restart gets a fresh clone, so the exited instance's one can go now
+            await remove_profile_clone(launched)
+            if returncode == 0:
+                logger.info(f"Chrome process {launched.process.pid} exited cleanly; not restarting")
+                self.launched = None
+                return
+
+            if loop.time() - started_at >= self.stable_uptime:
+                consecutive_crashes = 0
+            consecutive_crashes += 1
+            logger.warning(f"Chrome process {launched.process.pid} crashed with code {returncode} "
+                           f"({consecutive_crashes} consecutive)")
+
+            # Keep retrying the launch itself until it succeeds or the crash budget runs out
+            while True:
+                if consecutive_crashes > self.max_restarts:
+                    logger.error(f"Chrome crashed {consecutive_crashes} times in a row; giving up")
+                    self.launched = None
+                    self._emit(SupervisorEvent.GAVE_UP, launched)
+                    return
+
+                backoff = min(self.backoff_initial * 2 ** (consecutive_crashes - 1), self.backoff_max)
+                self._emit(SupervisorEvent.RESTARTING, launched)
+                self.restart_requested.clear()
+                try:
+                    await asyncio.wait_for(self.restart_requested.wait(), backoff)
+                except asyncio.TimeoutError:
+                    pass
+                if self.stopping:
+                    return
+
+                try:
+                    launched = await self.launch()
+                    break
+                except Exception as e:
+                    consecutive_crashes += 1
+                    logger.error(f"Failed to restart Chrome: {str(e)}")
+
+            started_at = loop.time()
+            self._on_started(launched)
+
+    async def stop(self, timeout: float = 5):
+        """Stop supervising and terminate the supervised Chrome process."""
+        self.stopping = True
+        self.restart_requested.set()
+        if self.supervise_task is not None:
+            self.supervise_task.cancel()
+            try:
+                await self.supervise_task
+            except asyncio.CancelledError:
+                pass
+            self.supervise_task = None
+
+        launched = self.launched
+        self.launched = None
+        self.running.clear()
+        if launched is not None:
+            await terminate_launched_browser(launched, timeout=timeout)
+        self._emit(SupervisorEvent.STOPPED, launched)
@@ -0,0 +1,122 @@
+import asyncio
+import logging
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Set
+
+from playwright.async_api import Browser, BrowserContext
+
+logger = logging.getLogger(__name__)
+
+
+class ContextPool:
+    """
+    Keeps isolated BrowserContexts warmed ahead of demand on one browser connection.
+
+    acquire() hands out an idle context (or creates one if none is warm yet) and tops the
+    idle set back up to `size` in a one-off background task.
+
+    By default (`max_uses=1`) release() closes the context and a fresh one takes its place,
+    so no state at all carries over between users. With a larger `max_uses` contexts are
+    reused: release() only closes the context's pages and clears its cookies and
+    permissions, while localStorage, IndexedDB, cache and service workers carry over to the
+    next user until the context has been used `max_uses` times and is replaced.
+    """
+
+    def __init__(self, browser: Browser, size: int = 2, max_uses: int = 1,
+                 context_options: Optional[Dict[str, Any]] = None):
+        if size < 0:
+            raise ValueError("ContextPool size must not be negative")
+        if max_uses < 1:
+            raise ValueError("ContextPool max_uses must be at least 1")
+        self.browser = browser
+        self.size = size
+        self.max_uses = max_uses
+        self.context_options = context_options or {}
+        self.idle: Deque[BrowserContext] = deque()
+        self.in_use: Set[BrowserContext] = set()
+        self.uses: Dict[BrowserContext, int] = {}
+        self.refill_task: Optional[asyncio.Task] = None
+        self.closed = False
+
+    async def _new_context(self) -> BrowserContext:
+        context = await self.browser.new_context(**self.context_options)
+        self.uses[context] = 0
+        return context
+
+    def warm(self):
+        """Start filling the idle set up to `size` contexts in the background."""
+        if self.closed or len(self.idle) >= self.size:
+            return
+        if self.refill_task is None or self.refill_task.done():
+            self.refill_task = asyncio.create_task(self._refill())
+
+    async def _refill(self):
+        try:
+            while not self.closed and len(self.idle) < self.size and self.browser.is_connected():
+                context = await self._new_context()
+                if self.closed:
+                    await self._close_context(context)
+                    return
+                self.idle.append(context)
+        except Exception as e:
+            logger.error(f"Failed to pre-warm browser context: {str(e)}")
+
+    async def acquire(self) -> BrowserContext:
+        """Take an isolated context from the pool. Pair every acquire() with a release()."""
+        if self.closed:
+            raise RuntimeError("ContextPool is closed")
+        context = self.idle.popleft() if self.idle else await self._new_context()
+        self.in_use.add(context)
+        self.uses[context] += 1
+        self.warm()
+        return context
+
+    async def release(self, context: BrowserContext, recycle: bool = False):
+        """
+        Return a context obtained from acquire(). With `recycle`, or once it reached
+        `max_uses`, the context is closed rather than reused.
+        """
+        if context not in self.in_use:
+            logger.warning("Released a browser context that was not acquired from this pool")
+            return
+        self.in_use.discard(context)
+
+        if self.closed or recycle or self.uses[context] >= self.max_uses or not self.browser.is_connected():
+            await self._close_context(context)
+            self.warm()
+            return
+
+        try:
+            for page in list(context.pages):
+                await page.close()
+            await context.clear_cookies()
+            await context.clear_permissions()
+        except Exception as e:
+            logger.warning(f"Failed to clear browser context, recycling it: {str(e)}")
+            await self._close_context(context)
+            self.warm()
+            return
+        self.idle.append(context)
+
+    async def _close_context(self, context: BrowserContext):
+        self.uses.pop(context, None)
+        try:
+            await context.close()
+        except Exception as e:
+            logger.debug(f"Error closing browser context: {str(e)}")
+
+    async def close(self):
+        """Close every idle and in-use context of the pool."""
+        self.closed = True
+        if self.refill_task is not None:
+            self.refill_task.cancel()
+            await asyncio.gather(self.refill_task, return_exceptions=True)
+            self.refill_task = None
+        contexts = list(self.idle) + list(self.in_use)
+        self.idle.clear()
+        self.in_use.clear()
+        for context in contexts:
+            await self._close_context(context)
+
+    def __repr__(self) -> str:
+        return f"ContextPool(size={self.size}, idle={len(self.idle)}, in_use={len(self.in_use)})"
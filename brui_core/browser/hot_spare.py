@@ -0,0 +1,55 @@
+import logging
+from typing import Optional
+
+from playwright.async_api import Browser
+
+from brui_core.browser.browser_launcher import LaunchedBrowser, get_chrome_log_path, launch_browser
+from brui_core.browser.browser_supervisor import BrowserSupervisor
+
+logger = logging.getLogger(__name__)
+
+
+class HotSpare:
+    """
+    A pre-launched, pre-connected standby Chrome on its own port and user data dir.
+
+    BrowserManager keeps one of these in hot-spare mode and promotes it when the primary
+    browser dies, so failover costs a reference swap instead of a cold launch.
+    """
+
+    def __init__(self, remote_debugging_port: int, user_data_dir: str):
+        self.remote_debugging_port = remote_debugging_port
+        self.user_data_dir = user_data_dir
+        self.supervisor = BrowserSupervisor(launch=self._launch_browser)
+        self.browser: Optional[Browser] = None
+
+    async def _launch_browser(self) -> LaunchedBrowser:
+        return await launch_browser(
+            remote_debugging_port=self.remote_debugging_port,
+            user_data_dir=self.user_data_dir,
+            log_path=get_chrome_log_path(self.remote_debugging_port),
+        )
+
+    async def start(self, playwright):
+        """Launch the standby Chrome and connect to it over CDP."""
+        launched = await self.supervisor.start()
+        endpoint_url = launched.ws_endpoint or f"http://localhost:{self.remote_debugging_port}"
+        self.browser = await playwright.chromium.connect_over_cdp(endpoint_url)
+        logger.info(f"Hot spare browser ready on port {self.remote_debugging_port}")
+
+    def is_ready(self) -> bool:
+        return (
+            self.browser is not None
+            and self.browser.is_connected()
+            and self.supervisor.running.is_set()
+        )
+
+    async def stop(self):
+        """Disconnect from and terminate the standby Chrome."""
+        try:
+            if self.browser is not None:
+                await self.browser.close()
+        except Exception as e:
+            logger.error(f"Error closing hot spare browser: {str(e)}")
+        self.browser = None
+        await self.supervisor.stop()
@@ -0,0 +1,65 @@
+import logging
+import shlex
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Flags that trim Chrome's background work for automation: no background networking,
+# sync, extensions, component updater or default apps, and no backgrounding/throttling
+# of renderers that are not in the foreground.
+LEAN_ARGS: Tuple[str, ...] = (
+    "--disable-background-networking",
+    "--disable-sync",
+    "--disable-extensions",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-renderer-backgrounding",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-ipc-flooding-protection",
+    "--disable-client-side-phishing-detection",
+    "--disable-domain-reliability",
+    "--no-default-browser-check",
+    "--metrics-recording-only",
+)
+
+HEADLESS_ARGS: Tuple[str, ...] = ("--headless=new",)
+
+LAUNCH_PRESETS: Dict[str, Tuple[str, ...]] = {
+    # The historical launch: a regular headed Chrome
+    "default": (),
+    "headless": HEADLESS_ARGS,
+    "lean": LEAN_ARGS,
+    "lean-headless": HEADLESS_ARGS + LEAN_ARGS,
+}
+
+
+def register_launch_preset(name: str, args: Iterable[str]):
+    """Register (or replace) a named launch preset."""
+    LAUNCH_PRESETS[name] = tuple(args)
+
+
+def parse_extra_args(extra_args: Union[None, str, Sequence[str]]) -> List[str]:
+    """Accept extra args as a list or as a shell-quoted string (as used by CHROME_EXTRA_ARGS)."""
+    if not extra_args:
+        return []
+    if isinstance(extra_args, str):
+        return shlex.split(extra_args)
+    return list(extra_args)
+
+
+def get_launch_preset_args(preset: Optional[str] = None,
+                           extra_args: Union[None, str, Sequence[str]] = None) -> List[str]:
+    """
+    Return the Chrome arguments for a named preset followed by any custom extra args.
+
+    Raises:
+        ValueError: If the preset is not registered
+    """
+    preset = preset or "default"
+    try:
+        args = list(LAUNCH_PRESETS[preset])
+    except KeyError:
+        raise ValueError(f"Unknown launch preset {preset!r}; available: {sorted(LAUNCH_PRESETS)}") from None
+    args.extend(parse_extra_args(extra_args))
+    return args
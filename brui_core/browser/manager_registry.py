@@ -0,0 +1,53 @@
+import itertools
+import logging
+from typing import Hashable, Iterable, List, Optional, Union
+
+from brui_core.browser.browser_endpoint import BrowserEndpoint, parse_endpoint
+from brui_core.browser.browser_manager import BrowserManager
+
+logger = logging.getLogger(__name__)
+
+Endpoint = Union[str, int, BrowserEndpoint]
+
+# Rotates the starting point of least-loaded selection, so ties spread round-robin
+_selection_counter = itertools.count()
+
+
+def get_browser_manager(endpoint: Optional[Endpoint] = None, key: Optional[Hashable] = None) -> BrowserManager:
+    """
+    Return the manager for a DevTools endpoint ("host:port", a port, or a ws:// URL), one
+    per endpoint and event loop. Without an endpoint, the default self-launching manager.
+    """
+    return BrowserManager(key=key, endpoint=endpoint)
+
+
+def registered_managers() -> List[BrowserManager]:
+    """Every BrowserManager created so far, across endpoints and event loops, except those of closed loops."""
+    BrowserManager.discard_expired_instances()
+    # SingletonMeta keeps the instances of every singleton class in one dict
+    return [instance for instance in list(BrowserManager._instances.values()) if isinstance(instance, BrowserManager)]
+
+
+def manager_load(manager: BrowserManager) -> int:
+    """Pages open or waiting for admission on the manager's browser."""
+    scheduler = manager.page_scheduler
+    return scheduler.running + scheduler.queue_depth()
+
+
+def least_loaded_manager(endpoints: Iterable[Endpoint], key: Optional[Hashable] = None) -> BrowserManager:
+    """
+    Return the manager of the endpoint with the fewest pages open or queued. Equally loaded
+    endpoints are picked in rotation, so a burst of callers is spread instead of piling
+    onto the first endpoint.
+
+    Raises:
+        ValueError: If no endpoints are given
+    """
+    managers = [get_browser_manager(parse_endpoint(endpoint), key=key) for endpoint in endpoints]
+    if not managers:
+        raise ValueError("least_loaded_manager() needs at least one endpoint")
+    offset = next(_selection_counter) % len(managers)
+    rotated = managers[offset:] + managers[:offset]
+    manager = min(rotated, key=manager_load)
+    logger.debug(f"Selected browser endpoint {manager.endpoint} (load {manager_load(manager)})")
+    return manager
@@ -0,0 +1,183 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+
+from playwright.async_api import BrowserContext, Page
+
+logger = logging.getLogger(__name__)
+
+# Clears Web Storage for the origin the page is on; other origins are unaffected
+CLEAR_STORAGE_SCRIPT = "() => { try { localStorage.clear(); sessionStorage.clear(); } catch (e) {} }"
+
+
+def _listener_snapshot(page: Page) -> Optional[Dict[Any, List[Any]]]:
+    emitter = getattr(page, "_impl_obj", None)
+    if emitter is None or not hasattr(emitter, "event_names"):
+        return None
+    return {event: list(emitter.listeners(event)) for event in emitter.event_names()}
+
+
+def _remove_added_listeners(page: Page, baseline: Optional[Dict[Any, List[Any]]]):
+    """Remove event handlers registered on the page since `baseline`, keeping Playwright's own."""
+    if baseline is None:
+        return
+    emitter = page._impl_obj
+    for event in list(emitter.event_names()):
+        known = baseline.get(event, ())
+        for listener in list(emitter.listeners(event)):
+            if listener not in known:
+                emitter.remove_listener(event, listener)
+
+
+class PagePool:
+    """
+    Pre-created pages of one BrowserContext, leased out instead of opening and closing tabs.
+
+    release() resets a page rather than closing it: handlers and routes added while it was
+    leased are removed, Web Storage of its current origin is cleared when `clear_storage`
+    is set (per release, defaulting to the pool's setting), and it is navigated to about:blank. A page is closed once it has been leased
+    `max_uses` times. Idle pages beyond `size` are evicted after `idle_timeout` seconds;
+    eviction runs lazily on acquire()/release(), there is no background loop.
+    """
+
+    def __init__(self, context: BrowserContext, size: int = 1, max_uses: int = 50,
+                 idle_timeout: float = 60.0, clear_storage: bool = False):
+        if size < 0:
+            raise ValueError("PagePool size must not be negative")
+        if max_uses < 1:
+            raise ValueError("PagePool max_uses must be at least 1")
+        self.context = context
+        self.size = size
+        self.max_uses = max_uses
+        self.idle_timeout = idle_timeout
+        self.clear_storage = clear_storage
+        # (page, time it became idle)
+        self.idle: Deque[Tuple[Page, float]] = deque()
+        self.in_use: Set[Page] = set()
+        self.uses: Dict[Page, int] = {}
+        self.listener_baselines: Dict[Page, Optional[Dict[Any, List[Any]]]] = {}
+        self.refill_task: Optional[asyncio.Task] = None
+        self.closed = False
+
+    async def _new_page(self) -> Page:
+        page = await self.context.new_page()
+        self.uses[page] = 0
+        self.listener_baselines[page] = _listener_snapshot(page)
+        return page
+
+    def _forget(self, page: Page):
+        self.uses.pop(page, None)
+        self.listener_baselines.pop(page, None)
+
+    def warm(self):
+        """Start creating idle pages up to `size` in the background."""
+        if self.closed or len(self.idle) >= self.size:
+            return
+        if self.refill_task is None or self.refill_task.done():
+            self.refill_task = asyncio.create_task(self._refill())
+
+    async def _refill(self):
+        try:
+            while not self.closed and len(self.idle) < self.size:
+                page = await self._new_page()
+                if self.closed:
+                    await self._close_page(page)
+                    return
+                self.idle.append((page, time.monotonic()))
+        except Exception as e:
+            logger.error(f"Failed to pre-create page: {str(e)}")
+
+    async def _evict_idle(self):
+        """Close pages that have sat idle past idle_timeout while more than `size` are idle."""
+        deadline = time.monotonic() - self.idle_timeout
+        # The oldest idle pages are on the left
+        while len(self.idle) > self.size and self.idle[0][1] < deadline:
+            page, _ = self.idle.popleft()
+            await self._close_page(page)
+
+    async def acquire(self) -> Page:
+        """Lease a page. Pair every acquire() with a release()."""
+        if self.closed:
+            raise RuntimeError("PagePool is closed")
+        await self._evict_idle()
+        page = None
+        while self.idle:
+            candidate, _ = self.idle.pop()
+            if candidate.is_closed():
+                # Closed behind the pool's back, e.g. together with its context
+                self._forget(candidate)
+                continue
+            page = candidate
+            break
+        if page is None:
+            page = await self._new_page()
+        self.in_use.add(page)
+        self.uses[page] += 1
+        self.warm()
+        return page
+
+    async def release(self, page: Page, clear_storage: Optional[bool] = None, discard: bool = False):
+        """
+        Reset a leased page and return it to the pool, or close it once it is used up.
+
+        Args:
+            page: Page leased with acquire().
+            clear_storage: Clear the page's Web Storage; None uses the pool's `clear_storage`.
+            discard: Close the page instead of reusing it, e.g. because bindings or init
+                scripts that cannot be removed were added to it.
+        """
+        if page not in self.in_use:
+            logger.warning("Released a page that was not acquired from this pool")
+            return
+        self.in_use.discard(page)
+
+        if page.is_closed():
+            self._forget(page)
+            self.warm()
+            return
+        if self.closed or discard or self.uses[page] >= self.max_uses:
+            await self._close_page(page)
+            self.warm()
+            return
+
+        try:
+            await self._reset_page(page, self.clear_storage if clear_storage is None else clear_storage)
+        except Exception as e:
+            logger.warning(f"Failed to reset page, closing it: {str(e)}")
+            await self._close_page(page)
+            self.warm()
+            return
+        self.idle.append((page, time.monotonic()))
+        await self._evict_idle()
+
+    async def _reset_page(self, page: Page, clear_storage: bool):
+        _remove_added_listeners(page, self.listener_baselines.get(page))
+        await page.unroute_all(behavior="ignoreErrors")
+        if clear_storage:
+            await page.evaluate(CLEAR_STORAGE_SCRIPT)
+        await page.goto("about:blank")
+
+    async def _close_page(self, page: Page):
+        self._forget(page)
+        try:
+            await page.close()
+        except Exception as e:
+            logger.debug(f"Error closing pooled page: {str(e)}")
+
+    async def close(self):
+        """Close every idle and leased page of the pool."""
+        self.closed = True
+        if self.refill_task is not None:
+            self.refill_task.cancel()
+            await asyncio.gather(self.refill_task, return_exceptions=True)
+            self.refill_task = None
+        pages = [page for page, _ in self.idle] + list(self.in_use)
+        self.idle.clear()
+        self.in_use.clear()
+        for page in pages:
+            await self._close_page(page)
+
+    def __repr__(self) -> str:
+        return f"PagePool(size={self.size}, idle={len(self.idle)}, in_use={len(self.in_use)})"
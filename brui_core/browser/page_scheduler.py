@@ -0,0 +1,196 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from enum import IntEnum
+from typing import Deque, Dict, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class Priority(IntEnum):
+    """Priority classes of page work; lower values are admitted first."""
+    HIGH = 0
+    NORMAL = 1
+    LOW = 2
+
+
+class AdmissionRejected(Exception):
+    """Raised when page work can't be admitted before its deadline or the queue is full."""
+
+
+class SchedulerStats(NamedTuple):
+    running: int
+    queue_depth: int
+    queue_depth_by_priority: Dict[Priority, int]
+    admitted: int
+    rejected: int
+    mean_wait: float
+    max_wait: float
+    # Exponentially weighted average of how long a slot is held, used to estimate waits
+    mean_hold: float
+
+
+class _Waiter:
+    __slots__ = ("future", "enqueued_at")
+
+    def __init__(self, future: asyncio.Future, enqueued_at: float):
+        self.future = future
+        self.enqueued_at = enqueued_at
+
+
+class PageScheduler:
+    """
+    Admission control for pages on one browser: at most `max_concurrent_pages` slots are
+    held at a time and everyone else queues. With `max_concurrent_pages=None` (the default)
+    every request is admitted at once and only counted.
+
+    Queued requests are admitted by priority class and first-in-first-out within a class.
+    A request with a deadline is rejected up front when the estimated wait (queue ahead of
+    it times the average hold time, spread over the slots) already exceeds the deadline,
+    and rejected when its deadline passes while queued, so a burst turns into bounded
+    latency instead of an unbounded number of renderers.
+    """
+
+    HOLD_SMOOTHING = 0.2
+
+    def __init__(self, max_concurrent_pages: Optional[int] = None, max_queue: Optional[int] = None):
+        if max_concurrent_pages is not None and max_concurrent_pages < 1:
+            raise ValueError("max_concurrent_pages must be at least 1")
+        self.max_concurrent_pages = max_concurrent_pages
+        self.max_queue = max_queue
+        self.running = 0
+        self.queues: Dict[Priority, Deque[_Waiter]] = {priority: deque() for priority in Priority}
+        self.admitted = 0
+        self.rejected = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.mean_hold = 0.0
+
+    def _has_free_slot(self) -> bool:
+        return self.max_concurrent_pages is None or self.running < self.max_concurrent_pages
+
+    def queue_depth(self) -> int:
+        return sum(len(queue) for queue in self.queues.values())
+
+    def estimated_wait(self, priority: Priority = Priority.NORMAL) -> float:
+        """Rough wait for a request of `priority` enqueued now, from the average slot hold time."""
+        if self._has_free_slot() and not self.queue_depth():
+            return 0.0
+        ahead = sum(len(self.queues[p]) for p in Priority if p <= priority)
+        return (ahead + 1) * self.mean_hold / self.max_concurrent_pages
+
+    def _record_wait(self, waited: float):
+        self.admitted += 1
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+
+    def _reject(self, message: str):
+        self.rejected += 1
+        logger.warning(f"Page admission rejected: {message}")
+        raise AdmissionRejected(message)
+
+    async def acquire(self, priority: Priority = Priority.NORMAL, deadline: Optional[float] = None,
+                      exempt: bool = False) -> float:
+        """
+        Wait for a page slot. Pair every successful acquire() with a release().
+
+        Args:
+            priority: Priority class of the request.
+            deadline: Seconds the caller is willing to wait for admission; None waits forever.
+            exempt: Admit at once, even beyond the cap, and only count the slot. For work done
+                on behalf of a caller that already holds a slot, which would otherwise wait on itself.
+
+        Returns:
+            float: time.monotonic() at which the slot was granted.
+
+        Raises:
+            AdmissionRejected: If the deadline can't be or wasn't met, or the queue is full.
+        """
+        priority = Priority(priority)
+        # Fast path: a free slot and nobody queued; no future is created
+        if exempt or (self._has_free_slot() and not self.queue_depth()):
+            self.running += 1
+            self._record_wait(0.0)
+            return time.monotonic()
+
+        if self.max_queue is not None and self.queue_depth() >= self.max_queue:
+            self._reject(f"queue is full ({self.max_queue} waiting)")
+        if deadline is not None and self.mean_hold and self.estimated_wait(priority) > deadline:
+            self._reject(f"estimated wait {self.estimated_wait(priority):.2f}s exceeds deadline {deadline:.2f}s")
+
+        waiter = _Waiter(asyncio.get_running_loop().create_future(), time.monotonic())
+        self.queues[priority].append(waiter)
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter.future), deadline)
+        except asyncio.TimeoutError:
+            if not self._abandon(priority, waiter):
+                return self._admitted(waiter)
+            self._reject(f"not admitted within {deadline:.2f}s")
+        except asyncio.CancelledError:
+            if not self._abandon(priority, waiter):
+                # The slot was handed over just as we were cancelled; pass it on
+                self.release(waiter.future.result())
+            raise
+        return self._admitted(waiter)
+
+    def _admitted(self, waiter: _Waiter) -> float:
+        granted_at = waiter.future.result()
+        self._record_wait(granted_at - waiter.enqueued_at)
+        return granted_at
+
+    def _abandon(self, priority: Priority, waiter: _Waiter) -> bool:
+        """Remove a waiter that gave up. Returns False if it had already been granted a slot."""
+        if waiter.future.done():
+            return False
+        self.queues[priority].remove(waiter)
+        waiter.future.cancel()
+        return True
+
+    def release(self, granted_at: Optional[float] = None):
+        """
+        Give a slot back and hand it to the next waiter, if any.
+
+        Args:
+            granted_at: The value returned by acquire(), used to track average hold time.
+        """
+        now = time.monotonic()
+        if granted_at is not None:
+            held = now - granted_at
+            self.mean_hold = held if not self.mean_hold else (
+                self.HOLD_SMOOTHING * held + (1 - self.HOLD_SMOOTHING) * self.mean_hold
+            )
+        # Exempt slots can push `running` past the cap; hand over only a slot that is really free
+        over_cap = self.max_concurrent_pages is not None and self.running > self.max_concurrent_pages
+        for priority in ([] if over_cap else Priority):
+            queue = self.queues[priority]
+            while queue:
+                waiter = queue.popleft()
+                if not waiter.future.done():
+                    # The slot passes straight to the waiter; `running` stays the same
+                    waiter.future.set_result(now)
+                    return
+        self.running -= 1
+
+    @asynccontextmanager
+    async def slot(self, priority: Priority = Priority.NORMAL, deadline: Optional[float] = None,
+                   exempt: bool = False):
+        """Async context manager wrapping acquire()/release()."""
+        granted_at = await self.acquire(priority, deadline, exempt)
+        try:
+            yield
+        finally:
+            self.release(granted_at)
+
+    def stats(self) -> SchedulerStats:
+        return SchedulerStats(
+            running=self.running,
+            queue_depth=self.queue_depth(),
+            queue_depth_by_priority={priority: len(queue) for priority, queue in self.queues.items()},
+            admitted=self.admitted,
+            rejected=self.rejected,
+            mean_wait=self.total_wait / self.admitted if self.admitted else 0.0,
+            max_wait=self.max_wait,
+            mean_hold=self.mean_hold,
+        )
@@ -0,0 +1,94 @@
+import asyncio
+import logging
+import weakref
+from typing import Optional
+
+from playwright.async_api import Playwright, async_playwright
+
+logger = logging.getLogger(__name__)
+
+
+def is_driver_alive(playwright: Playwright) -> bool:
+    """
+    Whether the Node driver behind a Playwright instance is still usable.
+
+    Playwright does not expose this publicly, so the connection's close state and the driver
+    subprocess are inspected; objects without those internals are assumed to be alive.
+    """
+    connection = getattr(getattr(playwright, "_impl_obj", None), "_connection", None)
+    if connection is None:
+        return True
+    if getattr(connection, "_closed_error", None) is not None:
+        return False
+    process = getattr(getattr(connection, "_transport", None), "_proc", None)
+    return process is None or process.returncode is None
+
+
+class PlaywrightDriver:
+    """
+    A long-lived Playwright driver shared by every browser connection on one event loop.
+
+    Reconnecting to a browser only needs a new connect_over_cdp() on the running driver, so
+    the Node driver process is started once and restarted only if it dies.
+    """
+
+    def __init__(self):
+        self.playwright: Optional[Playwright] = None
+        self.lock = asyncio.Lock()
+        self.starts = 0
+
+    def is_alive(self) -> bool:
+        return self.playwright is not None and is_driver_alive(self.playwright)
+
+    async def get(self) -> Playwright:
+        """Return the running driver, starting (or restarting) it if needed."""
+        # Hot path: no lock and no await once the driver is up
+        if self.is_alive():
+            return self.playwright
+        async with self.lock:
+            if self.playwright is not None and not self.is_alive():
+                logger.warning("Playwright driver died; restarting it")
+                await self._discard()
+            if self.playwright is None:
+                self.playwright = await async_playwright().start()
+                self.starts += 1
+                logger.info(f"Started Playwright driver (start #{self.starts})")
+            return self.playwright
+
+    async def _discard(self):
+        playwright = self.playwright
+        self.playwright = None
+        try:
+            await playwright.stop()
+        except Exception as e:
+            logger.debug(f"Error stopping dead Playwright driver: {str(e)}")
+
+    async def stop(self):
+        """Stop the driver. Every browser connection made through it is closed with it."""
+        async with self.lock:
+            if self.playwright is not None:
+                await self._discard()
+
+
+_drivers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, PlaywrightDriver]" = weakref.WeakKeyDictionary()
+
+
+def get_playwright_driver() -> PlaywrightDriver:
+    """Return the shared driver of the running event loop (Playwright objects are bound to one loop)."""
+    loop = asyncio.get_running_loop()
+    driver = _drivers.get(loop)
+    if driver is None:
+        driver = _drivers[loop] = PlaywrightDriver()
+    return driver
+
+
+async def get_playwright() -> Playwright:
+    """Return the running event loop's shared Playwright instance, starting it on first use."""
+    return await get_playwright_driver().get()
+
+
+async def stop_playwright():
+    """Stop the running event loop's shared Playwright driver, e.g. at application shutdown."""
+    driver = _drivers.get(asyncio.get_running_loop())
+    if driver is not None:
+        await driver.stop()
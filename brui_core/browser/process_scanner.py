@@ -0,0 +1,120 @@
+import os
+import subprocess
+import logging
+from collections import defaultdict
+from typing import Dict, FrozenSet, Iterable, List, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+PROC_ROOT = "/proc"
+
+class ChromeProcess(NamedTuple):
+    pid: int
+    ppid: int
+    cmd: str
+
+class ChromeProcessTable(frozenset):
+    """
+    Immutable snapshot of Chrome processes indexed by pid and by parent pid.
+
+    It behaves like the Set[ChromeProcess] returned historically by get_chrome_pids(),
+    but also carries the parent/child tree so callers do not have to rebuild it.
+    """
+
+    def __init__(self, processes: Iterable[ChromeProcess] = ()):
+        super().__init__()
+        self.by_pid: Dict[int, ChromeProcess] = {p.pid: p for p in self}
+        children: Dict[int, List[ChromeProcess]] = defaultdict(list)
+        for process in self:
+            children[process.ppid].append(process)
+        self.children: Dict[int, List[ChromeProcess]] = dict(children)
+
+    def roots(self) -> FrozenSet[ChromeProcess]:
+        """Processes whose parent is not itself part of the table."""
+        return frozenset(p for p in self if p.ppid not in self.by_pid)
+
+    def descendants(self, pid: int) -> List[ChromeProcess]:
+        """All processes below `pid` in the tree, parents before children."""
+        result = []
+        stack = list(self.children.get(pid, ()))
+        while stack:
+            process = stack.pop()
+            result.append(process)
+            stack.extend(self.children.get(process.pid, ()))
+        return result
+
+def is_proc_available() -> bool:
+    return os.path.isdir(os.path.join(PROC_ROOT, "self"))
+
+def _read_proc_process(pid: int, raw_cmdline: bytes) -> Optional[ChromeProcess]:
+    """Build a ChromeProcess from an already-read cmdline plus the process' /proc stat."""
+    if not raw_cmdline:
+        # Kernel threads and zombies have an empty cmdline
+        return None
+    cmd = raw_cmdline.rstrip(b"\0").replace(b"\0", b" ").decode(errors="replace")
+
+    with open(os.path.join(PROC_ROOT, str(pid), "stat"), "rb") as f:
+        stat = f.read()
+    # The command name is wrapped in parentheses and may itself contain spaces or ')'
+    fields = stat[stat.rfind(b")") + 2:].split()
+    return ChromeProcess(pid=pid, ppid=int(fields[1]), cmd=cmd)
+
+def scan_processes_from_proc(match: str) -> ChromeProcessTable:
+    """
+    Scan /proc in-process and return every process whose command line contains `match`.
+    The cheap cmdline read is used as the filter, so stat is only read for matching processes.
+    """
+    needle = match.encode()
+    # cmdline arguments are NUL-separated, so they only need joining when the needle spans arguments
+    join_arguments = b" " in needle
+    matches = []
+    with os.scandir(PROC_ROOT) as entries:
+        for entry in entries:
+            if not entry.name.isdigit():
+                continue
+            pid = int(entry.name)
+            try:
+                with open(os.path.join(entry.path, "cmdline"), "rb") as f:
+                    raw_cmdline = f.read()
+                haystack = raw_cmdline.replace(b"\0", b" ") if join_arguments else raw_cmdline
+                if needle not in haystack:
+                    continue
+                process = _read_proc_process(pid, raw_cmdline)
+            except (FileNotFoundError, ProcessLookupError, PermissionError):
+                # Process exited (or is not ours to inspect) between listing and reading
+                continue
+            except (ValueError, IndexError) as e:
+                logger.debug(f"Error processing /proc entry {pid}: {e}")
+                continue
+            if process is not None:
+                matches.append(process)
+    return ChromeProcessTable(matches)
+
+def scan_processes_from_ps(match: str) -> ChromeProcessTable:
+    """Fallback scanner for hosts without /proc, based on `ps -eo pid=,ppid=,cmd=`."""
+    cmd = ['ps', '-eo', 'pid=,ppid=,cmd=']
+    result = subprocess.run(cmd, capture_output=True, text=True)
+
+    if result.returncode != 0:
+        logger.error(f"Failed to get process list: {result.stderr}")
+        return ChromeProcessTable()
+
+    matches = []
+    for line in result.stdout.splitlines():
+        try:
+            # Split line but preserve command with all its arguments
+            parts = line.strip().split(maxsplit=2)
+            if len(parts) == 3:
+                pid, ppid, command = parts
+                if match in command:
+                    matches.append(ChromeProcess(pid=int(pid), ppid=int(ppid), cmd=command))
+        except (ValueError, IndexError) as e:
+            logger.debug(f"Error processing process info: {e}")
+            continue
+    return ChromeProcessTable(matches)
+
+def scan_processes(match: str) -> ChromeProcessTable:
+    """Return the processes matching `match`, using /proc when available and `ps` otherwise."""
+    if is_proc_available():
+        return scan_processes_from_proc(match)
+    return scan_processes_from_ps(match)
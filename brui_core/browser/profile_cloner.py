@@ -0,0 +1,184 @@
+import errno
+import fcntl
+import logging
+import os
+import shutil
+import time
+import uuid
+from typing import Iterable, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+# ioctl request number for FICLONE (_IOW(0x94, 9, int)), supported by btrfs, XFS, bcachefs, ...
+FICLONE = 0x40049409
+
+# Written into every clone so leftovers from crashed processes can be garbage-collected
+CLONE_MARKER = ".brui-profile-clone"
+
+# Files Chrome uses to claim a profile; a clone must never inherit the template's
+PROFILE_LOCK_FILES = frozenset({"SingletonLock", "SingletonCookie", "SingletonSocket", "lockfile"})
+
+LINK_MODES = ("auto", "reflink", "hardlink", "copy")
+
+# Errors meaning "this filesystem can't reflink", as opposed to a genuine I/O failure
+_REFLINK_UNSUPPORTED = {errno.EOPNOTSUPP, errno.ENOTTY, errno.EXDEV, errno.EINVAL, errno.ENOSYS, errno.EPERM}
+
+_collected_roots: Set[str] = set()
+
+
+def reflink_file(src: str, dst: str):
+    """Create `dst` as a copy-on-write clone of `src`. Raises OSError if unsupported."""
+    with open(src, "rb") as src_file, open(dst, "wb") as dst_file:
+        try:
+            fcntl.ioctl(dst_file.fileno(), FICLONE, src_file.fileno())
+        except OSError:
+            dst_file.close()
+            os.unlink(dst)
+            raise
+    shutil.copystat(src, dst)
+
+
+class ProfileClone:
+    """A per-instance user data dir materialized from a profile template."""
+
+    def __init__(self, path: str, template_dir: str, link_mode: str):
+        self.path = path
+        self.template_dir = template_dir
+        self.link_mode = link_mode
+
+    def remove(self):
+        """Delete the clone from disk."""
+        shutil.rmtree(self.path, ignore_errors=True)
+        logger.debug(f"Removed profile clone {self.path}")
+
+    def __repr__(self) -> str:
+        return f"ProfileClone(path={self.path!r}, template_dir={self.template_dir!r}, link_mode={self.link_mode!r})"
+
+
+class _Cloner:
+    def __init__(self, link_mode: str, exclude: Set[str]):
+        self.link_mode = link_mode
+        self.exclude = exclude
+        # "auto" starts optimistic and drops to plain copies at the first unsupported reflink
+        self.use_reflink = link_mode in ("auto", "reflink")
+
+    def clone_file(self, src: str, dst: str):
+        if self.link_mode == "hardlink":
+            os.link(src, dst)
+            return
+        if self.use_reflink:
+            try:
+                reflink_file(src, dst)
+                return
+            except OSError as e:
+                if self.link_mode == "reflink" or e.errno not in _REFLINK_UNSUPPORTED:
+                    raise
+                logger.debug(f"Reflinks unsupported ({e}); falling back to copying profile files")
+                self.use_reflink = False
+        # shutil uses copy_file_range/sendfile on Linux, so data stays in the kernel
+        shutil.copy2(src, dst)
+
+    def clone_tree(self, src_dir: str, dst_dir: str):
+        os.makedirs(dst_dir, exist_ok=True)
+        with os.scandir(src_dir) as entries:
+            for entry in entries:
+                if entry.name in self.exclude:
+                    continue
+                dst = os.path.join(dst_dir, entry.name)
+                if entry.is_symlink():
+                    os.symlink(os.readlink(entry.path), dst)
+                elif entry.is_dir():
+                    self.clone_tree(entry.path, dst)
+                elif entry.is_file():
+                    self.clone_file(entry.path, dst)
+        shutil.copystat(src_dir, dst_dir)
+
+
+def default_clone_root(template_dir: str) -> str:
+    """Clones live next to the template by default, so reflinks and hardlinks stay on one filesystem."""
+    template_dir = os.path.abspath(template_dir)
+    return os.path.join(os.path.dirname(template_dir), f".{os.path.basename(template_dir)}-clones")
+
+
+def clone_profile(template_dir: str, clone_root: Optional[str] = None, link_mode: str = "auto",
+                  exclude: Iterable[str] = ()) -> ProfileClone:
+    """
+    Materialize a fresh user data dir from a profile template.
+
+    Args:
+        template_dir: A user data dir prepared once (e.g. logged in) and never launched directly.
+        clone_root: Directory to create the clone in. Defaults to a sibling of the template.
+        link_mode: "auto" (reflink, falling back to copy), "reflink", "copy", or "hardlink".
+            Hardlinked clones share file contents with the template, and Chrome rewrites some
+            profile files in place, so only use "hardlink" with disposable templates.
+        exclude: Extra file or directory names to leave out of the clone.
+
+    Returns:
+        ProfileClone: The clone; call remove() once the browser using it has exited.
+    """
+    if link_mode not in LINK_MODES:
+        raise ValueError(f"Unknown link_mode {link_mode!r}; expected one of {LINK_MODES}")
+    if not os.path.isdir(template_dir):
+        raise FileNotFoundError(f"Profile template directory not found: {template_dir}")
+
+    if clone_root is None:
+        clone_root = default_clone_root(template_dir)
+    os.makedirs(clone_root, exist_ok=True)
+    if clone_root not in _collected_roots:
+        _collected_roots.add(clone_root)
+        collect_stale_profile_clones(clone_root)
+
+    path = os.path.join(clone_root, f"profile-{uuid.uuid4().hex[:12]}")
+    start = time.perf_counter()
+    cloner = _Cloner(link_mode, PROFILE_LOCK_FILES | set(exclude))
+    try:
+        cloner.clone_tree(template_dir, path)
+        with open(os.path.join(path, CLONE_MARKER), "w") as marker:
+            marker.write(str(os.getpid()))
+    except Exception:
+        shutil.rmtree(path, ignore_errors=True)
+        raise
+
+    if link_mode == "hardlink":
+        effective_mode = "hardlink"
+    else:
+        effective_mode = "reflink" if cloner.use_reflink else "copy"
+    logger.info(f"Cloned profile template {template_dir} to {path} via {effective_mode} "
+                f"in {(time.perf_counter() - start) * 1000:.1f}ms")
+    return ProfileClone(path=path, template_dir=template_dir, link_mode=effective_mode)
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def collect_stale_profile_clones(clone_root: str) -> int:
+    """
+    Remove clones under `clone_root` whose owning process is gone (e.g. after a crash).
+    Returns the number of clones removed.
+    """
+    removed = 0
+    try:
+        entries = list(os.scandir(clone_root))
+    except FileNotFoundError:
+        return 0
+
+    for entry in entries:
+        marker_path = os.path.join(entry.path, CLONE_MARKER)
+        try:
+            with open(marker_path) as marker:
+                owner_pid = int(marker.read().strip())
+        except (FileNotFoundError, NotADirectoryError, ValueError):
+            continue
+        if not _pid_alive(owner_pid):
+            shutil.rmtree(entry.path, ignore_errors=True)
+            removed += 1
+    if removed:
+        logger.info(f"Garbage-collected {removed} stale profile clones in {clone_root}")
+    return removed
@@ -2,6 +2,9 @@ import pyperclip
 import asyncio
 import logging
 import sys
+from typing import Optional
+
+from brui_core.clipboard.clipboard_watcher import get_clipboard_watcher
 
 logger = logging.getLogger(__name__)
 
@@ -13,21 +16,24 @@ if sys.platform.startswith('linux'):
     except Exception as e:
         logger.error(f"Failed to set clipboard to 'xclip': {e}")
 
-async def wait_for_clipboard_content():
+async def wait_for_clipboard_content(timeout: Optional[float] = None) -> str:
     """
     Wait for the clipboard content to change and return the new content.
-    
+
+    Changes are picked up by the process-wide ClipboardWatcher, so concurrent waiters
+    share one clipboard reader and the event loop is never blocked on xclip.
+
+    :param timeout: Seconds to wait for new content; None waits indefinitely.
     :return: The new clipboard content as a string.
+    :raises asyncio.TimeoutError: If nothing is copied within `timeout` seconds.
     """
-    initial_clipboard = pyperclip.paste()
+    watcher = get_clipboard_watcher()
+    initial_clipboard = await watcher.read()
     if initial_clipboard != '':
         return initial_clipboard
-    while True:
-        await asyncio.sleep(0.1)
-        new_clipboard = pyperclip.paste()
-        if new_clipboard != initial_clipboard:
-            pyperclip.copy('')
-            return new_clipboard
+    new_clipboard = await watcher.wait_for_change(initial_clipboard, timeout)
+    await asyncio.to_thread(watcher.copy, '')
+    return new_clipboard
 
 async def ensure_clipboard_is_empty(max_retries: int = 3, retry_delay: float = 0.5) -> bool:
     """
@@ -0,0 +1,198 @@
+import asyncio
+import logging
+import shutil
+import subprocess
+import threading
+from typing import Callable, List, Optional
+
+import pyperclip
+
+logger = logging.getLogger(__name__)
+
+# How often the clipboard is read when clipnotify is not available
+DEFAULT_POLL_INTERVAL = 0.1
+
+# With clipnotify, the clipboard is still re-read this often in case a change was missed
+NOTIFY_RECHECK_INTERVAL = 2.0
+
+
+class _Waiter:
+    __slots__ = ("loop", "future", "baseline")
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, future: asyncio.Future, baseline: str):
+        self.loop = loop
+        self.future = future
+        self.baseline = baseline
+
+
+def _resolve(future: asyncio.Future, content: Optional[str], error: Optional[BaseException]):
+    if future.done():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(content)
+
+
+class ClipboardWatcher:
+    """
+    One background thread watching the clipboard for every waiter in the process, on any
+    event loop. Each change is read once and broadcast to the waiters' futures, so N
+    concurrent waiters cost one reader instead of N polling loops.
+
+    With `clipnotify` on PATH the thread blocks until X11 reports a clipboard change;
+    otherwise it reads the clipboard every `poll_interval` seconds. The thread runs only
+    while someone is waiting, and exits when the last waiter resolves, times out or is
+    cancelled.
+    """
+
+    def __init__(self, poll_interval: float = DEFAULT_POLL_INTERVAL,
+                 paste: Optional[Callable[[], str]] = None,
+                 notify_command: Optional[List[str]] = None, use_notify: bool = True):
+        """
+        Args:
+            poll_interval: Seconds between reads when polling.
+            paste: Reads the clipboard. Defaults to pyperclip.paste.
+            notify_command: Command that exits when the clipboard changes.
+                Defaults to `clipnotify` if it is installed.
+            use_notify: Set to False to always poll.
+        """
+        if notify_command is None and use_notify:
+            clipnotify = shutil.which("clipnotify")
+            notify_command = [clipnotify] if clipnotify else None
+        self.poll_interval = poll_interval
+        self.paste = paste
+        self.notify_command = notify_command if use_notify else None
+        self.lock = threading.Lock()
+        self.waiters: List[_Waiter] = []
+        self.thread: Optional[threading.Thread] = None
+        # Last content read by the running thread; None while the thread is not running
+        self.current: Optional[str] = None
+        self.notify_process: Optional[subprocess.Popen] = None
+        self.reads = 0
+
+    def _paste(self) -> str:
+        self.reads += 1
+        return (self.paste or pyperclip.paste)()
+
+    async def read(self) -> str:
+        """Current clipboard content, from the watcher if it is running, else read off the event loop."""
+        with self.lock:
+            if self.current is not None:
+                return self.current
+        return await asyncio.to_thread(self._paste)
+
+    async def wait_for_change(self, baseline: str, timeout: Optional[float] = None) -> str:
+        """
+        Wait until the clipboard holds something other than `baseline` and return it.
+
+        Raises:
+            asyncio.TimeoutError: If the clipboard does not change within `timeout` seconds
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        waiter = _Waiter(loop, future, baseline)
+        with self.lock:
+            if self.current is not None and self.current != baseline:
+                return self.current
+            self.waiters.append(waiter)
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._watch, name="brui-clipboard-watcher", daemon=True)
+                self.thread.start()
+        future.add_done_callback(lambda _: self._remove_waiter(waiter))
+        return await asyncio.wait_for(future, timeout)
+
+    def _remove_waiter(self, waiter: _Waiter):
+        with self.lock:
+            if waiter in self.waiters:
+                self.waiters.remove(waiter)
+            if not self.waiters:
+                self._stop_notify()
+
+    def _stop_notify(self):
+        # Called with the lock held once nobody is waiting, so no helper is left blocking
+        if self.notify_process is not None:
+            self.notify_process.terminate()
+            self.notify_process = None
+
+    def _wait_for_next_change(self) -> bool:
+        """Block until the clipboard may have changed. Returns False if it should not be re-read."""
+        if self.notify_command is None:
+            threading.Event().wait(self.poll_interval)
+            return True
+        with self.lock:
+            if not self.waiters:
+                return False
+            if self.notify_process is None:
+                self.notify_process = subprocess.Popen(
+                    self.notify_command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+                )
+            process = self.notify_process
+        try:
+            returncode = process.wait(NOTIFY_RECHECK_INTERVAL)
+        except subprocess.TimeoutExpired:
+            # clipnotify misses changes made just before it started, so re-read now and then
+            return True
+        with self.lock:
+            if self.notify_process is not process:
+                # Terminated because the last waiter went away
+                return False
+            self.notify_process = None
+            if returncode != 0:
+                logger.warning(f"{self.notify_command[0]} exited with code {returncode}; "
+                               f"polling the clipboard every {self.poll_interval}s instead")
+                self.notify_command = None
+        return True
+
+    def _broadcast(self, content: Optional[str], error: Optional[BaseException]):
+        with self.lock:
+            self.current = content
+            ready = [waiter for waiter in self.waiters if error is not None or waiter.baseline != content]
+            for waiter in ready:
+                self.waiters.remove(waiter)
+        for waiter in ready:
+            try:
+                waiter.loop.call_soon_threadsafe(_resolve, waiter.future, content, error)
+            except RuntimeError:
+                # The waiter's event loop is closed
+                pass
+
+    def _watch(self):
+        changed = True
+        while True:
+            with self.lock:
+                if not self.waiters:
+                    self._stop_notify()
+                    self.thread = None
+                    self.current = None
+                    return
+            if changed:
+                try:
+                    content = self._paste()
+                except Exception as e:
+                    logger.error(f"Failed to read the clipboard: {str(e)}")
+                    self._broadcast(None, e)
+                    continue
+                self._broadcast(content, None)
+            changed = self._wait_for_next_change()
+
+    def copy(self, text: str):
+        """Write to the clipboard and update the watcher's view of it. Blocks; call it off the event loop."""
+        pyperclip.copy(text)
+        with self.lock:
+            if self.current is not None:
+                self.current = text
+
+
+_watcher: Optional[ClipboardWatcher] = None
+_watcher_lock = threading.Lock()
+
+
+def get_clipboard_watcher() -> ClipboardWatcher:
+    """The process-wide clipboard watcher."""
+    global _watcher
+    if _watcher is None:
+        with _watcher_lock:
+            if _watcher is None:
+                _watcher = ClipboardWatcher()
+    return _watcher
@@ -0,0 +1,165 @@
+import asyncio
+import io
+import logging
+from typing import TYPE_CHECKING, AsyncIterator, List, Optional, Union
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+XCLIP_COMMAND = "xclip"
+
+# Largest payload read from the clipboard unless the caller allows more
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+CHUNK_SIZE = 64 * 1024
+
+MIME_TEXT = "text/plain"
+MIME_UTF8_TEXT = "UTF8_STRING"
+MIME_HTML = "text/html"
+MIME_PNG = "image/png"
+
+
+class ClipboardError(RuntimeError):
+    """Raised when the clipboard cannot be read or written, e.g. a missing target or no xclip."""
+
+
+class ClipboardPayloadTooLarge(ClipboardError):
+    """Raised when a clipboard payload exceeds the allowed size."""
+
+
+class ClipboardContent:
+    """Raw clipboard bytes of one MIME target, decoded to text or a Pillow image on demand."""
+
+    def __init__(self, mime_type: str, data: bytes):
+        self.mime_type = mime_type
+        self.data = data
+        self._image: Optional["Image.Image"] = None
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    @property
+    def text(self) -> str:
+        return self.data.decode("utf-8", errors="replace")
+
+    @property
+    def image(self) -> "Image.Image":
+        """
+        The payload decoded with Pillow. Decoding happens on first access; pixel data is
+        only loaded when the image is actually used.
+
+        Raises:
+            PIL.UnidentifiedImageError: If the payload is not an image Pillow understands
+        """
+        if self._image is None:
+            from PIL import Image
+            self._image = Image.open(io.BytesIO(self.data))
+        return self._image
+
+
+def _selection_args(selection: str) -> List[str]:
+    return [XCLIP_COMMAND, "-selection", selection]
+
+
+async def _spawn(args: List[str], **kwargs) -> asyncio.subprocess.Process:
+    try:
+        return await asyncio.create_subprocess_exec(*args, **kwargs)
+    except FileNotFoundError as e:
+        raise ClipboardError(f"{XCLIP_COMMAND} is required for MIME clipboard access: {str(e)}") from e
+
+
+async def iter_clipboard_bytes(mime_type: str, max_bytes: int = DEFAULT_MAX_BYTES, chunk_size: int = CHUNK_SIZE,
+                               selection: str = "clipboard") -> AsyncIterator[bytes]:
+    """
+    Stream the clipboard's `mime_type` target in chunks of up to `chunk_size` bytes.
+
+    Raises:
+        ClipboardPayloadTooLarge: Once more than `max_bytes` have been read
+        ClipboardError: If the target is not on the clipboard or xclip fails
+    """
+    process = await _spawn(_selection_args(selection) + ["-o", "-t", mime_type],
+                           stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE)
+    total = 0
+    try:
+        while True:
+            chunk = await process.stdout.read(chunk_size)
+            if not chunk:
+                break
+            total += len(chunk)
+            if total > max_bytes:
+                raise ClipboardPayloadTooLarge(
+                    f"Clipboard {mime_type} payload exceeds {max_bytes} bytes")
+            yield chunk
+        stderr = await process.stderr.read()
+        if await process.wait() != 0:
+            raise ClipboardError(f"Failed to read {mime_type} from the clipboard: "
+                                 f"{stderr.decode(errors='replace').strip()}")
+    finally:
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+
+
+async def read_clipboard(mime_type: str, max_bytes: int = DEFAULT_MAX_BYTES,
+                         selection: str = "clipboard") -> ClipboardContent:
+    """
+    Read the clipboard's `mime_type` target, e.g. MIME_PNG or MIME_HTML, as bytes.
+
+    Raises:
+        ClipboardPayloadTooLarge: If the payload exceeds `max_bytes`
+        ClipboardError: If the target is not on the clipboard or xclip fails
+    """
+    buffer = bytearray()
+    async for chunk in iter_clipboard_bytes(mime_type, max_bytes, selection=selection):
+        buffer += chunk
+    return ClipboardContent(mime_type, bytes(buffer))
+
+
+async def read_clipboard_image(max_bytes: int = DEFAULT_MAX_BYTES) -> "Image.Image":
+    """Read a PNG from the clipboard as a Pillow image."""
+    return (await read_clipboard(MIME_PNG, max_bytes)).image
+
+
+async def list_clipboard_targets(selection: str = "clipboard") -> List[str]:
+    """MIME types and X11 targets the current clipboard owner offers."""
+    content = await read_clipboard("TARGETS", max_bytes=1024 * 1024, selection=selection)
+    return [target for target in content.text.splitlines() if target]
+
+
+async def write_clipboard(data: Union[bytes, str], mime_type: str = MIME_TEXT, selection: str = "clipboard"):
+    """
+    Put `data` on the clipboard as `mime_type`. xclip keeps serving it in the background
+    until something else takes the clipboard.
+
+    Raises:
+        ClipboardError: If xclip fails
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    # xclip's background server inherits the output streams, so they must not be pipes we wait on
+    process = await _spawn(_selection_args(selection) + ["-i", "-t", mime_type],
+                           stdin=asyncio.subprocess.PIPE,
+                           stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.DEVNULL)
+    try:
+        for start in range(0, len(data), CHUNK_SIZE):
+            process.stdin.write(data[start:start + CHUNK_SIZE])
+            await process.stdin.drain()
+        process.stdin.close()
+    except (BrokenPipeError, ConnectionResetError) as e:
+        await process.wait()
+        raise ClipboardError(f"Failed to write {mime_type} to the clipboard: {str(e)}") from e
+    if await process.wait() != 0:
+        raise ClipboardError(f"Failed to write {mime_type} to the clipboard: "
+                             f"{XCLIP_COMMAND} exited with code {process.returncode}")
+    logger.debug(f"Wrote {len(data)} bytes of {mime_type} to the clipboard")
+
+
+async def write_clipboard_image(image: "Image.Image"):
+    """Put a Pillow image on the clipboard as a PNG. Encoding runs off the event loop."""
+    def encode() -> bytes:
+        output = io.BytesIO()
+        image.save(output, format="PNG")
+        return output.getvalue()
+
+    await write_clipboard(await asyncio.to_thread(encode), MIME_PNG)
@@ -0,0 +1,121 @@
+import asyncio
+import logging
+import weakref
+from typing import Any, Dict, Optional
+
+from playwright.async_api import Page
+
+logger = logging.getLogger(__name__)
+
+# Binding the page script calls with every piece of copied text
+BINDING_NAME = "__bruiClipboardWrite"
+
+# Routes navigator.clipboard writes and copy/cut events to the binding instead of the OS
+# clipboard. readText() returns the last text written in the page, so copy-then-paste
+# flows keep working without the system clipboard.
+VIRTUAL_CLIPBOARD_SCRIPT = """
+(() => {
+  if (window.__bruiVirtualClipboard) return;
+  const state = window.__bruiVirtualClipboard = { text: "" };
+  const deliver = (text) => {
+    state.text = String(text ?? "");
+    try { window.__bruiClipboardWrite(state.text); } catch (e) {}
+  };
+  const clipboard = {
+    writeText: async (text) => { deliver(text); },
+    readText: async () => state.text,
+    write: async (items) => {
+      for (const item of items || []) {
+        if (item.types && item.types.includes("text/plain")) {
+          deliver(await (await item.getType("text/plain")).text());
+          return;
+        }
+      }
+    },
+    read: async () => [new ClipboardItem({ "text/plain": new Blob([state.text], { type: "text/plain" }) })],
+  };
+  try {
+    Object.defineProperty(navigator, "clipboard", { configurable: true, get: () => clipboard });
+  } catch (e) {}
+  const onCopy = (event) => {
+    // Runs after the page's own handlers, which may have replaced the copied data
+    const text = event.defaultPrevented && event.clipboardData
+      ? event.clipboardData.getData("text/plain")
+      : String(window.getSelection ? window.getSelection() : "");
+    deliver(text);
+  };
+  window.addEventListener("copy", onCopy);
+  window.addEventListener("cut", onCopy);
+})();
+"""
+
+
+class VirtualClipboard:
+    """
+    A clipboard private to one page. Text the page copies, through navigator.clipboard or
+    copy/cut events, is delivered to an asyncio queue instead of the system clipboard, so
+    clipboard-driven flows on different pages run in parallel without xclip or clearing
+    the X clipboard in between.
+
+    Get one with attach_virtual_clipboard().
+    """
+
+    def __init__(self, page: Page):
+        self.page = page
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.last_text: Optional[str] = None
+        self.installed = False
+        self.lock = asyncio.Lock()
+
+    def _on_write(self, source: Dict[str, Any], text: str):
+        self.last_text = text
+        self.queue.put_nowait(text)
+
+    async def install(self):
+        """Expose the binding and install the script for this and every later document of the page."""
+        async with self.lock:
+            if self.installed:
+                return
+            await self.page.expose_binding(BINDING_NAME, self._on_write)
+            await self.page.add_init_script(VIRTUAL_CLIPBOARD_SCRIPT)
+            # Init scripts only run on the next navigation; patch the current document too
+            await self.page.evaluate(VIRTUAL_CLIPBOARD_SCRIPT)
+            self.installed = True
+            logger.debug("Installed virtual clipboard on page")
+
+    async def wait_for_content(self, timeout: Optional[float] = None) -> str:
+        """
+        Return the next text the page copies, or text copied since the last call.
+
+        Raises:
+            asyncio.TimeoutError: If nothing is copied within `timeout` seconds
+        """
+        return await asyncio.wait_for(self.queue.get(), timeout)
+
+    def clear(self):
+        """Drop copied text that has not been consumed yet."""
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        self.last_text = None
+
+    async def set_text(self, text: str):
+        """Set what navigator.clipboard.readText() returns in the page, e.g. before a paste."""
+        await self.page.evaluate("text => { if (window.__bruiVirtualClipboard) window.__bruiVirtualClipboard.text = text; }", text)
+
+
+_clipboards: "weakref.WeakKeyDictionary[Page, VirtualClipboard]" = weakref.WeakKeyDictionary()
+
+
+async def attach_virtual_clipboard(page: Page) -> VirtualClipboard:
+    """
+    Return the page's virtual clipboard, installing it on first use. The clipboard cannot be
+    removed again, so pooled pages should be discarded rather than reused once it is attached;
+    text left over from an earlier call is dropped.
+    """
+    clipboard = _clipboards.get(page)
+    if clipboard is None:
+        clipboard = _clipboards[page] = VirtualClipboard(page)
+    else:
+        clipboard.clear()
+    await clipboard.install()
+    return clipboard
@@ -0,0 +1,68 @@
+import argparse
+import asyncio
+import json
+import logging
+import signal
+import sys
+from typing import List, Optional
+
+from brui_core.daemon.client import DaemonClient
+from brui_core.daemon.protocol import DaemonError
+from brui_core.daemon.server import BrowserDaemon
+
+logger = logging.getLogger(__name__)
+
+
+async def _serve(args: argparse.Namespace):
+    daemon = BrowserDaemon(args.socket, close_browser=not args.keep_browser)
+    await daemon.start()
+    loop = asyncio.get_running_loop()
+    stopping = asyncio.Event()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stopping.set)
+    try:
+        await stopping.wait()
+    finally:
+        await daemon.stop()
+
+
+async def _call(args: argparse.Namespace):
+    async with DaemonClient(args.socket) as client:
+        if args.command == "ping":
+            result = await client.ping()
+        elif args.command == "status":
+            result = await client.status()
+        else:
+            item = json.loads(args.item) if args.item is not None else None
+            result = await client.run(args.task, item)
+    print(json.dumps(result, indent=2))
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="brui-core", description="Shared brui_core browser daemon")
+    parser.add_argument("--socket", help="Unix socket path (default: $BRUI_DAEMON_SOCKET or a per-user runtime socket)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve = commands.add_parser("serve", help="Run the daemon in the foreground")
+    serve.add_argument("--keep-browser", action="store_true", help="Leave Chrome running when the daemon stops")
+    commands.add_parser("ping", help="Check that the daemon is up")
+    commands.add_parser("status", help="Show page scheduler statistics")
+    run = commands.add_parser("run", help="Run a task on a warm page and print its result")
+    run.add_argument("task", help="Task as 'module:function', an async function(page, item)")
+    run.add_argument("item", nargs="?", help="JSON-encoded item passed to the task")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    try:
+        asyncio.run(_serve(args) if args.command == "serve" else _call(args))
+    except DaemonError as e:
+        print(f"brui-core: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
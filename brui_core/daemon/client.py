@@ -0,0 +1,99 @@
+import asyncio
+import itertools
+from typing import Any, Dict, Optional
+
+from brui_core.daemon.protocol import (
+    MAX_MESSAGE_BYTES,
+    DaemonError,
+    decode_message,
+    default_socket_path,
+    encode_message,
+)
+
+
+class DaemonClient:
+    """
+    Thin client of a running brui-core daemon. Requests on one client are sent one at a
+    time; open several clients for concurrent work.
+
+    Usage:
+        async with DaemonClient() as client:
+            title = await client.run("myjobs.tasks:read_title", "https://example.com")
+    """
+
+    def __init__(self, socket_path: Optional[str] = None):
+        self.socket_path = socket_path or default_socket_path()
+        self.reader: Optional[asyncio.StreamReader] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+        self.request_ids = itertools.count(1)
+        self.lock = asyncio.Lock()
+
+    async def connect(self):
+        """
+        Raises:
+            DaemonError: If no daemon is listening on the socket
+        """
+        try:
+            self.reader, self.writer = await asyncio.open_unix_connection(
+                self.socket_path, limit=MAX_MESSAGE_BYTES
+            )
+        except (FileNotFoundError, ConnectionRefusedError) as e:
+            raise DaemonError(f"No brui-core daemon listening on {self.socket_path}: {str(e)}") from e
+
+    async def close(self):
+        """Disconnect. Pages still leased by this client are returned by the daemon."""
+        if self.writer is not None:
+            self.writer.close()
+            try:
+                await self.writer.wait_closed()
+            except ConnectionError:
+                pass
+            self.reader = self.writer = None
+
+    async def __aenter__(self) -> "DaemonClient":
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def request(self, op: str, **params) -> Any:
+        """
+        Send one request and return its result.
+
+        Raises:
+            DaemonError: If the daemon reports an error or the connection is lost
+        """
+        if self.writer is None:
+            await self.connect()
+        async with self.lock:
+            request_id = next(self.request_ids)
+            self.writer.write(encode_message({"id": request_id, "op": op, **params}))
+            await self.writer.drain()
+            line = await self.reader.readline()
+        if not line:
+            raise DaemonError("The brui-core daemon closed the connection")
+        response = decode_message(line)
+        if not response.get("ok"):
+            raise DaemonError(response.get("error", "Unknown daemon error"), response.get("type"))
+        return response.get("result")
+
+    async def ping(self) -> Dict[str, Any]:
+        return await self.request("ping")
+
+    async def status(self) -> Dict[str, Any]:
+        return await self.request("status")
+
+    async def run(self, task: str, item: Any = None) -> Any:
+        """Run the daemon-side task "module:function" as `function(page, item)` on a warm page."""
+        return await self.request("run", task=task, item=item)
+
+    async def lease_page(self, deadline: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Lease a warm page. The result holds "lease_id", "target_id" and "page_ws_url", the
+        page's DevTools websocket for driving it over CDP.
+        """
+        return await self.request("lease_page", deadline=deadline)
+
+    async def release_page(self, lease_id: str):
+        await self.request("release_page", lease_id=lease_id)
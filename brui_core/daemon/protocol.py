@@ -0,0 +1,44 @@
+import json
+import os
+import tempfile
+from typing import Any, Dict, Optional
+
+# Environment variable overriding where the daemon listens
+SOCKET_ENV = "BRUI_DAEMON_SOCKET"
+
+# Upper bound on one newline-delimited JSON message, in either direction
+MAX_MESSAGE_BYTES = 16 * 1024 * 1024
+
+
+class DaemonError(Exception):
+    """An error reported by the daemon for a request, or a broken daemon connection."""
+
+    def __init__(self, message: str, error_type: Optional[str] = None):
+        super().__init__(message)
+        self.error_type = error_type
+
+
+def default_socket_path() -> str:
+    """BRUI_DAEMON_SOCKET, else a per-user socket in $XDG_RUNTIME_DIR (or the temp dir)."""
+    if os.environ.get(SOCKET_ENV):
+        return os.environ[SOCKET_ENV]
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return os.path.join(runtime_dir, f"brui-core-{os.getuid()}.sock")
+
+
+def encode_message(message: Dict[str, Any]) -> bytes:
+    """Encode one message as a line of JSON."""
+    return json.dumps(message, separators=(",", ":")).encode() + b"\n"
+
+
+def decode_message(line: bytes) -> Dict[str, Any]:
+    """
+    Decode one line of JSON into a message.
+
+    Raises:
+        ValueError: If the line is not a JSON object
+    """
+    message = json.loads(line)
+    if not isinstance(message, dict):
+        raise ValueError("Daemon messages must be JSON objects")
+    return message
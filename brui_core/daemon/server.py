@@ -0,0 +1,275 @@
+import asyncio
+import importlib
+import itertools
+import logging
+import os
+import stat
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from playwright.async_api import Page
+
+from brui_core.daemon.protocol import (
+    MAX_MESSAGE_BYTES,
+    DaemonError,
+    decode_message,
+    default_socket_path,
+    encode_message,
+)
+from brui_core.ui_integrator import PageTask, UIIntegrator
+
+logger = logging.getLogger(__name__)
+
+
+def resolve_task(spec: str) -> PageTask:
+    """
+    Resolve "package.module:function" to the async `function(page, item)` to run.
+
+    Raises:
+        ValueError: If the spec is malformed or does not name a callable
+    """
+    module_name, _, attribute = spec.partition(":")
+    if not module_name or not attribute:
+        raise ValueError(f"Task must be given as 'module:function', got {spec!r}")
+    target: Any = importlib.import_module(module_name)
+    for name in attribute.split("."):
+        target = getattr(target, name)
+    if not callable(target):
+        raise ValueError(f"Task {spec!r} is not callable")
+    return target
+
+
+class _Lease:
+    __slots__ = ("page", "granted_at")
+
+    def __init__(self, page: Page, granted_at: float):
+        self.page = page
+        self.granted_at = granted_at
+
+
+class BrowserDaemon:
+    """
+    Long-lived owner of a browser, its Playwright driver and its page pool, serving
+    short-lived clients over a Unix socket with newline-delimited JSON.
+
+    Each request is {"id": ..., "op": ..., ...}; each response carries the same id and
+    either {"ok": true, "result": ...} or {"ok": false, "error": ..., "type": ...}.
+
+    Operations:
+        ping: Liveness check.
+        status: Page scheduler statistics and open leases.
+        run: Run the task "module:function" as `await function(page, item)` on a pooled
+            page and return its JSON-serializable result.
+        lease_page: Lease a pooled page to the client and return its CDP target id and
+            page websocket URL, for clients driving the page over CDP themselves.
+        release_page: Return a leased page. Leases are also returned when the client disconnects.
+
+    The socket is created with mode 0600; anyone who can connect can run code in the daemon.
+    """
+
+    def __init__(self, socket_path: Optional[str] = None, close_browser: bool = True,
+                 integrator_factory: Callable[..., UIIntegrator] = UIIntegrator):
+        """
+        Args:
+            socket_path: Unix socket to listen on. Defaults to default_socket_path().
+            close_browser: Terminate the browser when the daemon stops.
+            integrator_factory: Creates the daemon's UIIntegrator.
+        """
+        self.socket_path = socket_path or default_socket_path()
+        self.close_browser = close_browser
+        self.integrator = integrator_factory(use_page_pool=True)
+        self.server: Optional[asyncio.AbstractServer] = None
+        self.leases: Dict[str, _Lease] = {}
+        self.lease_ids = itertools.count(1)
+        self.tasks: Dict[str, PageTask] = {}
+        self.handlers: Dict[str, Callable[[Dict[str, Any], set], Awaitable[Any]]] = {
+            "ping": self.op_ping,
+            "status": self.op_status,
+            "run": self.op_run,
+            "lease_page": self.op_lease_page,
+            "release_page": self.op_release_page,
+        }
+
+    async def start(self):
+        """
+        Start the browser and the page pool, then listen on the socket.
+
+        Raises:
+            DaemonError: If another daemon is already listening on the socket, or the
+                socket path is taken by something that is not a socket
+        """
+        await self._remove_stale_socket()
+        await self.integrator.initialize()
+        old_umask = os.umask(0o177)
+        try:
+            self.server = await asyncio.start_unix_server(
+                self.handle_client, path=self.socket_path, limit=MAX_MESSAGE_BYTES
+            )
+        finally:
+            os.umask(old_umask)
+        logger.info(f"brui-core daemon listening on {self.socket_path}")
+
+    async def _remove_stale_socket(self):
+        try:
+            mode = os.lstat(self.socket_path).st_mode
+        except FileNotFoundError:
+            return
+        if not stat.S_ISSOCK(mode):
+            # Connecting to a regular file is refused too; never delete what is not a socket
+            raise DaemonError(f"{self.socket_path} exists and is not a socket")
+        try:
+            _, writer = await asyncio.open_unix_connection(self.socket_path)
+        except ConnectionRefusedError:
+            # Nobody is listening: a daemon that did not shut down cleanly left it behind
+            logger.info(f"Removing stale daemon socket {self.socket_path}")
+            os.unlink(self.socket_path)
+            return
+        except FileNotFoundError:
+            return
+        writer.close()
+        raise DaemonError(f"A brui-core daemon is already listening on {self.socket_path}")
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        # Lease ids taken on this connection, returned when it goes away
+        client_leases: set = set()
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (ValueError, asyncio.LimitOverrunError):
+                    writer.write(encode_message({"id": None, "ok": False, "error": "Message too large",
+                                                 "type": "ValueError"}))
+                    break
+                if not line:
+                    break
+                writer.write(encode_message(await self.dispatch(line, client_leases)))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            for lease_id in list(client_leases):
+                await self.release_lease(lease_id)
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def dispatch(self, line: bytes, client_leases: set) -> Dict[str, Any]:
+        request_id = None
+        try:
+            request = decode_message(line)
+            request_id = request.get("id")
+            handler = self.handlers.get(request.get("op"))
+            if handler is None:
+                raise ValueError(f"Unknown op {request.get('op')!r}")
+            result = await handler(request, client_leases)
+            response = {"id": request_id, "ok": True, "result": result}
+            # Fail here rather than in the writer if the task returned something unserializable
+            encode_message(response)
+            return response
+        except Exception as e:
+            logger.debug(f"Daemon request {request_id} failed: {e!r}")
+            return {"id": request_id, "ok": False, "error": str(e), "type": type(e).__name__}
+
+    async def op_ping(self, request: Dict[str, Any], client_leases: set) -> Dict[str, Any]:
+        return {"pid": os.getpid()}
+
+    async def op_status(self, request: Dict[str, Any], client_leases: set) -> Dict[str, Any]:
+        stats = self.integrator.browser_manager.page_scheduler.stats()
+        return {
+            "pid": os.getpid(),
+            "leases": len(self.leases),
+            "scheduler": {
+                "running": stats.running,
+                "queue_depth": stats.queue_depth,
+                "admitted": stats.admitted,
+                "rejected": stats.rejected,
+                "mean_wait": stats.mean_wait,
+                "max_wait": stats.max_wait,
+            },
+        }
+
+    async def op_run(self, request: Dict[str, Any], client_leases: set) -> Any:
+        spec = request.get("task")
+        if not isinstance(spec, str):
+            raise ValueError("run needs a 'task' of the form 'module:function'")
+        task = self.tasks.get(spec)
+        if task is None:
+            task = self.tasks[spec] = resolve_task(spec)
+        return await self.integrator.run(task, request.get("item"))
+
+    def _page_endpoint(self) -> Tuple[str, int]:
+        manager = self.integrator.browser_manager
+        if manager.endpoint is not None:
+            return manager.endpoint.host, manager.endpoint.port
+        return "127.0.0.1", manager.remote_debugging_port
+
+    async def op_lease_page(self, request: Dict[str, Any], client_leases: set) -> Dict[str, Any]:
+        integrator = self.integrator
+        scheduler = integrator.browser_manager.page_scheduler
+        # Leases are taken on behalf of the daemon's integrator, which already holds a slot
+        granted_at = await scheduler.acquire(integrator.priority, request.get("deadline"),
+                                             exempt=integrator.slot_granted_at is not None)
+        try:
+            page_pool = integrator.browser_manager.get_page_pool(integrator.context)
+            page = await page_pool.acquire()
+        except BaseException:
+            scheduler.release(granted_at)
+            raise
+        lease_id = str(next(self.lease_ids))
+        self.leases[lease_id] = _Lease(page, granted_at)
+        client_leases.add(lease_id)
+
+        try:
+            session = await page.context.new_cdp_session(page)
+            try:
+                target_id = (await session.send("Target.getTargetInfo"))["targetInfo"]["targetId"]
+            finally:
+                await session.detach()
+        except BaseException:
+            client_leases.discard(lease_id)
+            await self.release_lease(lease_id)
+            raise
+        host, port = self._page_endpoint()
+        return {
+            "lease_id": lease_id,
+            "target_id": target_id,
+            "page_ws_url": f"ws://{host}:{port}/devtools/page/{target_id}",
+        }
+
+    async def op_release_page(self, request: Dict[str, Any], client_leases: set) -> Dict[str, Any]:
+        lease_id = request.get("lease_id")
+        if lease_id not in client_leases:
+            raise ValueError(f"Unknown lease {lease_id!r}")
+        client_leases.discard(lease_id)
+        await self.release_lease(lease_id)
+        return {"lease_id": lease_id}
+
+    async def release_lease(self, lease_id: str):
+        lease = self.leases.pop(lease_id, None)
+        if lease is None:
+            return
+        manager = self.integrator.browser_manager
+        try:
+            await manager.get_page_pool(self.integrator.context).release(
+                lease.page, clear_storage=self.integrator.clear_page_storage)
+        finally:
+            manager.page_scheduler.release(lease.granted_at)
+
+    async def stop(self):
+        """Stop listening, return every lease and shut the browser down (unless close_browser is off)."""
+        listening = self.server is not None
+        if listening:
+            self.server.close()
+            await self.server.wait_closed()
+            self.server = None
+        for lease_id in list(self.leases):
+            await self.release_lease(lease_id)
+        # Without a server of ours, the socket (if any) belongs to another daemon
+        if listening:
+            try:
+                os.unlink(self.socket_path)
+            except FileNotFoundError:
+                pass
+        await self.integrator.close(close_browser=self.close_browser)
+        logger.info("brui-core daemon stopped")
@@ -0,0 +1,27 @@
+from PIL import Image
+
+# 8x8 difference hash: 64 bits, robust to scaling and compression noise
+DEFAULT_HASH_SIZE = 8
+
+
+def dhash(image: Image.Image, hash_size: int = DEFAULT_HASH_SIZE) -> int:
+    """
+    Difference hash of an image: shrink it to (hash_size + 1) x hash_size grayscale pixels
+    and record, row by row, whether each pixel is brighter than its right neighbour.
+    Visually identical frames hash equal; small changes flip few bits.
+    """
+    # Shrinking first keeps the grayscale conversion cheap for full-size screenshots
+    small = image.resize((hash_size + 1, hash_size), Image.Resampling.BILINEAR, reducing_gap=2.0).convert("L")
+    pixels = small.tobytes()
+    width = hash_size + 1
+    bits = 0
+    for row in range(hash_size):
+        offset = row * width
+        for col in range(hash_size):
+            bits = (bits << 1) | (pixels[offset + col] > pixels[offset + col + 1])
+    return bits
+
+
+def hamming_distance(first: int, second: int) -> int:
+    """Number of differing bits between two hashes."""
+    return (first ^ second).bit_count()
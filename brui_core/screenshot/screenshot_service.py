@@ -0,0 +1,313 @@
+import asyncio
+import base64
+import io
+import itertools
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Dict, NamedTuple, Optional, Tuple
+
+from PIL import Image
+from playwright.async_api import CDPSession, Page
+
+from brui_core.screenshot.image_hash import dhash, hamming_distance
+
+logger = logging.getLogger(__name__)
+
+# Pillow releases the GIL while decoding, resizing and encoding, so a few threads go a long way
+IMAGE_WORKERS = min(4, os.cpu_count() or 1)
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_image_executor() -> ThreadPoolExecutor:
+    """Thread pool shared by every ScreenshotService for image and file work."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=IMAGE_WORKERS, thread_name_prefix="brui-image")
+    return _executor
+
+
+class Screenshot(NamedTuple):
+    """One captured frame."""
+    data: bytes
+    hash: int
+    width: int
+    height: int
+    captured_at: float
+    # Where the frame was written, if it was
+    path: Optional[str] = None
+
+
+def _process_frame(encoded: str, max_width: Optional[int], image_format: str,
+                   quality: Optional[int]) -> Tuple[bytes, int, int, int]:
+    """Decode a base64 CDP frame, hash it and, if needed, resize and re-encode it. Runs in the image pool."""
+    data = base64.b64decode(encoded)
+    image = Image.open(io.BytesIO(data))
+    image.load()
+    frame_hash = dhash(image)
+    source_format = (image.format or "").lower()
+    if max_width and image.width > max_width:
+        height = max(1, round(image.height * max_width / image.width))
+        image = image.resize((max_width, height), Image.Resampling.LANCZOS)
+    elif source_format == image_format:
+        return data, frame_hash, image.width, image.height
+
+    output = io.BytesIO()
+    if image_format == "jpeg":
+        image.convert("RGB").save(output, format="JPEG", quality=quality or 80)
+    else:
+        image.save(output, format=image_format.upper())
+    return output.getvalue(), frame_hash, image.width, image.height
+
+
+def _hash_frame(encoded: str) -> int:
+    return dhash(Image.open(io.BytesIO(base64.b64decode(encoded))))
+
+
+def _write_file(path: str, data: bytes):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    # Write-then-rename, so a reader never sees a half-written frame
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "wb") as f:
+        f.write(data)
+    os.replace(temp_path, path)
+
+
+class _Screencast:
+    """
+    A running Page.startScreencast, from which frames are taken one at a time. Each screencast
+    has a CDP session of its own, so concurrent screencasts of a page never receive, acknowledge
+    or stop each other's frames.
+    """
+
+    def __init__(self, page: Page, max_width: Optional[int], max_height: Optional[int],
+                 every_nth_frame: int):
+        self.page = page
+        self.session: Optional[CDPSession] = None
+        self.params: Dict[str, Any] = {"format": "png", "everyNthFrame": every_nth_frame}
+        if max_width:
+            self.params["maxWidth"] = max_width
+        if max_height:
+            self.params["maxHeight"] = max_height
+        self.frames: asyncio.Queue = asyncio.Queue()
+
+    def _on_frame(self, frame: Dict[str, Any]):
+        self.frames.put_nowait(frame)
+
+    async def __aenter__(self) -> "_Screencast":
+        self.session = await self.page.context.new_cdp_session(self.page)
+        self.session.on("Page.screencastFrame", self._on_frame)
+        try:
+            await self.session.send("Page.startScreencast", self.params)
+        except BaseException:
+            await self._detach()
+            raise
+        return self
+
+    async def next_frame(self, timeout: Optional[float] = None) -> str:
+        """
+        Return the next frame's base64 data.
+
+        Raises:
+            asyncio.TimeoutError: If Chrome paints nothing within `timeout` seconds
+        """
+        # Only the wait is bounded; once a frame is taken it is always acknowledged
+        frame = await asyncio.wait_for(self.frames.get(), timeout)
+        # Acknowledge before processing, so Chrome prepares the next frame meanwhile
+        await self.session.send("Page.screencastFrameAck", {"sessionId": frame["sessionId"]})
+        return frame["data"]
+
+    async def __aexit__(self, *exc_info):
+        try:
+            await self.session.send("Page.stopScreencast")
+        except Exception as e:
+            logger.debug(f"Failed to stop screencast: {str(e)}")
+        await self._detach()
+
+    async def _detach(self):
+        self.session.remove_listener("Page.screencastFrame", self._on_frame)
+        try:
+            await self.session.detach()
+        except Exception as e:
+            logger.debug(f"Failed to detach screencast CDP session: {str(e)}")
+
+
+class ScreenshotService:
+    """
+    Captures a page through CDP (Page.captureScreenshot, or Page.startScreencast for a
+    continuous stream) and keeps the event loop free: base64 and Pillow decoding, hashing,
+    resizing, encoding and file writes all run in a shared thread pool.
+
+    Frames whose perceptual hash is within `dedupe_threshold` bits of the previous kept
+    frame are skipped, so monitoring a page that is not changing costs no disk writes.
+    """
+
+    def __init__(self, page: Page, output_dir: Optional[str] = None, image_format: str = "png",
+                 quality: Optional[int] = None, max_width: Optional[int] = None,
+                 dedupe: bool = True, dedupe_threshold: int = 0, prefix: str = "frame",
+                 executor: Optional[ThreadPoolExecutor] = None):
+        """
+        Args:
+            page: Page to capture.
+            output_dir: If set, kept frames are written here as `{prefix}-{n:06d}.{ext}`.
+            image_format: "png" or "jpeg".
+            quality: JPEG quality.
+            max_width: Downscale wider frames to this width.
+            dedupe: Skip frames that look like the previous kept frame.
+            dedupe_threshold: Hash bits that may differ for a frame to count as a duplicate.
+            prefix: File name prefix.
+            executor: Thread pool for image and file work. Defaults to get_image_executor().
+        """
+        if image_format not in ("png", "jpeg"):
+            raise ValueError(f"Unsupported image_format {image_format!r}; expected 'png' or 'jpeg'")
+        self.page = page
+        self.output_dir = output_dir
+        self.image_format = image_format
+        self.quality = quality
+        self.max_width = max_width
+        self.dedupe = dedupe
+        self.dedupe_threshold = dedupe_threshold
+        self.prefix = prefix
+        self.executor = executor
+        self.session: Optional[CDPSession] = None
+        self.session_lock = asyncio.Lock()
+        self.last_hash: Optional[int] = None
+        self.sequence = itertools.count(1)
+        self.captured = 0
+        self.skipped = 0
+
+    async def _session(self) -> CDPSession:
+        if self.session is None:
+            async with self.session_lock:
+                if self.session is None:
+                    self.session = await self.page.context.new_cdp_session(self.page)
+        return self.session
+
+    async def _in_pool(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.executor or get_image_executor(), func, *args)
+
+    def _is_duplicate(self, frame_hash: int) -> bool:
+        return (self.dedupe and self.last_hash is not None
+                and hamming_distance(frame_hash, self.last_hash) <= self.dedupe_threshold)
+
+    async def _handle_frame(self, encoded: str, path: Optional[str]) -> Optional[Screenshot]:
+        captured_at = time.time()
+        data, frame_hash, width, height = await self._in_pool(
+            _process_frame, encoded, self.max_width, self.image_format, self.quality
+        )
+        if self._is_duplicate(frame_hash):
+            self.skipped += 1
+            return None
+        self.last_hash = frame_hash
+        self.captured += 1
+        if path is None and self.output_dir is not None:
+            extension = "jpg" if self.image_format == "jpeg" else "png"
+            path = os.path.join(self.output_dir, f"{self.prefix}-{next(self.sequence):06d}.{extension}")
+        if path is not None:
+            await self._in_pool(_write_file, path, data)
+        return Screenshot(data, frame_hash, width, height, captured_at, path)
+
+    async def capture(self, path: Optional[str] = None, full_page: bool = False) -> Optional[Screenshot]:
+        """
+        Capture the page once.
+
+        Args:
+            path: File to write the frame to. Defaults to the next file in output_dir, if set.
+            full_page: Capture the whole scrollable page instead of the viewport.
+
+        Returns:
+            The frame, or None if it was skipped as a duplicate of the previous one.
+        """
+        session = await self._session()
+        params: Dict[str, Any] = {"format": "png", "captureBeyondViewport": full_page}
+        if full_page:
+            metrics = await session.send("Page.getLayoutMetrics")
+            size = metrics["cssContentSize"]
+            params["clip"] = {"x": 0, "y": 0, "width": size["width"], "height": size["height"], "scale": 1}
+        result = await session.send("Page.captureScreenshot", params)
+        return await self._handle_frame(result["data"], path)
+
+    async def screencast(self, max_width: Optional[int] = None, max_height: Optional[int] = None,
+                         every_nth_frame: int = 1) -> AsyncIterator[Screenshot]:
+        """
+        Stream frames as Chrome paints them, yielding each frame that is not a duplicate.
+        Chrome only sends a frame when the page changes, and waits for each frame to be
+        acknowledged, so a slow consumer throttles the stream instead of queueing frames.
+
+        Args:
+            max_width: Largest frame width Chrome should send.
+            max_height: Largest frame height Chrome should send.
+            every_nth_frame: Only send every n-th painted frame.
+        """
+        async with _Screencast(self.page, max_width, max_height, every_nth_frame) as frames:
+            while True:
+                screenshot = await self._handle_frame(await frames.next_frame(), None)
+                if screenshot is not None:
+                    yield screenshot
+
+    async def wait_for_stability(self, stable_frames: int = 3, quiet_period: float = 0.3,
+                                 timeout: float = 10.0, threshold: int = 0, max_width: int = 320,
+                                 max_height: int = 240) -> float:
+        """
+        Wait until the page stops changing visually, watching a low-resolution screencast.
+
+        The page counts as stable once `stable_frames` consecutive frames hash within
+        `threshold` bits of each other, or once no new frame has been painted for
+        `quiet_period` seconds (Chrome sends no frames while nothing repaints). Chrome may
+        send no frame at all for a page that is already static, so if none arrives within
+        `quiet_period` a single screenshot is taken as the first frame instead.
+
+        Returns:
+            Seconds it took for the page to settle.
+
+        Raises:
+            asyncio.TimeoutError: If the page is still changing after `timeout` seconds
+        """
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        deadline = started + timeout
+        last_hash: Optional[int] = None
+        matches = 0
+        async with _Screencast(self.page, max_width, max_height, 1) as frames:
+            while True:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    raise asyncio.TimeoutError(f"Page did not settle within {timeout}s")
+                try:
+                    encoded = await frames.next_frame(min(remaining, quiet_period))
+                except asyncio.TimeoutError:
+                    if loop.time() >= deadline:
+                        raise asyncio.TimeoutError(f"Page did not settle within {timeout}s") from None
+                    if last_hash is not None:
+                        # Nothing repainted for quiet_period
+                        return loop.time() - started
+                    # No first frame from the screencast; take the baseline with a screenshot
+                    result = await frames.session.send("Page.captureScreenshot", {"format": "png"})
+                    last_hash = await self._in_pool(_hash_frame, result["data"])
+                    matches = 1
+                    continue
+                frame_hash = await self._in_pool(_hash_frame, encoded)
+                if last_hash is not None and hamming_distance(frame_hash, last_hash) <= threshold:
+                    matches += 1
+                else:
+                    matches = 1
+                last_hash = frame_hash
+                if matches >= stable_frames:
+                    return loop.time() - started
+
+    async def close(self):
+        """Detach the CDP session used by capture()."""
+        session, self.session = self.session, None
+        if session is not None:
+            try:
+                await session.detach()
+            except Exception as e:
+                logger.debug(f"Failed to detach screenshot CDP session: {str(e)}")
@@ -0,0 +1,307 @@
+import asyncio
+import itertools
+import logging
+import multiprocessing
+import os
+import pickle
+import queue
+import tempfile
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from brui_core.browser.browser_config import load_browser_config
+from brui_core.ui_integrator import BatchResult, PageTask, UIIntegrator
+
+logger = logging.getLogger(__name__)
+
+# How often the parent checks on worker processes while waiting for results
+WORKER_POLL_INTERVAL = 0.5
+
+
+class WorkerCrashed(RuntimeError):
+    """Reported for items that were running on a worker process that died."""
+
+
+class WorkerStartFailed(RuntimeError):
+    """Raised when no worker process could start its browser."""
+
+
+def _portable_error(error: BaseException) -> BaseException:
+    """Return `error` if it survives pickling, otherwise a RuntimeError describing it."""
+    try:
+        pickle.loads(pickle.dumps(error))
+        return error
+    except Exception:
+        return RuntimeError(f"{type(error).__name__}: {error}")
+
+
+def _run_worker(worker_index: int, env: Dict[str, str], task: PageTask, task_queue, result_queue,
+                concurrency: int, integrator_factory: Callable[..., UIIntegrator]):
+    """Entry point of a worker process."""
+    # Before anything reads the configuration, so this worker's browser gets its own port and profile
+    os.environ.update(env)
+    asyncio.run(_worker_main(worker_index, task, task_queue, result_queue, concurrency, integrator_factory))
+
+
+async def _worker_main(worker_index: int, task: PageTask, task_queue, result_queue, concurrency: int,
+                       integrator_factory: Callable[..., UIIntegrator]):
+    integrator = integrator_factory(use_page_pool=True)
+    try:
+        await integrator.initialize()
+    except Exception as e:
+        logger.error(f"Worker {worker_index} failed to start its browser: {str(e)}")
+        result_queue.put(("failed", worker_index, _portable_error(e)))
+        return
+    result_queue.put(("ready", worker_index, None))
+
+    loop = asyncio.get_running_loop()
+
+    async def assigned_items():
+        # Every item on this queue was recorded as assigned to this worker when the parent put it there
+        while True:
+            message = await loop.run_in_executor(None, task_queue.get)
+            if message is None:
+                return
+            yield message
+
+    async def run_item(page, message):
+        return await task(page, message[2])
+
+    try:
+        async for result in integrator.map(run_item, assigned_items(), concurrency=concurrency):
+            generation, index, item = result.input
+            error = _portable_error(result.error) if result.error is not None else None
+            result_queue.put(("result", worker_index, (generation, BatchResult(index, item, result.value, error))))
+    finally:
+        await integrator.close(close_browser=True)
+
+
+class ShardedRunner:
+    """
+    Runs a page task over many inputs in a pool of worker processes, each owning its own
+    BrowserManager and Chrome on a distinct debugging port and profile, so CPU-bound
+    Python work in tasks scales with cores instead of sharing one GIL.
+
+    Each worker has its own input queue, kept at most `2 * concurrency_per_worker` items
+    deep, and the parent hands the next input to the ready worker with the fewest items
+    outstanding, so faster workers take more of the work. Because the parent records
+    which worker holds each item, an item is never lost when a worker dies. Results and
+    failures come back to the parent as BatchResults in completion order. The workers
+    stay up between map() calls; every call is tagged with its own generation, so results
+    of an earlier call that was abandoned are dropped instead of being mistaken for its own.
+    Workers use the spawn start method, so `task` must be a module-level async function
+    `task(page, item)`, and inputs, results and task errors must be picklable.
+    """
+
+    def __init__(self, task: PageTask, workers: Optional[int] = None, concurrency_per_worker: int = 4,
+                 base_port: Optional[int] = None, user_data_root: Optional[str] = None,
+                 profile_template_dir: Optional[str] = None,
+                 integrator_factory: Callable[..., UIIntegrator] = UIIntegrator):
+        """
+        Args:
+            task: Module-level `async def task(page, item)`.
+            workers: Number of worker processes. Defaults to the CPU count.
+            concurrency_per_worker: Pages each worker runs at once.
+            base_port: Debugging port of worker 0; the others use consecutive ports, or every
+                other port when hot spares are configured (a worker's standby takes its port + 1).
+                Defaults to the configured pool base port, else the first port after the
+                configured debugging port and its standby.
+            user_data_root: Directory holding one user data dir per worker. Defaults to a temp dir.
+            profile_template_dir: If set, every worker's Chrome runs on a fresh clone of this template.
+            integrator_factory: Creates each worker's UIIntegrator; must be picklable.
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError("ShardedRunner needs at least one worker")
+        config = load_browser_config()
+        # Workers inherit CHROME_HOT_SPARE, and a standby runs on its primary's port + 1
+        self.port_stride = 2 if config.hot_spare else 1
+        if base_port is None:
+            # Stay clear of the parent's own browser (and its standby) on the configured port
+            base_port = config.pool_base_port or config.remote_debugging_port + self.port_stride
+        self.task = task
+        self.workers = workers
+        self.concurrency_per_worker = concurrency_per_worker
+        self.base_port = base_port
+        self.user_data_root = user_data_root
+        self.profile_template_dir = profile_template_dir
+        self.integrator_factory = integrator_factory
+        self.context = multiprocessing.get_context("spawn")
+        self.task_queues: List[Any] = []
+        self.result_queue = None
+        self.processes: List[multiprocessing.Process] = []
+        self.started = False
+        # Worker state outlives a single map() call; workers only announce themselves once
+        self.ready: Set[int] = set()
+        self.alive: Set[int] = set()
+        self.failed_starts: List[BaseException] = []
+        # (generation, index) of the items put on each worker's queue and not yet answered
+        self.assigned: Dict[int, Set[Tuple[int, int]]] = {}
+        self.generations = itertools.count()
+
+    def worker_port(self, worker_index: int) -> int:
+        """Debugging port of a worker's browser."""
+        return self.base_port + worker_index * self.port_stride
+
+    def _worker_env(self, worker_index: int) -> Dict[str, str]:
+        env = {"CHROME_REMOTE_DEBUGGING_PORT": str(self.worker_port(worker_index))}
+        if self.profile_template_dir:
+            env["CHROME_PROFILE_TEMPLATE_DIR"] = self.profile_template_dir
+        else:
+            env["CHROME_USER_DATA_DIR"] = os.path.join(self.user_data_root, f"worker-{worker_index}")
+        return env
+
+    def start(self):
+        """Spawn the worker processes. Called by map() if needed."""
+        if self.started:
+            return
+        if self.user_data_root is None and not self.profile_template_dir:
+            # Chrome refuses remote debugging on the default profile, so every worker needs its own dir
+            self.user_data_root = tempfile.mkdtemp(prefix="brui-shards-")
+        self.ready = set()
+        self.alive = set(range(self.workers))
+        self.failed_starts = []
+        self.assigned = {i: set() for i in range(self.workers)}
+        self.task_queues = [self.context.Queue() for _ in range(self.workers)]
+        self.result_queue = self.context.Queue()
+        self.processes = [
+            self.context.Process(
+                target=_run_worker,
+                args=(i, self._worker_env(i), self.task, self.task_queues[i], self.result_queue,
+                      self.concurrency_per_worker, self.integrator_factory),
+                name=f"brui-shard-{i}",
+                daemon=True,
+            )
+            for i in range(self.workers)
+        ]
+        for process in self.processes:
+            process.start()
+        self.started = True
+        logger.info(f"ShardedRunner started {self.workers} workers on ports "
+                    f"{self.base_port}-{self.worker_port(self.workers - 1)}")
+
+    def map(self, inputs: Iterable[Any]) -> Iterator[BatchResult]:
+        """
+        Run the task over `inputs`, yielding a BatchResult per input in completion order.
+
+        Inputs are fed lazily, keeping only a bounded number in flight, so memory stays flat.
+        Items assigned to a worker that died are reported with WorkerCrashed; items assigned
+        to a worker that failed to start are handed to the other workers.
+
+        Raises:
+            WorkerStartFailed: If every worker failed to start its browser.
+        """
+        self.start()
+        max_outstanding = self.concurrency_per_worker * 2
+        generation = next(self.generations)
+        iterator = enumerate(inputs)
+        pending: Dict[int, Any] = {}
+        # Items taken back from workers that failed to start, handed out before new inputs
+        retry: List[int] = []
+        exhausted = False
+
+        def next_index() -> Optional[int]:
+            nonlocal exhausted
+            if retry:
+                return retry.pop()
+            if exhausted:
+                return None
+            try:
+                index, item = next(iterator)
+            except StopIteration:
+                exhausted = True
+                return None
+            pending[index] = item
+            return index
+
+        def own_items(worker_index: int) -> List[int]:
+            return sorted(index for item_generation, index in self.assigned[worker_index]
+                          if item_generation == generation and index in pending)
+
+        while True:
+            while self.ready:
+                worker_index = min(self.ready, key=lambda i: len(self.assigned[i]))
+                if len(self.assigned[worker_index]) >= max_outstanding:
+                    break
+                index = next_index()
+                if index is None:
+                    break
+                self.assigned[worker_index].add((generation, index))
+                self.task_queues[worker_index].put((generation, index, pending[index]))
+            if len(self.failed_starts) == self.workers:
+                raise WorkerStartFailed(f"No worker could start its browser: {self.failed_starts[0]}")
+            if not self.alive:
+                for index, item in sorted(pending.items()):
+                    yield BatchResult(index, item, error=WorkerCrashed("no live worker processes left"))
+                return
+            if not pending and exhausted:
+                return
+
+            try:
+                kind, worker_index, payload = self.result_queue.get(timeout=WORKER_POLL_INTERVAL)
+            except queue.Empty:
+                for worker_index in list(self.alive):
+                    process = self.processes[worker_index]
+                    if not process.is_alive():
+                        self.alive.discard(worker_index)
+                        self.ready.discard(worker_index)
+                        logger.error(f"Worker {worker_index} exited with code {process.exitcode}")
+                        for index in own_items(worker_index):
+                            yield BatchResult(index, pending.pop(index), error=WorkerCrashed(
+                                f"worker {worker_index} exited with code {process.exitcode}"))
+                        self.assigned[worker_index].clear()
+                continue
+
+            if kind == "result":
+                result_generation, result = payload
+                self.assigned[worker_index].discard((result_generation, result.index))
+                # Results of an earlier, abandoned map() call are dropped
+                if result_generation == generation and result.index in pending:
+                    del pending[result.index]
+                    yield result
+            elif kind == "failed":
+                self.alive.discard(worker_index)
+                self.ready.discard(worker_index)
+                self.failed_starts.append(payload)
+                retry.extend(own_items(worker_index))
+                self.assigned[worker_index].clear()
+            elif kind == "ready":
+                self.ready.add(worker_index)
+                logger.debug(f"Worker {worker_index} ready")
+
+    def run(self, inputs: Iterable[Any]) -> List[BatchResult]:
+        """Like map(), but collect every BatchResult and return them in input order."""
+        results = list(self.map(inputs))
+        results.sort(key=lambda result: result.index)
+        return results
+
+    def close(self, timeout: float = 30):
+        """Stop the workers (each terminates its own Chrome) and wait for them to exit."""
+        if not self.started:
+            return
+        for task_queue in self.task_queues:
+            # Drop inputs not taken yet, e.g. after map() was abandoned early
+            try:
+                while True:
+                    task_queue.get_nowait()
+            except queue.Empty:
+                pass
+            task_queue.put(None)
+        for process in self.processes:
+            process.join(timeout)
+            if process.is_alive():
+                logger.warning(f"Worker {process.name} did not exit in time; terminating it")
+                process.terminate()
+                process.join()
+        for task_queue in self.task_queues:
+            task_queue.close()
+        self.result_queue.close()
+        self.processes = []
+        self.started = False
+
+    def __enter__(self) -> "ShardedRunner":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
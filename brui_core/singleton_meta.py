@@ -1,16 +1,44 @@
+import threading
 from abc import ABCMeta
 
 class SingletonMeta(type):
     """
     SingletonMeta is a metaclass that implements the Singleton design pattern.
     It ensures that a class using this metaclass can have only one instance.
+
+    A class can define a `singleton_key(*args, **kwargs)` classmethod to keep one
+    instance per key instead (for example per event loop). Creation is guarded by a
+    lock, so concurrent first calls from several threads still produce one instance.
+
+    A class can also define a `singleton_expired()` method returning True once an instance
+    is dead for good (for example because its event loop was closed). Expired instances
+    are dropped whenever a new instance is created, so they do not pile up.
     """
     _instances = {}
+    # Re-entrant so a singleton's __init__ may itself create other singletons
+    _lock = threading.RLock()
 
     def __call__(cls, *args, **kwargs):
-        if cls not in cls._instances:
-            cls._instances[cls] = super().__call__(*args, **kwargs)
-        return cls._instances[cls]
+        key_func = getattr(cls, "singleton_key", None)
+        key = cls if key_func is None else (cls, key_func(*args, **kwargs))
+        instance = cls._instances.get(key)
+        if instance is None:
+            with SingletonMeta._lock:
+                instance = cls._instances.get(key)
+                if instance is None:
+                    cls.discard_expired_instances()
+                    instance = super().__call__(*args, **kwargs)
+                    cls._instances[key] = instance
+        return instance
+
+    def discard_expired_instances(cls):
+        """Forget this class's instances whose `singleton_expired()` returns True."""
+        if getattr(cls, "singleton_expired", None) is None:
+            return
+        with SingletonMeta._lock:
+            for key, instance in list(cls._instances.items()):
+                if isinstance(instance, cls) and instance.singleton_expired():
+                    del cls._instances[key]
 
 class ABCSingletonMeta(SingletonMeta, ABCMeta):
-    pass
\ No newline at end of file
+    pass
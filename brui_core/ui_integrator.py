@@ -1,19 +1,94 @@
+import asyncio
 import logging
-from typing import Optional
+from typing import Any, AsyncIterable, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, NamedTuple, Optional, Union
 
 from playwright.async_api import BrowserContext, Page
 
 from brui_core.browser.browser_manager import BrowserManager
+from brui_core.browser.manager_registry import Endpoint, least_loaded_manager
+from brui_core.browser.page_pool import PagePool
+from brui_core.browser.page_scheduler import Priority
+from brui_core.clipboard.clipboard_manager import wait_for_clipboard_content
+from brui_core.clipboard.virtual_clipboard import VirtualClipboard, attach_virtual_clipboard
+from brui_core.screenshot.screenshot_service import ScreenshotService
 
 logger = logging.getLogger(__name__)
 
+# The browser's default context, shared by every integrator (cookies, cache and storage included)
+CONTEXT_MODE_SHARED = "shared"
+# A pre-warmed context from the BrowserManager's pool, private to this integrator until close()
+CONTEXT_MODE_ISOLATED = "isolated"
+
+# Copied text goes to the system (X11) clipboard, shared by every page and process
+CLIPBOARD_MODE_SYSTEM = "system"
+# Copied text is captured inside the page and delivered to a per-page queue
+CLIPBOARD_MODE_VIRTUAL = "virtual"
+
+class BatchResult(NamedTuple):
+    """Outcome of one input of UIIntegrator.map()/run_batch()."""
+    index: int
+    input: Any
+    value: Any = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+PageTask = Callable[[Page, Any], Awaitable[Any]]
+
 class UIIntegrator:
-    def __init__(self):
-        self.browser_manager = BrowserManager()
+    def __init__(self, context_mode: str = CONTEXT_MODE_SHARED, use_page_pool: bool = False,
+                 clear_page_storage: bool = False, priority: Priority = Priority.NORMAL,
+                 admission_deadline: Optional[float] = None, browser_manager: Optional[BrowserManager] = None,
+                 clipboard_mode: str = CLIPBOARD_MODE_SYSTEM):
+        """
+        Args:
+            context_mode: CONTEXT_MODE_SHARED (the browser's default context) or
+                CONTEXT_MODE_ISOLATED (a private context from the BrowserManager's pool).
+            use_page_pool: Lease the page from the context's page pool and reset it on
+                close()/reopen_page() instead of opening and closing a tab.
+            clear_page_storage: With the page pool, also clear the page's Web Storage on reset.
+            priority: Priority class of this integrator's pages in the BrowserManager's page scheduler.
+            admission_deadline: Seconds to wait for a page slot before AdmissionRejected is raised;
+                None waits as long as it takes.
+            browser_manager: Manager to work through, e.g. one for a specific endpoint.
+                Defaults to the running event loop's BrowserManager().
+            clipboard_mode: CLIPBOARD_MODE_SYSTEM (the X11 clipboard) or CLIPBOARD_MODE_VIRTUAL
+                (a clipboard private to the page, see wait_for_clipboard_content()).
+        """
+        if context_mode not in (CONTEXT_MODE_SHARED, CONTEXT_MODE_ISOLATED):
+            raise ValueError(f"Unknown context_mode {context_mode!r}; expected "
+                             f"{CONTEXT_MODE_SHARED!r} or {CONTEXT_MODE_ISOLATED!r}")
+        if clipboard_mode not in (CLIPBOARD_MODE_SYSTEM, CLIPBOARD_MODE_VIRTUAL):
+            raise ValueError(f"Unknown clipboard_mode {clipboard_mode!r}; expected "
+                             f"{CLIPBOARD_MODE_SYSTEM!r} or {CLIPBOARD_MODE_VIRTUAL!r}")
+        self.browser_manager = browser_manager if browser_manager is not None else BrowserManager()
+        self.context_mode = context_mode
+        self.clipboard_mode = clipboard_mode
+        self.clipboard: Optional[VirtualClipboard] = None
+        self.screenshots: Optional[ScreenshotService] = None
+        # Options the screenshot service was created with, reused when the page is replaced
+        self.screenshot_options: Dict[str, Any] = {}
+        self.use_page_pool = use_page_pool
+        self.clear_page_storage = clear_page_storage
+        self.page_pool: Optional[PagePool] = None
+        self.priority = priority
+        self.admission_deadline = admission_deadline
+        # Set while this integrator's page holds a slot of the page scheduler
+        self.slot_granted_at: Optional[float] = None
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
         self.initialized = False
 
+    @classmethod
+    def least_loaded(cls, endpoints: Iterable[Endpoint], **kwargs) -> "UIIntegrator":
+        """
+        Create an integrator on whichever of `endpoints` (e.g. "chrome-1:9222", "chrome-2:9222")
+        has the fewest pages open or queued. Other arguments are passed to the constructor.
+        """
+        return cls(browser_manager=least_loaded_manager(endpoints), **kwargs)
+
     async def initialize(self):
         """Initialize the browser and create a new page."""
         logger.info("Starting UIIntegrator initialization")
@@ -26,23 +101,43 @@ class UIIntegrator:
         browser = await self.browser_manager.connect_browser()
         logger.info("Successfully connected to browser")
         
+        # The slot is taken before an isolated context is leased, so a rejected or cancelled
+        # admission never strands a context
+        logger.info("Waiting for page admission...")
+        scheduler = self.browser_manager.page_scheduler
+        if self.slot_granted_at is None:
+            self.slot_granted_at = await scheduler.acquire(self.priority, self.admission_deadline)
+
         logger.info("Accessing browser context...")
         try:
-            # Use the get_browser_context method instead of direct access
-            self.context = await self.browser_manager.get_browser_context(browser)
+            if self.context_mode == CONTEXT_MODE_ISOLATED:
+                self.context = await self.browser_manager.acquire_context()
+            else:
+                # Use the get_browser_context method instead of direct access
+                self.context = await self.browser_manager.get_browser_context(browser)
             logger.info(f"Successfully accessed browser context. Pages in context: {len(self.context.pages)}")
-        except Exception as e:
+        except BaseException as e:
             logger.error(f"Failed to access browser context: {str(e)}")
+            self._release_page_slot()
             raise
-        
+
         logger.info("Creating new page...")
         try:
-            self.page = await self.context.new_page()
+            if self.use_page_pool:
+                self.page_pool = self.browser_manager.get_page_pool(self.context)
+                self.page = await self.page_pool.acquire()
+            else:
+                self.page = await self.context.new_page()
             logger.info(f"New page created successfully. URL: {self.page.url}")
-        except Exception as e:
+            await self._attach_clipboard()
+        except BaseException as e:
             logger.error(f"Failed to create new page: {str(e)}")
+            self._release_page_slot()
+            if self.context_mode == CONTEXT_MODE_ISOLATED and self.context:
+                await self.browser_manager.release_context(self.context, recycle=True)
+                self.context = None
             raise
-        
+
         self.initialized = True
         logger.info("UIIntegrator initialized successfully")
 
@@ -53,25 +148,58 @@ class UIIntegrator:
             raise RuntimeError("UIIntegrator is not initialized")
 
         try:
+            if self.page_pool is not None:
+                if self.page:
+                    await self._release_pooled_page()
+                self.page = await self.page_pool.acquire()
+                logger.info("Leased fresh page from page pool")
+                await self._attach_clipboard()
+                return
+
             if self.page and not self.page.is_closed():
                 await self.page.close()
                 logger.info("Closed existing page")
 
             self.page = await self.context.new_page()
             logger.info("Opened new page")
+            await self._attach_clipboard()
         except Exception as e:
             logger.error(f"Error while reopening page: {str(e)}")
             raise
 
     async def close(self, close_page=True, close_context=False, close_browser=False):
-        """Close the integrator and optionally its components."""
+        """
+        Close the integrator and optionally its components.
+
+        In isolated mode the context is leased together with the page: close_page=False keeps
+        both (and the page's scheduler slot), and cannot be combined with close_context.
+        """
+        if self.context_mode == CONTEXT_MODE_ISOLATED and close_context and not close_page:
+            raise ValueError("close_context=True requires close_page=True in isolated mode")
         try:
-            if close_page and self.page:
+            if self.screenshots is not None:
+                await self.screenshots.close()
+                self.screenshots = None
+            self.screenshot_options = {}
+            if close_page and self.page and self.page_pool is not None:
+                await self._release_pooled_page()
+                self.page = None
+                self.page_pool = None
+                logger.info("Returned page to page pool")
+            elif close_page and self.page:
                 await self.page.close()
                 self.page = None
                 logger.info("Closed page")
+            if close_page:
+                self.clipboard = None
+                self._release_page_slot()
 
-            if close_context and self.context:
+            if self.context_mode == CONTEXT_MODE_ISOLATED and self.context and close_page:
+                # Pooled contexts go back to the pool; close_context retires it instead of reusing it
+                await self.browser_manager.release_context(self.context, recycle=close_context)
+                self.context = None
+                logger.info("Released isolated context")
+            elif close_context and self.context:
                 await self.context.close()
                 self.context = None
                 logger.info("Closed context")
@@ -83,3 +211,181 @@ class UIIntegrator:
         except Exception as e:
             logger.error(f"Error while closing: {str(e)}")
             raise
+
+    async def _release_pooled_page(self):
+        # A virtual clipboard's binding and init script stay on the page for good, and would
+        # swallow the copies of the next lessee, so such pages are closed instead of reused
+        await self.page_pool.release(self.page, clear_storage=self.clear_page_storage,
+                                     discard=self.clipboard is not None)
+
+    async def _attach_clipboard(self):
+        if self.clipboard_mode == CLIPBOARD_MODE_VIRTUAL:
+            self.clipboard = await attach_virtual_clipboard(self.page)
+
+    async def wait_for_clipboard_content(self, timeout: Optional[float] = None) -> str:
+        """
+        Wait for text to be copied and return it. In CLIPBOARD_MODE_VIRTUAL only this
+        integrator's page is watched, so integrators copying at the same time don't
+        interfere; otherwise the system clipboard is watched.
+
+        Raises:
+            asyncio.TimeoutError: If nothing is copied within `timeout` seconds
+        """
+        if self.clipboard_mode == CLIPBOARD_MODE_VIRTUAL:
+            if self.clipboard is None:
+                logger.error("UIIntegrator is not initialized. Call initialize() first.")
+                raise RuntimeError("UIIntegrator is not initialized")
+            return await self.clipboard.wait_for_content(timeout)
+        return await wait_for_clipboard_content(timeout)
+
+    async def get_screenshot_service(self, **options) -> ScreenshotService:
+        """
+        Return the ScreenshotService of the current page, creating it on first use or after
+        the page was replaced. `options` are passed to ScreenshotService when it is created,
+        and kept for the services of later pages.
+
+        Raises:
+            ValueError: If `options` differ from those of the existing service
+        """
+        if not self.initialized:
+            logger.error("UIIntegrator is not initialized. Call initialize() first.")
+            raise RuntimeError("UIIntegrator is not initialized")
+        if self.screenshots is not None and self.screenshots.page is not self.page:
+            await self.screenshots.close()
+            self.screenshots = None
+        if self.screenshots is not None and options and options != self.screenshot_options:
+            raise ValueError(f"The screenshot service already exists with options {self.screenshot_options!r}; "
+                             f"got {options!r}")
+        if self.screenshots is None:
+            if options:
+                self.screenshot_options = options
+            self.screenshots = ScreenshotService(self.page, **self.screenshot_options)
+        return self.screenshots
+
+    async def wait_for_visual_stability(self, stable_frames: int = 3, quiet_period: float = 0.3,
+                                        timeout: float = 10.0, threshold: int = 0) -> float:
+        """
+        Wait until the page stops changing visually, instead of sleeping a fixed time.
+        See ScreenshotService.wait_for_stability().
+
+        Returns:
+            Seconds it took for the page to settle.
+
+        Raises:
+            asyncio.TimeoutError: If the page is still changing after `timeout` seconds
+        """
+        screenshots = await self.get_screenshot_service()
+        return await screenshots.wait_for_stability(stable_frames=stable_frames, quiet_period=quiet_period,
+                                                    timeout=timeout, threshold=threshold)
+
+    def _release_page_slot(self):
+        if self.slot_granted_at is not None:
+            self.browser_manager.page_scheduler.release(self.slot_granted_at)
+            self.slot_granted_at = None
+
+    async def _run_on_pooled_page(self, page_pool: PagePool, func: PageTask, item: Any) -> Any:
+        # Work run under this integrator's own admitted page is counted but not queued,
+        # otherwise it could wait forever on the slot the integrator itself holds
+        scheduler = self.browser_manager.page_scheduler
+        async with scheduler.slot(self.priority, self.admission_deadline, exempt=self.slot_granted_at is not None):
+            page = await page_pool.acquire()
+            try:
+                return await func(page, item)
+            finally:
+                await page_pool.release(page, clear_storage=self.clear_page_storage)
+
+    async def run(self, func: PageTask, item: Any) -> Any:
+        """
+        Run `await func(page, item)` once on a page leased from this integrator's context
+        page pool, under the page scheduler, and return its result.
+        """
+        if not self.initialized:
+            logger.error("UIIntegrator is not initialized. Call initialize() first.")
+            raise RuntimeError("UIIntegrator is not initialized")
+        page_pool = self.browser_manager.get_page_pool(self.context)
+        return await self._run_on_pooled_page(page_pool, func, item)
+
+    async def map(self, func: PageTask, inputs: Union[Iterable[Any], AsyncIterable[Any]],
+                  concurrency: int = 4) -> AsyncIterator[BatchResult]:
+        """
+        Run `await func(page, item)` for every input on pages leased from this integrator's
+        context page pool, at most `concurrency` at a time, yielding a BatchResult per input
+        in completion order.
+
+        Inputs are pulled lazily, only as slots free up, so memory stays flat no matter how
+        many there are. Every item is also counted by the BrowserManager's page scheduler, but
+        admitted at once, under the slot this integrator already holds.
+        An exception raised by `func` (or AdmissionRejected) is captured in its BatchResult and
+        does not stop the batch. Leaving the iteration early cancels the items still running.
+        """
+        if not self.initialized:
+            logger.error("UIIntegrator is not initialized. Call initialize() first.")
+            raise RuntimeError("UIIntegrator is not initialized")
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        page_pool = self.browser_manager.get_page_pool(self.context)
+
+        async def run_item(index: int, item: Any) -> BatchResult:
+            try:
+                return BatchResult(index, item, value=await self._run_on_pooled_page(page_pool, func, item))
+            except Exception as e:
+                logger.debug(f"Batch item {index} failed: {e!r}")
+                return BatchResult(index, item, error=e)
+
+        exhausted = object()
+        if isinstance(inputs, AsyncIterable):
+            async_iterator = inputs.__aiter__()
+
+            async def next_input():
+                try:
+                    return await async_iterator.__anext__()
+                except StopAsyncIteration:
+                    return exhausted
+        else:
+            sync_iterator = iter(inputs)
+
+            async def next_input():
+                return next(sync_iterator, exhausted)
+
+        running = set()
+        # The next input is fetched alongside the running items, so a slow input source never
+        # holds back results that are already done
+        fetching: Optional[asyncio.Future] = None
+        index = 0
+        more_inputs = True
+        try:
+            while True:
+                if more_inputs and fetching is None and len(running) < concurrency:
+                    fetching = asyncio.ensure_future(next_input())
+                if fetching is None and not running:
+                    return
+                waiting = running | {fetching} if fetching is not None else running
+                done, _ = await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+                if fetching in done:
+                    done.discard(fetching)
+                    item = fetching.result()
+                    fetching = None
+                    if item is exhausted:
+                        more_inputs = False
+                    else:
+                        running.add(asyncio.ensure_future(run_item(index, item)))
+                        index += 1
+                running -= done
+                for task in done:
+                    yield task.result()
+        finally:
+            if fetching is not None:
+                fetching.cancel()
+            for task in running:
+                task.cancel()
+            pending = running | {fetching} if fetching is not None else running
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    async def run_batch(self, func: PageTask, inputs: Union[Iterable[Any], AsyncIterable[Any]],
+                        concurrency: int = 4) -> List[BatchResult]:
+        """Like map(), but collect every BatchResult and return them in input order."""
+        results = [result async for result in self.map(func, inputs, concurrency=concurrency)]
+        results.sort(key=lambda result: result.index)
+        return results
@@ -0,0 +1,98 @@
+"""
+Benchmark Chrome startup time and memory for each launch preset.
+
+For every preset this launches Chrome on a scratch port and profile, measures the time until
+the DevTools endpoint is ready, opens one about:blank page over CDP, lets Chrome settle,
+and sums the memory of every process in Chrome's process group (PSS where the kernel
+exposes it, RSS otherwise).
+
+Usage:
+    uv run python scripts/benchmark_launch_presets.py [--presets default headless lean lean-headless]
+                                                      [--runs 3] [--port 9400] [--settle 3]
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+from playwright.async_api import async_playwright
+
+from brui_core.browser.browser_launcher import launch_browser, terminate_launched_browser
+from brui_core.browser.launch_presets import LAUNCH_PRESETS
+
+
+def read_group_memory_kb(process_group: int) -> int:
+    """Sum PSS (or RSS) in kB across all processes in a process group."""
+    total = 0
+    for name in os.listdir("/proc"):
+        if not name.isdigit():
+            continue
+        try:
+            with open(f"/proc/{name}/stat", "rb") as f:
+                stat = f.read()
+            fields = stat[stat.rfind(b")") + 2:].split()
+            if int(fields[2]) != process_group:
+                continue
+            try:
+                with open(f"/proc/{name}/smaps_rollup") as f:
+                    key = "Pss:"
+                    lines = f.readlines()
+            except (FileNotFoundError, PermissionError):
+                with open(f"/proc/{name}/status") as f:
+                    key = "VmRSS:"
+                    lines = f.readlines()
+            for line in lines:
+                if line.startswith(key):
+                    total += int(line.split()[1])
+                    break
+        except (FileNotFoundError, ProcessLookupError, PermissionError, ValueError, IndexError):
+            continue
+    return total
+
+
+async def bench_preset(playwright, preset: str, port: int, settle: float):
+    with tempfile.TemporaryDirectory(prefix=f"brui-bench-{preset}-") as user_data_dir:
+        start = time.perf_counter()
+        launched = await launch_browser(remote_debugging_port=port, user_data_dir=user_data_dir, preset=preset)
+        startup_ms = (time.perf_counter() - start) * 1000
+        try:
+            browser = await playwright.chromium.connect_over_cdp(
+                launched.ws_endpoint or f"http://localhost:{port}"
+            )
+            context = browser.contexts[0] if browser.contexts else await browser.new_context()
+            page = await context.new_page()
+            await page.goto("about:blank")
+            await asyncio.sleep(settle)
+            memory_kb = read_group_memory_kb(launched.process_group)
+            await browser.close()
+        finally:
+            await terminate_launched_browser(launched)
+    return startup_ms, memory_kb
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--presets", nargs="+", default=sorted(LAUNCH_PRESETS))
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--port", type=int, default=9400)
+    parser.add_argument("--settle", type=float, default=3.0, help="seconds to wait before sampling memory")
+    args = parser.parse_args()
+
+    playwright = await async_playwright().start()
+    try:
+        print(f"{'preset':<16}{'startup median (ms)':>22}{'memory median (MB)':>22}")
+        for preset in args.presets:
+            startups, memories = [], []
+            for _ in range(args.runs):
+                startup_ms, memory_kb = await bench_preset(playwright, preset, args.port, args.settle)
+                startups.append(startup_ms)
+                memories.append(memory_kb / 1024)
+            print(f"{preset:<16}{statistics.median(startups):>22.1f}{statistics.median(memories):>22.1f}")
+    finally:
+        await playwright.stop()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,44 @@
+"""
+Benchmark the in-process /proc Chrome scanner against the `ps` subprocess scanner.
+
+Usage:
+    uv run python scripts/benchmark_process_scan.py [--iterations 50] [--match /opt/google/chrome/chrome]
+"""
+import argparse
+import statistics
+import time
+
+from brui_core.browser.browser_launcher import get_chrome_process_path
+from brui_core.browser.process_scanner import (
+    is_proc_available,
+    scan_processes_from_proc,
+    scan_processes_from_ps,
+)
+
+
+def bench(label, fn, match, iterations):
+    timings = []
+    found = 0
+    for _ in range(iterations):
+        start = time.perf_counter()
+        found = len(fn(match))
+        timings.append((time.perf_counter() - start) * 1000)
+    print(f"{label:>6}: median {statistics.median(timings):8.3f} ms  "
+          f"p95 {sorted(timings)[int(len(timings) * 0.95) - 1]:8.3f} ms  matches {found}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--match", default=get_chrome_process_path())
+    args = parser.parse_args()
+
+    bench("ps", scan_processes_from_ps, args.match, args.iterations)
+    if is_proc_available():
+        bench("/proc", scan_processes_from_proc, args.match, args.iterations)
+    else:
+        print("/proc is not available on this host")
+
+
+if __name__ == "__main__":
+    main()
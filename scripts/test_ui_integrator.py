@@ -21,7 +21,8 @@ async def main():
 
     # (Optional) take a screenshot to verify visually
     try:
-        await ui.page.screenshot(path="ui_integrator_google.png")
+        screenshots = await ui.get_screenshot_service()
+        await screenshots.capture(path="ui_integrator_google.png")
         print("Saved ui_integrator_google.png")
     except Exception as e:
         print("Screenshot skipped:", e)
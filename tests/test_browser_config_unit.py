@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import dataclasses
+import os
+import threading
+from collections.abc import Mapping
+
+import pytest
+
+from brui_core.browser import browser_config
+from brui_core.browser.browser_config import (
+    BrowserConfig,
+    build_browser_config,
+    get_browser_config,
+    load_browser_config,
+)
+
+
+@pytest.fixture(autouse=True)
+def isolated_config(monkeypatch: pytest.MonkeyPatch, tmp_path):
+    for name in browser_config.ENV_OVERRIDES:
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv(browser_config.CONFIG_FILE_ENV, str(tmp_path / "brui_core.toml"))
+    monkeypatch.setattr(browser_config, "CONFIG_STAT_INTERVAL", 0.0)
+    monkeypatch.setattr(browser_config, "_cache", browser_config._ConfigCache())
+
+
+def write_config(path, text: str, mtime_ns: int):
+    path.write_text(text)
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_defaults_without_file_or_environment():
+    config = load_browser_config()
+
+    assert config == BrowserConfig()
+    assert config.chrome_profile_directory == "Profile 1"
+    assert config.remote_debugging_port == 9222
+
+
+def test_config_is_frozen_and_memoized():
+    config = load_browser_config()
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        config.remote_debugging_port = 1
+    assert load_browser_config() is config
+    assert get_browser_config() is get_browser_config()
+    with pytest.raises(TypeError):
+        get_browser_config()["browser"]["remote_debugging_port"] = 1
+
+
+def test_toml_file_tables_and_environment_precedence(monkeypatch: pytest.MonkeyPatch, tmp_path):
+    write_config(tmp_path / "brui_core.toml", """
+[browser]
+remote_debugging_port = 9300
+launch_preset = "lean"
+launch_extra_args = ["--mute-audio"]
+hot_spare = true
+
+[pool]
+size = 4
+
+[timeouts]
+startup = 5
+""", 1_000_000_000)
+    monkeypatch.setenv("CHROME_REMOTE_DEBUGGING_PORT", "9400")
+
+    config = load_browser_config()
+
+    assert config.remote_debugging_port == 9400
+    assert config.launch_preset == "lean"
+    assert config.launch_extra_args == ("--mute-audio",)
+    assert config.hot_spare is True
+    assert config.pool_size == 4
+    assert config.startup_timeout == 5.0
+
+
+def test_reloads_when_file_mtime_or_environment_changes(monkeypatch: pytest.MonkeyPatch, tmp_path):
+    path = tmp_path / "brui_core.toml"
+    write_config(path, "[browser]\nremote_debugging_port = 9300\n", 1_000_000_000)
+    first = load_browser_config()
+    assert first.remote_debugging_port == 9300
+
+    write_config(path, "[browser]\nremote_debugging_port = 9301\n", 2_000_000_000)
+    second = load_browser_config()
+    assert second.remote_debugging_port == 9301
+
+    monkeypatch.setenv("CHROME_PROFILE_DIRECTORY", "Work")
+    assert load_browser_config().chrome_profile_directory == "Work"
+    assert load_browser_config().remote_debugging_port == 9301
+
+
+def test_invalid_values_are_ignored(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("CHROME_REMOTE_DEBUGGING_PORT", "not-a-port")
+
+    assert build_browser_config().remote_debugging_port == 9222
+
+
+def test_concurrent_reloads_never_return_a_missing_config():
+    failures: list[object] = []
+
+    def reader() -> None:
+        for _ in range(2000):
+            config = load_browser_config()
+            if not isinstance(config, BrowserConfig) or not isinstance(get_browser_config()["browser"], Mapping):
+                failures.append(config)
+
+    def invalidator() -> None:
+        for _ in range(2000):
+            browser_config._cache.invalidate()
+
+    threads = [threading.Thread(target=reader) for _ in range(4)] + [threading.Thread(target=invalidator)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert failures == []
@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+import asyncio
+import io
+import os
+import subprocess
+import sys
+
+import pytest
+
+import brui_core.browser.browser_launcher as launcher
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+class TrackingSink(io.BytesIO):
+    def close(self) -> None:
+        self.final_value = self.getvalue()
+        super().close()
+
+
+def test_watch_devtools_endpoint_reports_ws_url_and_tees_output():
+    stream = io.BytesIO(
+        b"[WARNING] something\n"
+        b"DevTools listening on ws://127.0.0.1:9222/devtools/browser/abc\n"
+        b"later output\n"
+    )
+    sink = TrackingSink()
+    reported = []
+
+    launcher.watch_devtools_endpoint(stream, sink, reported.append)
+
+    assert reported == ["ws://127.0.0.1:9222/devtools/browser/abc"]
+    assert sink.final_value == stream.getvalue()
+
+
+def test_watch_devtools_endpoint_reports_none_on_eof_without_endpoint():
+    reported = []
+
+    launcher.watch_devtools_endpoint(io.BytesIO(b"Opening in existing browser session.\n"), None, reported.append)
+
+    assert reported == [None]
+
+
+@pytest.mark.anyio
+async def test_wait_for_devtools_endpoint_prefers_stderr_signal(monkeypatch: pytest.MonkeyPatch):
+    async def never_open(_port=None):
+        return False
+
+    monkeypatch.setattr(launcher, "is_browser_opened_in_debug_mode", never_open)
+    future = asyncio.get_running_loop().create_future()
+    asyncio.get_running_loop().call_later(0.02, future.set_result, "ws://localhost:9222/devtools/browser/x")
+
+    ws_endpoint = await launcher.wait_for_devtools_endpoint(future, 9222, timeout=2)
+
+    assert ws_endpoint == "ws://localhost:9222/devtools/browser/x"
+
+
+@pytest.mark.anyio
+async def test_wait_for_devtools_endpoint_falls_back_to_polling(monkeypatch: pytest.MonkeyPatch):
+    probes = []
+
+    async def opens_on_third_probe(_port=None):
+        probes.append(asyncio.get_running_loop().time())
+        return len(probes) >= 3
+
+    async def version(_port=None):
+        return {"Browser": "Chrome/126", "webSocketDebuggerUrl": "ws://localhost:9222/devtools/browser/y"}
+
+    monkeypatch.setattr(launcher, "is_browser_opened_in_debug_mode", opens_on_third_probe)
+    monkeypatch.setattr(launcher, "fetch_cdp_version", version)
+    future = asyncio.get_running_loop().create_future()
+    future.set_result(None)
+
+    ws_endpoint = await launcher.wait_for_devtools_endpoint(future, 9222, timeout=2)
+
+    # The port won, so the endpoint comes from /json/version
+    assert ws_endpoint == "ws://localhost:9222/devtools/browser/y"
+    assert len(probes) == 3
+    # Backoff starts well below 100ms instead of a full second
+    assert probes[-1] - probes[0] < 0.2
+
+
+@pytest.mark.anyio
+async def test_wait_for_browser_start_times_out(monkeypatch: pytest.MonkeyPatch):
+    async def never_open(_port=None):
+        return False
+
+    monkeypatch.setattr(launcher, "is_browser_opened_in_debug_mode", never_open)
+
+    with pytest.raises(TimeoutError):
+        await launcher.wait_for_browser_start(timeout=0.1, remote_debugging_port=9999)
+
+
+async def start_server(handler):
+    server = await asyncio.start_server(handler, "127.0.0.1", 0)
+    return server, server.sockets[0].getsockname()[1]
+
+
+async def cdp_version_handler(reader, writer):
+    await reader.readuntil(b"\r\n\r\n")
+    body = b'{"Browser": "Chrome/140", "webSocketDebuggerUrl": "ws://127.0.0.1/devtools/browser/x"}'
+    writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: %d\r\n\r\n" % len(body) + body)
+    await writer.drain()
+    writer.close()
+
+
+async def keep_alive_handler(reader, writer):
+    # Answers with a Content-Length but keeps the connection open, ignoring Connection: close
+    await reader.readuntil(b"\r\n\r\n")
+    body = b'{"Browser": "Chrome/140", "webSocketDebuggerUrl": "ws://127.0.0.1/devtools/browser/y"}'
+    writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\nContent-Length: %d\r\n\r\n" % len(body) + body)
+    await writer.drain()
+    await reader.read()
+    writer.close()
+
+
+async def hung_handler(reader, writer):
+    # Accept the connection but never answer; return once the client gives up
+    await reader.read()
+    writer.close()
+
+
+@pytest.mark.anyio
+async def test_debug_port_probe_detects_open_and_closed_ports():
+    server, port = await start_server(hung_handler)
+    try:
+        assert await launcher.is_browser_opened_in_debug_mode(port) is True
+    finally:
+        server.close()
+        await server.wait_closed()
+
+    assert await launcher.is_browser_opened_in_debug_mode(port) is False
+
+
+@pytest.mark.anyio
+async def test_cdp_liveness_check_reads_json_version():
+    server, port = await start_server(cdp_version_handler)
+    try:
+        assert await launcher.is_browser_opened_in_debug_mode(port, check_cdp=True) is True
+        version = await launcher.fetch_cdp_version(port)
+        assert version["webSocketDebuggerUrl"] == "ws://127.0.0.1/devtools/browser/x"
+    finally:
+        server.close()
+        await server.wait_closed()
+
+
+@pytest.mark.anyio
+async def test_cdp_version_is_read_by_content_length():
+    server, port = await start_server(keep_alive_handler)
+    try:
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        version = await launcher.fetch_cdp_version(port, timeout=1)
+        assert version["webSocketDebuggerUrl"] == "ws://127.0.0.1/devtools/browser/y"
+        assert loop.time() - started < 0.5
+    finally:
+        server.close()
+        await server.wait_closed()
+
+
+@pytest.mark.anyio
+async def test_cdp_liveness_check_reports_hung_browser_as_down():
+    server, port = await start_server(hung_handler)
+    try:
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        assert await launcher.is_browser_opened_in_debug_mode(port, timeout=0.1, check_cdp=True) is False
+        assert loop.time() - started < 1
+    finally:
+        server.close()
+        await server.wait_closed()
+
+
+def pid_exists(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    return True
+
+
+@pytest.mark.anyio
+async def test_terminate_launched_browser_kills_only_its_process_group(tmp_path):
+    helper_pid_file = tmp_path / "helper.pid"
+    # The leader ignores SIGTERM and leaves a helper behind, like a wedged Chrome
+    leader = subprocess.Popen(
+        [sys.executable, "-c",
+         "import signal, subprocess, sys, time\n"
+         "signal.signal(signal.SIGTERM, signal.SIG_IGN)\n"
+         "helper = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)'])\n"
+         f"open({str(helper_pid_file)!r}, 'w').write(str(helper.pid))\n"
+         "time.sleep(30)\n"],
+        start_new_session=True,
+    )
+    bystander = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+    try:
+        for _ in range(200):
+            if helper_pid_file.exists() and helper_pid_file.read_text():
+                break
+            await asyncio.sleep(0.01)
+        helper_pid = int(helper_pid_file.read_text())
+        launched = launcher.LaunchedBrowser(
+            process=leader, remote_debugging_port=9222, user_data_dir=None, process_group=leader.pid
+        )
+
+        await launcher.terminate_launched_browser(launched, timeout=0.2)
+
+        assert leader.returncode is not None
+        for _ in range(200):
+            if not pid_exists(helper_pid):
+                break
+            await asyncio.sleep(0.01)
+        assert not pid_exists(helper_pid)
+        assert bystander.poll() is None
+    finally:
+        bystander.kill()
+        bystander.wait()
+
+
+@pytest.mark.anyio
+async def test_launch_browser_terminates_chrome_that_never_gets_ready(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    fake_chrome = tmp_path / "fake-chrome"
+    fake_chrome.write_text("#!/bin/sh\nexec sleep 30\n")
+    fake_chrome.chmod(0o755)
+    terminated = []
+    real_terminate = launcher.terminate_launched_browser
+
+    async def never_ready(_future, _port):
+        raise TimeoutError("Chrome did not open its debugging port")
+
+    async def recording_terminate(launched, timeout=5):
+        terminated.append(launched.process)
+        await real_terminate(launched, timeout)
+
+    monkeypatch.setattr(launcher, "get_chrome_startup_path", lambda: str(fake_chrome))
+    monkeypatch.setattr(launcher, "wait_for_devtools_endpoint", never_ready)
+    monkeypatch.setattr(launcher, "terminate_launched_browser", recording_terminate)
+    monkeypatch.setenv("CHROME_LOG_PATH", str(tmp_path / "chrome.log"))
+
+    with pytest.raises(TimeoutError):
+        await launcher.launch_browser(remote_debugging_port=9556, user_data_dir=str(tmp_path / "profile"))
+
+    assert len(terminated) == 1
+    assert terminated[0].poll() is not None
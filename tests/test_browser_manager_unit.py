@@ -0,0 +1,334 @@
+from __future__ import annotations
+
+import asyncio
+import subprocess
+import sys
+import threading
+import weakref
+
+import pytest
+
+import brui_core.browser.browser_manager as manager_module
+import brui_core.browser.hot_spare as hot_spare_module
+import brui_core.browser.playwright_driver as driver_module
+from brui_core.browser.browser_launcher import LaunchedBrowser
+from brui_core.browser.browser_manager import BrowserManager
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+class FakeBrowser:
+    def __init__(self, endpoint_url: str) -> None:
+        self.endpoint_url = endpoint_url
+        self.contexts = [object()]
+        self.listeners: dict[str, list] = {}
+        self.connected = True
+
+    def on(self, event: str, callback) -> None:
+        self.listeners.setdefault(event, []).append(callback)
+
+    def is_connected(self) -> bool:
+        return self.connected
+
+    def emit_disconnected(self) -> None:
+        self.connected = False
+        for callback in self.listeners.get("disconnected", []):
+            callback(self)
+
+    async def close(self) -> None:
+        self.emit_disconnected()
+
+    async def new_context(self) -> FakeContext:
+        return FakeContext()
+
+
+class FakeContext:
+    def __init__(self) -> None:
+        self.pages: list = []
+        self.closed = False
+
+    async def clear_cookies(self) -> None:
+        pass
+
+    async def clear_permissions(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class FakeChromium:
+    def __init__(self) -> None:
+        self.connects: list[str] = []
+
+    async def connect_over_cdp(self, endpoint_url: str) -> FakeBrowser:
+        self.connects.append(endpoint_url)
+        return FakeBrowser(endpoint_url)
+
+
+class FakePlaywright:
+    def __init__(self) -> None:
+        self.chromium = FakeChromium()
+
+    async def stop(self) -> None:
+        pass
+
+
+class FakePlaywrightStarter:
+    async def start(self) -> FakePlaywright:
+        return FakePlaywright()
+
+
+@pytest.fixture
+def manager(monkeypatch: pytest.MonkeyPatch):
+    probes: list[int] = []
+
+    async def fake_is_open(remote_debugging_port=None, check_cdp=False):
+        probes.append(remote_debugging_port)
+        return True
+
+    monkeypatch.setattr(driver_module, "async_playwright", FakePlaywrightStarter)
+    monkeypatch.setattr(driver_module, "_drivers", weakref.WeakKeyDictionary())
+    monkeypatch.setattr(manager_module, "is_browser_opened_in_debug_mode", fake_is_open)
+    BrowserManager._instances = {}
+    browser_manager = BrowserManager()
+    browser_manager.probes = probes
+    yield browser_manager
+    BrowserManager._instances = {}
+
+
+@pytest.mark.anyio
+async def test_connected_browser_is_returned_without_probing(manager):
+    browser = await manager.connect_browser()
+    probes_after_connect = len(manager.probes)
+
+    assert await manager.connect_browser() is browser
+    await manager.ensure_browser_launched()
+
+    assert len(manager.probes) == probes_after_connect
+    assert manager.browser_connected is True
+
+
+@pytest.mark.anyio
+async def test_disconnect_event_triggers_probe_and_reconnect(manager):
+    browser = await manager.connect_browser()
+    probes_after_connect = len(manager.probes)
+
+    browser.emit_disconnected()
+    assert manager.browser_connected is False
+
+    recovered = await manager.connect_browser()
+
+    assert recovered is not browser
+    assert recovered.is_connected()
+    assert len(manager.probes) > probes_after_connect
+    assert manager.browser_connected is True
+
+
+@pytest.mark.anyio
+async def test_chrome_exit_marks_browser_down(manager, monkeypatch: pytest.MonkeyPatch):
+    port_open = False
+
+    async def fake_is_open(remote_debugging_port=None, check_cdp=False):
+        return port_open
+
+    async def fake_launch_browser():
+        nonlocal port_open
+        port_open = True
+        process = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(0.1)"])
+        return LaunchedBrowser(process=process, remote_debugging_port=9222, user_data_dir=None)
+
+    monkeypatch.setattr(manager_module, "is_browser_opened_in_debug_mode", fake_is_open)
+    monkeypatch.setattr(manager_module, "launch_browser", fake_launch_browser)
+
+    await manager.connect_browser()
+    assert manager.launched is not None
+
+    for _ in range(100):
+        if not manager.browser_connected:
+            break
+        await asyncio.sleep(0.05)
+
+    assert manager.browser_connected is False
+    assert manager.launched is None
+
+
+@pytest.mark.anyio
+async def test_hot_spare_is_promoted_without_cold_launch(manager, monkeypatch: pytest.MonkeyPatch):
+    open_ports: set[int] = set()
+    launches: list[int] = []
+
+    async def fake_is_open(remote_debugging_port=None, check_cdp=False):
+        return (remote_debugging_port or 9222) in open_ports
+
+    async def fake_launch_browser(remote_debugging_port=None, user_data_dir=None, log_path=None):
+        port = remote_debugging_port or 9222
+        open_ports.add(port)
+        launches.append(port)
+        process = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+        return LaunchedBrowser(process=process, remote_debugging_port=port, user_data_dir=user_data_dir)
+
+    async def fake_kill_chrome_for_port(_port):
+        return False
+
+    monkeypatch.setattr(manager_module, "is_browser_opened_in_debug_mode", fake_is_open)
+    monkeypatch.setattr(manager_module, "launch_browser", fake_launch_browser)
+    monkeypatch.setattr(manager_module, "kill_chrome_for_port", fake_kill_chrome_for_port)
+    monkeypatch.setattr(hot_spare_module, "launch_browser", fake_launch_browser)
+
+    try:
+        primary = await manager.connect_browser()
+        manager.enable_hot_spare()
+        await manager.hot_spare_task
+        assert manager.hot_spare is not None and manager.hot_spare.is_ready()
+        assert launches == [9222, 9223]
+
+        # Primary Chrome dies
+        open_ports.discard(9222)
+        primary.emit_disconnected()
+
+        promoted = await manager.connect_browser()
+
+        assert promoted is not primary
+        assert manager.remote_debugging_port == 9223
+        assert launches == [9222, 9223]
+
+        # A replacement standby is launched in the background on the failed primary's slot
+        await manager.hot_spare_task
+        assert manager.hot_spare is not None and manager.hot_spare.remote_debugging_port == 9222
+        assert launches == [9222, 9223, 9222]
+    finally:
+        await manager.stop_browser()
+
+
+@pytest.mark.anyio
+async def test_disconnected_hot_spare_is_replaced(manager, monkeypatch: pytest.MonkeyPatch):
+    launches: list[int] = []
+
+    async def fake_launch_browser(remote_debugging_port=None, user_data_dir=None, log_path=None):
+        launches.append(remote_debugging_port)
+        process = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+        return LaunchedBrowser(process=process, remote_debugging_port=remote_debugging_port,
+                               user_data_dir=user_data_dir)
+
+    monkeypatch.setattr(hot_spare_module, "launch_browser", fake_launch_browser)
+
+    try:
+        await manager.connect_browser()
+        manager.enable_hot_spare()
+        await manager.hot_spare_task
+        stale = manager.hot_spare
+        # The standby's CDP connection drops; HotSpare never reconnects by itself
+        stale.browser.emit_disconnected()
+        await manager.hot_spare_task
+
+        assert manager.hot_spare is not stale and manager.hot_spare.is_ready()
+        assert stale.browser is None
+        assert launches == [9223, 9223]
+    finally:
+        await manager.stop_browser()
+
+
+@pytest.mark.anyio
+async def test_reconnect_reuses_the_shared_playwright_driver(manager):
+    await manager.connect_browser()
+    playwright = manager.playwright
+
+    await manager.reset_browser_state()
+    await manager.connect_browser(reconnect=True)
+
+    assert manager.playwright is playwright
+    assert driver_module.get_playwright_driver().starts == 1
+    assert len(playwright.chromium.connects) == 2
+
+
+@pytest.mark.anyio
+async def test_context_pool_follows_the_current_browser(manager):
+    context = await manager.acquire_context()
+    first_pool = manager.context_pool
+    first_pool.max_uses = 5
+    await manager.release_context(context)
+    assert context.closed is False
+
+    manager.browser.emit_disconnected()
+    await manager.connect_browser()
+    replacement = await manager.acquire_context()
+
+    assert manager.context_pool is not first_pool
+    assert first_pool.closed is True
+    assert context.closed is True
+    assert replacement is not context
+
+
+def test_one_manager_per_event_loop_and_per_explicit_key():
+    BrowserManager._instances = {}
+    try:
+        managers: dict[str, BrowserManager] = {}
+
+        def run_loop(name: str) -> None:
+            async def create() -> None:
+                managers[name] = BrowserManager()
+                assert BrowserManager() is managers[name]
+            asyncio.run(create())
+
+        threads = [threading.Thread(target=run_loop, args=(name,)) for name in ("a", "b")]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert managers["a"] is not managers["b"]
+        assert BrowserManager() is BrowserManager()
+        assert BrowserManager().key is None
+        assert BrowserManager(key="remote") is BrowserManager(key="remote")
+        assert BrowserManager(key="remote") is not BrowserManager()
+    finally:
+        BrowserManager._instances = {}
+
+
+def test_managers_of_closed_event_loops_are_forgotten():
+    BrowserManager._instances = {}
+    try:
+        async def create() -> BrowserManager:
+            return BrowserManager()
+
+        first = asyncio.run(create())
+        second = asyncio.run(create())
+
+        assert first is not second
+        assert list(BrowserManager._instances.values()) == [second]
+    finally:
+        BrowserManager._instances = {}
+
+
+@pytest.mark.anyio
+async def test_port_launch_lock_is_exclusive_across_threads():
+    entered = threading.Event()
+    release = threading.Event()
+
+    def hold_in_other_loop() -> None:
+        async def hold() -> None:
+            async with manager_module.port_launch_lock(9555):
+                entered.set()
+                while not release.is_set():
+                    await asyncio.sleep(0.001)
+        asyncio.run(hold())
+
+    holder = threading.Thread(target=hold_in_other_loop)
+    holder.start()
+    entered.wait()
+
+    async def acquire() -> None:
+        async with manager_module.port_launch_lock(9555):
+            pass
+
+    waiter = asyncio.ensure_future(acquire())
+    await asyncio.sleep(0.05)
+    assert not waiter.done()
+
+    release.set()
+    await asyncio.wait_for(waiter, 1)
+    holder.join()
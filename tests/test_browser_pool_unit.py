@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import weakref
+
+import pytest
+
+import brui_core.browser.browser_pool as pool_module
+import brui_core.browser.playwright_driver as driver_module
+from brui_core.browser.browser_launcher import LaunchedBrowser
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+class FakeBrowser:
+    def __init__(self, endpoint_url: str) -> None:
+        self.endpoint_url = endpoint_url
+        self.connected = True
+
+    def is_connected(self) -> bool:
+        return self.connected
+
+    async def close(self) -> None:
+        self.connected = False
+
+
+class FakeChromium:
+    async def connect_over_cdp(self, endpoint_url: str) -> FakeBrowser:
+        return FakeBrowser(endpoint_url)
+
+
+class FakePlaywright:
+    def __init__(self) -> None:
+        self.chromium = FakeChromium()
+        self.stopped = False
+
+    async def stop(self) -> None:
+        self.stopped = True
+
+
+class FakePlaywrightStarter:
+    async def start(self) -> FakePlaywright:
+        return FakePlaywright()
+
+
+@pytest.fixture
+def fake_pool(monkeypatch: pytest.MonkeyPatch, tmp_path):
+    launched: list[dict] = []
+    terminated: list[int] = []
+
+    async def fake_is_open(_port):
+        return False
+
+    async def fake_launch_browser(**kwargs):
+        launched.append(kwargs)
+        return LaunchedBrowser(
+            process=None,
+            remote_debugging_port=kwargs["remote_debugging_port"],
+            user_data_dir=kwargs["user_data_dir"],
+        )
+
+    async def fake_terminate(launched_browser):
+        terminated.append(launched_browser.remote_debugging_port)
+
+    monkeypatch.setattr(driver_module, "async_playwright", FakePlaywrightStarter)
+    monkeypatch.setattr(driver_module, "_drivers", weakref.WeakKeyDictionary())
+    monkeypatch.setattr(pool_module, "is_browser_opened_in_debug_mode", fake_is_open)
+    monkeypatch.setattr(pool_module, "launch_browser", fake_launch_browser)
+    monkeypatch.setattr(pool_module, "terminate_launched_browser", fake_terminate)
+
+    pool = pool_module.BrowserPool(size=3, base_port=9300, user_data_root=str(tmp_path))
+    pool.launched_calls = launched
+    pool.terminated_ports = terminated
+    return pool
+
+
+@pytest.mark.anyio
+async def test_start_launches_each_instance_on_its_own_port_and_profile(fake_pool, tmp_path):
+    await fake_pool.start()
+
+    ports = sorted(call["remote_debugging_port"] for call in fake_pool.launched_calls)
+    dirs = {call["user_data_dir"] for call in fake_pool.launched_calls}
+    assert ports == [9300, 9301, 9302]
+    assert dirs == {str(tmp_path / f"instance-{i}") for i in range(3)}
+
+
+@pytest.mark.anyio
+async def test_lease_picks_least_loaded_browser(fake_pool):
+    first = await fake_pool.lease()
+    second = await fake_pool.lease()
+    third = await fake_pool.lease()
+
+    assert len({id(first.browser), id(second.browser), id(third.browser)}) == 3
+
+    await fake_pool.release(second)
+    assert (await fake_pool.lease()).instance is second.instance
+
+
+@pytest.mark.anyio
+async def test_release_after_reconnect_frees_the_instance(fake_pool):
+    lease = await fake_pool.lease()
+    instance = lease.instance
+    instance.browser.connected = False
+    # Leasing again reconnects the instance with a new Browser object
+    fake_pool.instances = [instance]
+    second = await fake_pool.lease()
+    assert second.browser is not lease.browser
+    assert instance.leases == 2
+
+    await fake_pool.release(lease)
+    await fake_pool.release(lease)
+    assert instance.leases == 1
+
+
+@pytest.mark.anyio
+async def test_lease_skips_disconnected_instance_until_reconnected(fake_pool):
+    await fake_pool.start()
+    dead = fake_pool.instances[0].browser
+    dead.connected = False
+
+    lease = await fake_pool.lease()
+
+    assert lease.browser is not dead
+    assert fake_pool.instances[0].leases == 0
+
+
+@pytest.mark.anyio
+async def test_stop_terminates_only_launched_instances(fake_pool):
+    await fake_pool.start()
+    playwright = fake_pool.playwright
+
+    await fake_pool.stop()
+
+    assert sorted(fake_pool.terminated_ports) == [9300, 9301, 9302]
+    # The driver is shared with other connections and outlives the pool
+    assert playwright.stopped is False
+    assert all(instance.browser is None for instance in fake_pool.instances)
+    assert fake_pool.started is False
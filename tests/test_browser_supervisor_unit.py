@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import asyncio
+import subprocess
+import sys
+
+import pytest
+
+from brui_core.browser.browser_launcher import LaunchedBrowser, watch_process_exit
+from brui_core.browser.browser_supervisor import BrowserSupervisor, SupervisorEvent
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+def spawn(code: str) -> subprocess.Popen:
+    return subprocess.Popen([sys.executable, "-c", code])
+
+
+class FakeLauncher:
+    def __init__(self, scripts: list[str]) -> None:
+        self.scripts = list(scripts)
+        self.launched: list[LaunchedBrowser] = []
+
+    async def __call__(self) -> LaunchedBrowser:
+        script = self.scripts.pop(0) if len(self.scripts) > 1 else self.scripts[0]
+        launched = LaunchedBrowser(process=spawn(script), remote_debugging_port=9222, user_data_dir=None)
+        self.launched.append(launched)
+        return launched
+
+
+async def wait_until(predicate, timeout: float = 5) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("condition not reached in time")
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.anyio
+async def test_watch_process_exit_reaps_child():
+    process = spawn("import sys; sys.exit(3)")
+
+    returncode = await asyncio.wait_for(watch_process_exit(process), 5)
+
+    assert returncode == 3
+    assert process.returncode == 3
+
+
+@pytest.mark.anyio
+async def test_crash_is_restarted_with_events():
+    launcher = FakeLauncher(["import sys; sys.exit(1)", "import time; time.sleep(30)"])
+    supervisor = BrowserSupervisor(launch=launcher, backoff_initial=0.01)
+    events: list[SupervisorEvent] = []
+    supervisor.add_listener(lambda event, _launched: events.append(event))
+
+    await supervisor.start()
+    await wait_until(lambda: len(launcher.launched) == 2 and supervisor.running.is_set())
+
+    assert events[:4] == [
+        SupervisorEvent.STARTED,
+        SupervisorEvent.EXITED,
+        SupervisorEvent.RESTARTING,
+        SupervisorEvent.STARTED,
+    ]
+    assert supervisor.launched is launcher.launched[1]
+
+    await supervisor.stop()
+    assert events[-1] is SupervisorEvent.STOPPED
+    assert launcher.launched[1].process.returncode is not None
+
+
+@pytest.mark.anyio
+async def test_gives_up_after_bounded_restarts():
+    launcher = FakeLauncher(["import sys; sys.exit(1)"])
+    supervisor = BrowserSupervisor(launch=launcher, max_restarts=2, backoff_initial=0.01)
+    events: list[SupervisorEvent] = []
+    supervisor.add_listener(lambda event, _launched: events.append(event))
+
+    await supervisor.start()
+    await wait_until(lambda: not supervisor.is_supervising())
+
+    assert events[-1] is SupervisorEvent.GAVE_UP
+    assert len(launcher.launched) == 3
+    assert supervisor.launched is None
+
+
+@pytest.mark.anyio
+async def test_clean_exit_is_not_restarted():
+    launcher = FakeLauncher(["pass"])
+    supervisor = BrowserSupervisor(launch=launcher, backoff_initial=0.01)
+
+    await supervisor.start()
+    await wait_until(lambda: not supervisor.is_supervising())
+
+    assert len(launcher.launched) == 1
+    assert supervisor.launched is None
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+
+import brui_core.clipboard.clipboard_manager as manager_module
+import brui_core.clipboard.clipboard_watcher as watcher_module
+from brui_core.clipboard.clipboard_watcher import ClipboardWatcher
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+class FakeClipboard:
+    def __init__(self, content: str = "") -> None:
+        self.content = content
+        self.lock = threading.Lock()
+
+    def paste(self) -> str:
+        with self.lock:
+            return self.content
+
+    def copy(self, text: str) -> None:
+        with self.lock:
+            self.content = text
+
+
+async def wait_until(predicate, timeout: float = 2.0) -> None:
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not predicate():
+        assert loop.time() < deadline
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.anyio
+async def test_concurrent_waiters_share_one_reader() -> None:
+    clipboard = FakeClipboard()
+    watcher = ClipboardWatcher(poll_interval=0.02, paste=clipboard.paste, use_notify=False)
+
+    waiters = [asyncio.create_task(watcher.wait_for_change("")) for _ in range(20)]
+    await asyncio.sleep(0.1)
+    reads_before_change = watcher.reads
+    clipboard.copy("copied text")
+
+    assert await asyncio.gather(*waiters) == ["copied text"] * 20
+    # One read per poll interval for all twenty waiters, not one per waiter
+    assert reads_before_change <= 10
+    await wait_until(lambda: watcher.thread is None)
+    assert watcher.current is None
+
+
+@pytest.mark.anyio
+async def test_timeout_and_cancellation_remove_waiters() -> None:
+    clipboard = FakeClipboard()
+    watcher = ClipboardWatcher(poll_interval=0.01, paste=clipboard.paste, use_notify=False)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await watcher.wait_for_change("", timeout=0.05)
+    assert watcher.waiters == []
+
+    waiter = asyncio.create_task(watcher.wait_for_change(""))
+    await asyncio.sleep(0.03)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert watcher.waiters == []
+    # The thread goes away once nobody is waiting
+    await wait_until(lambda: watcher.thread is None)
+
+
+@pytest.mark.anyio
+async def test_read_errors_are_raised_in_waiters() -> None:
+    def broken_paste() -> str:
+        raise RuntimeError("no display")
+
+    watcher = ClipboardWatcher(poll_interval=0.01, paste=broken_paste, use_notify=False)
+    with pytest.raises(RuntimeError, match="no display"):
+        await watcher.wait_for_change("", timeout=1)
+
+
+@pytest.mark.anyio
+async def test_notify_command_triggers_reads() -> None:
+    clipboard = FakeClipboard()
+    # Stands in for clipnotify: exits successfully when "the clipboard changed"
+    watcher = ClipboardWatcher(paste=clipboard.paste, notify_command=["sleep", "0.1"])
+
+    waiter = asyncio.create_task(watcher.wait_for_change(""))
+    await asyncio.sleep(0.02)
+    clipboard.copy("notified")
+    assert await asyncio.wait_for(waiter, 2) == "notified"
+    assert watcher.notify_command == ["sleep", "0.1"]
+
+
+@pytest.mark.anyio
+async def test_failing_notify_command_falls_back_to_polling() -> None:
+    clipboard = FakeClipboard()
+    watcher = ClipboardWatcher(poll_interval=0.01, paste=clipboard.paste, notify_command=["false"])
+
+    waiter = asyncio.create_task(watcher.wait_for_change(""))
+    await wait_until(lambda: watcher.notify_command is None)
+    clipboard.copy("polled")
+    assert await asyncio.wait_for(waiter, 2) == "polled"
+
+
+@pytest.mark.anyio
+async def test_wait_for_clipboard_content_clears_after_change(monkeypatch: pytest.MonkeyPatch) -> None:
+    clipboard = FakeClipboard()
+    monkeypatch.setattr(watcher_module.pyperclip, "copy", clipboard.copy)
+    monkeypatch.setattr(watcher_module, "_watcher", ClipboardWatcher(
+        poll_interval=0.01, paste=clipboard.paste, use_notify=False))
+
+    waiter = asyncio.create_task(manager_module.wait_for_clipboard_content(timeout=2))
+    await asyncio.sleep(0.03)
+    clipboard.copy("answer")
+    assert await waiter == "answer"
+    assert clipboard.content == ""
+
+    with pytest.raises(asyncio.TimeoutError):
+        await manager_module.wait_for_clipboard_content(timeout=0.05)
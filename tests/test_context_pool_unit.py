@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from brui_core.browser.context_pool import ContextPool
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+class FakePage:
+    def __init__(self) -> None:
+        self.closed = False
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class FakeContext:
+    def __init__(self) -> None:
+        self.pages: list[FakePage] = []
+        self.cookies_cleared = 0
+        self.closed = False
+
+    async def clear_cookies(self) -> None:
+        self.cookies_cleared += 1
+
+    async def clear_permissions(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self) -> None:
+        self.created: list[FakeContext] = []
+
+    def is_connected(self) -> bool:
+        return True
+
+    async def new_context(self, **_options) -> FakeContext:
+        context = FakeContext()
+        self.created.append(context)
+        return context
+
+
+async def settle(pool: ContextPool) -> None:
+    if pool.refill_task is not None:
+        await pool.refill_task
+    await asyncio.sleep(0)
+
+
+@pytest.mark.anyio
+async def test_pool_prewarms_and_refills_after_acquire():
+    browser = FakeBrowser()
+    pool = ContextPool(browser, size=2)
+    pool.warm()
+    await settle(pool)
+    assert len(pool.idle) == 2
+
+    context = await pool.acquire()
+    await settle(pool)
+
+    assert context in browser.created[:2]
+    assert len(pool.idle) == 2
+    assert len(browser.created) == 3
+
+
+@pytest.mark.anyio
+async def test_release_clears_context_for_reuse():
+    pool = ContextPool(FakeBrowser(), size=0, max_uses=5)
+    context = await pool.acquire()
+    page = FakePage()
+    context.pages.append(page)
+
+    await pool.release(context)
+
+    assert page.closed is True
+    assert context.cookies_cleared == 1
+    assert context.closed is False
+    assert await pool.acquire() is context
+
+
+@pytest.mark.anyio
+async def test_contexts_are_not_reused_by_default():
+    pool = ContextPool(FakeBrowser(), size=0)
+    context = await pool.acquire()
+
+    await pool.release(context)
+
+    assert context.closed is True
+    assert await pool.acquire() is not context
+
+
+@pytest.mark.anyio
+async def test_context_is_replaced_after_max_uses_or_recycle():
+    pool = ContextPool(FakeBrowser(), size=0, max_uses=2)
+    context = await pool.acquire()
+    await pool.release(context)
+    assert await pool.acquire() is context
+    await pool.release(context)
+    assert context.closed is True
+
+    other = await pool.acquire()
+    assert other is not context
+    await pool.release(other, recycle=True)
+    assert other.closed is True
+    assert not pool.idle
+
+
+@pytest.mark.anyio
+async def test_close_closes_idle_and_in_use_contexts():
+    pool = ContextPool(FakeBrowser(), size=1)
+    pool.warm()
+    await settle(pool)
+    in_use = await pool.acquire()
+    await settle(pool)
+    idle = pool.idle[0]
+
+    await pool.close()
+
+    assert in_use.closed is True and idle.closed is True
+    with pytest.raises(RuntimeError, match="closed"):
+        await pool.acquire()
@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import socket
+import stat
+
+import pytest
+
+from brui_core.browser.page_scheduler import PageScheduler
+from brui_core.daemon.client import DaemonClient
+from brui_core.daemon.protocol import DaemonError
+from brui_core.daemon.server import BrowserDaemon, resolve_task
+from brui_core.ui_integrator import UIIntegrator
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+class FakeSession:
+    def __init__(self, target_id: str) -> None:
+        self.target_id = target_id
+
+    async def send(self, method: str, params=None):
+        assert method == "Target.getTargetInfo"
+        return {"targetInfo": {"targetId": self.target_id}}
+
+    async def detach(self) -> None:
+        pass
+
+
+class FakeContext:
+    async def new_cdp_session(self, page: "FakePage") -> FakeSession:
+        return FakeSession(page.target_id)
+
+
+class FakePage:
+    def __init__(self, target_id: str) -> None:
+        self.target_id = target_id
+        self.context = FakeContext()
+
+
+class FakePagePool:
+    def __init__(self) -> None:
+        self.created = 0
+        self.idle: list[FakePage] = []
+
+    async def acquire(self) -> FakePage:
+        if self.idle:
+            return self.idle.pop()
+        self.created += 1
+        return FakePage(f"TARGET{self.created}")
+
+    async def release(self, page: FakePage, clear_storage: bool | None = None, discard: bool = False) -> None:
+        self.idle.append(page)
+
+
+class FakeBrowserManager:
+    def __init__(self) -> None:
+        self.page_scheduler = PageScheduler(max_concurrent_pages=4)
+        self.page_pool = FakePagePool()
+        self.endpoint = None
+        self.remote_debugging_port = 9333
+
+    def get_page_pool(self, context) -> FakePagePool:
+        return self.page_pool
+
+
+class FakeIntegrator(UIIntegrator):
+    def __init__(self, **kwargs) -> None:
+        super().__init__(browser_manager=FakeBrowserManager(), **kwargs)
+        self.closed_browser = None
+
+    async def initialize(self) -> None:
+        self.context = object()
+        self.initialized = True
+
+    async def close(self, close_page=True, close_context=False, close_browser=False) -> None:
+        self.closed_browser = close_browser
+
+
+async def page_task(page, item):
+    return {"target": page.target_id, "doubled": item * 2}
+
+
+async def unserializable_task(page, item):
+    return object()
+
+
+@pytest.fixture
+async def daemon(tmp_path):
+    daemon = BrowserDaemon(str(tmp_path / "brui.sock"), integrator_factory=FakeIntegrator)
+    await daemon.start()
+    yield daemon
+    await daemon.stop()
+
+
+@pytest.mark.anyio
+async def test_client_runs_tasks_on_pooled_pages(daemon):
+    assert stat.S_IMODE(os.stat(daemon.socket_path).st_mode) == 0o600
+
+    async with DaemonClient(daemon.socket_path) as client:
+        assert (await client.ping())["pid"] == os.getpid()
+        first = await client.run(f"{__name__}:page_task", 21)
+        second = await client.run(f"{__name__}:page_task", 2)
+
+    assert first == {"target": "TARGET1", "doubled": 42}
+    # The page went back to the pool and was reused
+    assert second == {"target": "TARGET1", "doubled": 4}
+    assert daemon.integrator.browser_manager.page_scheduler.running == 0
+
+
+@pytest.mark.anyio
+async def test_errors_are_reported_to_the_client(daemon):
+    async with DaemonClient(daemon.socket_path) as client:
+        with pytest.raises(DaemonError, match="Unknown op") as excinfo:
+            await client.request("reboot")
+        assert excinfo.value.error_type == "ValueError"
+        with pytest.raises(DaemonError) as excinfo:
+            await client.run(f"{__name__}:unserializable_task")
+        assert excinfo.value.error_type == "TypeError"
+        with pytest.raises(DaemonError):
+            await client.run("no_such_module_here:task")
+        # The connection survives failed requests
+        assert (await client.status())["leases"] == 0
+
+
+@pytest.mark.anyio
+async def test_leases_are_returned_on_release_and_disconnect(daemon):
+    scheduler = daemon.integrator.browser_manager.page_scheduler
+
+    async with DaemonClient(daemon.socket_path) as client:
+        lease = await client.lease_page()
+        assert lease["target_id"] == "TARGET1"
+        assert lease["page_ws_url"] == "ws://127.0.0.1:9333/devtools/page/TARGET1"
+        assert scheduler.running == 1
+        await client.release_page(lease["lease_id"])
+        assert scheduler.running == 0
+        with pytest.raises(DaemonError, match="Unknown lease"):
+            await client.release_page(lease["lease_id"])
+
+        await client.lease_page()
+        await client.lease_page()
+        assert (await client.status())["leases"] == 2
+
+    for _ in range(100):
+        if not daemon.leases:
+            break
+        await asyncio.sleep(0.01)
+    assert daemon.leases == {}
+    assert scheduler.running == 0
+
+
+@pytest.mark.anyio
+async def test_stop_closes_browser_and_removes_socket(tmp_path):
+    daemon = BrowserDaemon(str(tmp_path / "brui.sock"), integrator_factory=FakeIntegrator)
+    await daemon.start()
+    await daemon.stop()
+
+    assert not os.path.exists(daemon.socket_path)
+    assert daemon.integrator.closed_browser is True
+    with pytest.raises(DaemonError, match="No brui-core daemon"):
+        await DaemonClient(daemon.socket_path).connect()
+
+
+@pytest.mark.anyio
+async def test_start_replaces_a_stale_socket_but_not_a_live_daemon(daemon, tmp_path):
+    second = BrowserDaemon(daemon.socket_path, integrator_factory=FakeIntegrator)
+    with pytest.raises(DaemonError, match="already listening"):
+        await second.start()
+    async with DaemonClient(daemon.socket_path) as client:
+        assert await client.ping()
+
+    stale_path = str(tmp_path / "stale.sock")
+    stale = socket.socket(socket.AF_UNIX)
+    stale.bind(stale_path)
+    stale.close()
+    third = BrowserDaemon(stale_path, integrator_factory=FakeIntegrator)
+    await third.start()
+    async with DaemonClient(stale_path) as client:
+        assert await client.ping()
+    await third.stop()
+
+
+@pytest.mark.anyio
+async def test_start_never_deletes_a_file_that_is_not_a_socket(tmp_path):
+    path = tmp_path / "notes.txt"
+    path.write_text("keep me")
+    daemon = BrowserDaemon(str(path), integrator_factory=FakeIntegrator)
+
+    with pytest.raises(DaemonError, match="not a socket"):
+        await daemon.start()
+    assert path.read_text() == "keep me"
+
+
+def test_resolve_task_rejects_malformed_specs():
+    assert resolve_task(f"{__name__}:page_task") is page_task
+    with pytest.raises(ValueError, match="module:function"):
+        resolve_task("page_task")
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from PIL import Image, ImageDraw
+
+from brui_core.screenshot.image_hash import dhash, hamming_distance
+
+
+def draw_box(size: tuple[int, int], box: tuple[int, int, int, int]) -> Image.Image:
+    image = Image.new("RGB", size, "white")
+    ImageDraw.Draw(image).rectangle(box, fill="black")
+    return image
+
+
+def test_dhash_ignores_scale_but_not_content() -> None:
+    large = draw_box((800, 600), (100, 100, 400, 300))
+    small = draw_box((200, 150), (25, 25, 100, 75))
+    moved = draw_box((800, 600), (400, 300, 700, 500))
+
+    assert hamming_distance(dhash(large), dhash(small)) <= 2
+    assert hamming_distance(dhash(large), dhash(moved)) > 10
+
+
+def test_dhash_size_controls_bit_count() -> None:
+    image = draw_box((64, 64), (0, 0, 31, 63))
+    assert dhash(image, hash_size=16).bit_length() <= 256
+    assert dhash(Image.new("L", (10, 10))) == 0
+    assert hamming_distance(0b1011, 0b0110) == 3
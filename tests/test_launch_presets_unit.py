@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import pytest
+
+from brui_core.browser.browser_launcher import get_browser_config
+from brui_core.browser.launch_presets import (
+    LAUNCH_PRESETS,
+    get_launch_preset_args,
+    register_launch_preset,
+)
+
+
+def test_builtin_presets():
+    assert get_launch_preset_args() == []
+    assert get_launch_preset_args("headless") == ["--headless=new"]
+    lean = get_launch_preset_args("lean")
+    assert "--disable-background-networking" in lean
+    assert "--disable-component-update" in lean
+    assert "--headless=new" not in lean
+    assert get_launch_preset_args("lean-headless")[0] == "--headless=new"
+
+
+def test_extra_args_are_appended_and_shell_split():
+    assert get_launch_preset_args("headless", "--window-size=800,600 '--lang=en US'") == [
+        "--headless=new",
+        "--window-size=800,600",
+        "--lang=en US",
+    ]
+    assert get_launch_preset_args("default", ["--mute-audio"]) == ["--mute-audio"]
+
+
+def test_unknown_preset_is_rejected():
+    with pytest.raises(ValueError, match="Unknown launch preset"):
+        get_launch_preset_args("turbo")
+
+
+def test_register_custom_preset(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setitem(LAUNCH_PRESETS, "kiosk", ())
+    register_launch_preset("kiosk", ["--kiosk"])
+    assert get_launch_preset_args("kiosk") == ["--kiosk"]
+
+
+def test_preset_and_extra_args_from_environment(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("CHROME_LAUNCH_PRESET", "lean")
+    monkeypatch.setenv("CHROME_EXTRA_ARGS", "--mute-audio --disable-gpu")
+
+    config = get_browser_config()["browser"]
+
+    assert config["launch_preset"] == "lean"
+    assert config["launch_extra_args"] == ("--mute-audio", "--disable-gpu")
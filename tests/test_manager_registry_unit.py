@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import asyncio
+import weakref
+
+import pytest
+
+import brui_core.browser.browser_manager as manager_module
+import brui_core.browser.playwright_driver as driver_module
+from brui_core.browser.browser_endpoint import BrowserEndpoint, parse_endpoint
+from brui_core.browser.browser_manager import BrowserManager
+from brui_core.browser.manager_registry import get_browser_manager, least_loaded_manager, registered_managers
+from brui_core.singleton_meta import SingletonMeta
+from brui_core.ui_integrator import UIIntegrator
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+class FakeBrowser:
+    def __init__(self, endpoint_url: str) -> None:
+        self.endpoint_url = endpoint_url
+
+    def on(self, event: str, callback) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+
+class FakeChromium:
+    async def connect_over_cdp(self, endpoint_url: str) -> FakeBrowser:
+        return FakeBrowser(endpoint_url)
+
+
+class FakePlaywright:
+    def __init__(self) -> None:
+        self.chromium = FakeChromium()
+
+
+class FakePlaywrightStarter:
+    async def start(self) -> FakePlaywright:
+        return FakePlaywright()
+
+
+@pytest.fixture(autouse=True)
+def fresh_registry(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(driver_module, "async_playwright", FakePlaywrightStarter)
+    monkeypatch.setattr(driver_module, "_drivers", weakref.WeakKeyDictionary())
+    BrowserManager._instances = {}
+    yield
+    BrowserManager._instances = {}
+
+
+@pytest.fixture
+async def fake_cdp_servers():
+    async def accept(reader, writer):
+        writer.close()
+
+    servers = [await asyncio.start_server(accept, "127.0.0.1", 0) for _ in range(2)]
+    yield [f"127.0.0.1:{server.sockets[0].getsockname()[1]}" for server in servers]
+    for server in servers:
+        server.close()
+        await server.wait_closed()
+
+
+def test_parse_endpoint_forms():
+    assert parse_endpoint("chrome-1:9222") == BrowserEndpoint("chrome-1", 9222)
+    assert parse_endpoint(9300) == BrowserEndpoint("127.0.0.1", 9300)
+    assert parse_endpoint("http://localhost:9222/").key == "localhost:9222"
+    ws = parse_endpoint("ws://10.0.0.5:9222/devtools/browser/abc")
+    assert (ws.host, ws.port, ws.connect_url) == ("10.0.0.5", 9222, "ws://10.0.0.5:9222/devtools/browser/abc")
+    with pytest.raises(ValueError):
+        parse_endpoint("no-port-here")
+
+
+@pytest.mark.anyio
+async def test_one_manager_per_endpoint():
+    first = get_browser_manager("127.0.0.1:9300")
+
+    assert get_browser_manager("http://127.0.0.1:9300") is first
+    assert get_browser_manager("127.0.0.1:9301") is not first
+    assert get_browser_manager() is not first
+    assert first.remote_debugging_port == 9300
+
+    class OtherSingleton(metaclass=SingletonMeta):
+        pass
+
+    OtherSingleton()
+    assert len(registered_managers()) == 3
+    assert all(isinstance(manager, BrowserManager) for manager in registered_managers())
+
+
+@pytest.mark.anyio
+async def test_endpoint_managers_connect_to_their_own_browser(fake_cdp_servers):
+    browsers = []
+    for endpoint in fake_cdp_servers:
+        manager = get_browser_manager(endpoint)
+        browsers.append(await manager.connect_browser())
+
+    assert [browser.endpoint_url for browser in browsers] == [f"http://{endpoint}" for endpoint in fake_cdp_servers]
+
+
+@pytest.mark.anyio
+async def test_unreachable_endpoint_is_never_launched(monkeypatch: pytest.MonkeyPatch, fake_cdp_servers):
+    async def no_launch():
+        raise AssertionError("endpoint managers must not launch Chrome")
+
+    def no_kill(_port):
+        raise AssertionError("endpoint managers must not kill Chrome")
+
+    monkeypatch.setattr(manager_module, "kill_chrome_for_port", no_kill)
+    manager = get_browser_manager("127.0.0.1:1")
+    manager.supervisor.launch = no_launch
+
+    with pytest.raises(ConnectionError, match="No browser is reachable"):
+        await manager.ensure_browser_launched()
+
+    reachable = get_browser_manager(fake_cdp_servers[0])
+    await reachable.connect_browser()
+    await reachable.stop_browser()
+    assert reachable.browser is None
+
+
+@pytest.mark.anyio
+async def test_least_loaded_endpoint_is_selected(fake_cdp_servers):
+    busy, idle = (get_browser_manager(endpoint) for endpoint in fake_cdp_servers)
+    await busy.page_scheduler.acquire()
+
+    assert all(least_loaded_manager(fake_cdp_servers) is idle for _ in range(3))
+
+    busy.page_scheduler.release()
+    picks = {least_loaded_manager(fake_cdp_servers) for _ in range(4)}
+    assert picks == {busy, idle}
+
+    integrator = UIIntegrator.least_loaded(fake_cdp_servers, context_mode="isolated")
+    assert integrator.browser_manager in (busy, idle)
+    assert integrator.context_mode == "isolated"
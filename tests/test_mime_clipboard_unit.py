@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+from PIL import Image, UnidentifiedImageError
+
+import brui_core.clipboard.mime_clipboard as clipboard_module
+from brui_core.clipboard.mime_clipboard import (
+    MIME_HTML,
+    MIME_PNG,
+    ClipboardError,
+    ClipboardPayloadTooLarge,
+    iter_clipboard_bytes,
+    list_clipboard_targets,
+    read_clipboard,
+    read_clipboard_image,
+    write_clipboard,
+    write_clipboard_image,
+)
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+# Stores each target in a file of the store directory, like a clipboard owner offering several targets
+FAKE_XCLIP = textwrap.dedent("""\
+    #!{python}
+    import os, sys
+    store = {store!r}
+    args = sys.argv[1:]
+    target = args[args.index("-t") + 1]
+    if "-i" in args:
+        for name in os.listdir(store):
+            os.unlink(os.path.join(store, name))
+        with open(os.path.join(store, target.replace("/", "%")), "wb") as f:
+            f.write(sys.stdin.buffer.read())
+    elif target == "TARGETS":
+        print("TARGETS")
+        for name in sorted(os.listdir(store)):
+            print(name.replace("%", "/"))
+    else:
+        path = os.path.join(store, target.replace("/", "%"))
+        if not os.path.exists(path):
+            sys.stderr.write(f"Error: target {{target}} not available\\n")
+            sys.exit(1)
+        with open(path, "rb") as f:
+            sys.stdout.buffer.write(f.read())
+""")
+
+
+@pytest.fixture(autouse=True)
+def fake_xclip(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    store = tmp_path / "clipboard"
+    store.mkdir()
+    script = tmp_path / "xclip"
+    script.write_text(FAKE_XCLIP.format(python=sys.executable, store=str(store)))
+    script.chmod(0o755)
+    monkeypatch.setattr(clipboard_module, "XCLIP_COMMAND", str(script))
+    return store
+
+
+@pytest.mark.anyio
+async def test_html_round_trip_and_targets() -> None:
+    await write_clipboard("<b>bold</b>", MIME_HTML)
+
+    assert await list_clipboard_targets() == ["TARGETS", MIME_HTML]
+    content = await read_clipboard(MIME_HTML)
+    assert content.mime_type == MIME_HTML
+    assert content.text == "<b>bold</b>"
+
+
+@pytest.mark.anyio
+async def test_image_round_trip_decodes_lazily() -> None:
+    await write_clipboard_image(Image.new("RGB", (32, 16), "red"))
+
+    content = await read_clipboard(MIME_PNG)
+    assert content.data.startswith(b"\x89PNG")
+    assert content._image is None
+    assert content.image.size == (32, 16)
+    assert content.image is content.image
+
+    image = await read_clipboard_image()
+    assert image.getpixel((0, 0)) == (255, 0, 0)
+
+
+@pytest.mark.anyio
+async def test_large_payloads_stream_in_chunks_and_respect_the_cap() -> None:
+    payload = bytes(range(256)) * 1024
+    await write_clipboard(payload, "application/octet-stream")
+
+    chunks = [chunk async for chunk in iter_clipboard_bytes("application/octet-stream", chunk_size=16 * 1024)]
+    assert all(len(chunk) <= 16 * 1024 for chunk in chunks)
+    assert b"".join(chunks) == payload
+
+    with pytest.raises(ClipboardPayloadTooLarge):
+        await read_clipboard("application/octet-stream", max_bytes=100 * 1024)
+
+
+@pytest.mark.anyio
+async def test_missing_target_and_missing_xclip_raise_clipboard_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    with pytest.raises(ClipboardError, match="not available"):
+        await read_clipboard(MIME_PNG)
+
+    monkeypatch.setattr(clipboard_module, "XCLIP_COMMAND", "/nonexistent/xclip")
+    with pytest.raises(ClipboardError, match="required"):
+        await read_clipboard(MIME_PNG)
+
+
+def test_non_image_payload_fails_on_decode() -> None:
+    content = clipboard_module.ClipboardContent(MIME_PNG, b"not an image")
+    assert len(content) == 12
+    with pytest.raises(UnidentifiedImageError):
+        content.image
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+import brui_core.browser.page_pool as page_pool_module
+from brui_core.browser.page_pool import PagePool
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+class FakeEmitter:
+    def __init__(self) -> None:
+        self.events: dict[str, list] = {"close": [self.internal_handler]}
+
+    def internal_handler(self, *_args) -> None:
+        pass
+
+    def event_names(self):
+        return list(self.events)
+
+    def listeners(self, event):
+        return list(self.events.get(event, []))
+
+    def remove_listener(self, event, listener) -> None:
+        self.events[event].remove(listener)
+
+
+class FakePage:
+    def __init__(self) -> None:
+        self._impl_obj = FakeEmitter()
+        self.url = "about:blank"
+        self.closed = False
+        self.unrouted = 0
+        self.evaluated: list[str] = []
+
+    def is_closed(self) -> bool:
+        return self.closed
+
+    def on(self, event, handler) -> None:
+        self._impl_obj.events.setdefault(event, []).append(handler)
+
+    async def unroute_all(self, behavior=None) -> None:
+        self.unrouted += 1
+
+    async def evaluate(self, script: str) -> None:
+        self.evaluated.append(script)
+
+    async def goto(self, url: str) -> None:
+        self.url = url
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class FakeContext:
+    def __init__(self) -> None:
+        self.created: list[FakePage] = []
+
+    async def new_page(self) -> FakePage:
+        page = FakePage()
+        self.created.append(page)
+        return page
+
+
+async def settle(pool: PagePool) -> None:
+    if pool.refill_task is not None:
+        await pool.refill_task
+    await asyncio.sleep(0)
+
+
+@pytest.mark.anyio
+async def test_pages_are_precreated_and_reset_instead_of_closed():
+    context = FakeContext()
+    pool = PagePool(context, size=1, clear_storage=True)
+    pool.warm()
+    await settle(pool)
+
+    page = await pool.acquire()
+    assert page is context.created[0]
+    page.on("console", lambda _msg: None)
+    page.url = "https://example.com/"
+
+    await pool.release(page)
+
+    assert page.closed is False
+    assert page.url == "about:blank"
+    assert page.unrouted == 1
+    assert page.evaluated == [page_pool_module.CLEAR_STORAGE_SCRIPT]
+    assert page._impl_obj.events == {"close": [page._impl_obj.internal_handler], "console": []}
+    assert await pool.acquire() is page
+
+
+@pytest.mark.anyio
+async def test_clear_storage_is_chosen_per_release():
+    pool = PagePool(FakeContext(), size=0)
+    page = await pool.acquire()
+    await pool.release(page)
+    assert page.evaluated == []
+
+    assert await pool.acquire() is page
+    await pool.release(page, clear_storage=True)
+    assert page.evaluated == [page_pool_module.CLEAR_STORAGE_SCRIPT]
+
+
+@pytest.mark.anyio
+async def test_page_is_closed_after_max_uses():
+    pool = PagePool(FakeContext(), size=0, max_uses=2)
+    page = await pool.acquire()
+    await pool.release(page)
+    assert await pool.acquire() is page
+    await pool.release(page)
+
+    assert page.closed is True
+    assert not pool.idle
+
+
+@pytest.mark.anyio
+async def test_closed_idle_pages_are_skipped():
+    pool = PagePool(FakeContext(), size=0)
+    page = await pool.acquire()
+    await pool.release(page)
+    page.closed = True
+
+    assert await pool.acquire() is not page
+
+
+@pytest.mark.anyio
+async def test_idle_pages_beyond_size_are_evicted_lazily(monkeypatch: pytest.MonkeyPatch):
+    now = [100.0]
+    monkeypatch.setattr(page_pool_module.time, "monotonic", lambda: now[0])
+    pool = PagePool(FakeContext(), size=1, idle_timeout=10)
+    first, second = await pool.acquire(), await pool.acquire()
+    await settle(pool)
+    warmed = pool.idle[0][0]
+    await pool.release(first)
+    await pool.release(second)
+    assert len(pool.idle) == 3
+
+    now[0] += 11
+    await pool.acquire()
+
+    # The two oldest idle pages went; the acquire then took the newest one
+    assert warmed.closed is True and first.closed is True
+    assert second.closed is False
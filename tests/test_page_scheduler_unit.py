@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from brui_core.browser.page_scheduler import AdmissionRejected, PageScheduler, Priority
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+async def enqueue(scheduler: PageScheduler, order: list, name: str, priority: Priority, deadline=None):
+    granted_at = await scheduler.acquire(priority, deadline)
+    order.append(name)
+    return granted_at
+
+
+@pytest.mark.anyio
+async def test_waiters_are_admitted_by_priority_then_fifo():
+    scheduler = PageScheduler(max_concurrent_pages=1)
+    held = await scheduler.acquire()
+    order: list[str] = []
+    tasks = [
+        asyncio.create_task(enqueue(scheduler, order, "low", Priority.LOW)),
+        asyncio.create_task(enqueue(scheduler, order, "normal-1", Priority.NORMAL)),
+        asyncio.create_task(enqueue(scheduler, order, "high", Priority.HIGH)),
+        asyncio.create_task(enqueue(scheduler, order, "normal-2", Priority.NORMAL)),
+    ]
+    await asyncio.sleep(0)
+    assert scheduler.stats().queue_depth == 4
+
+    scheduler.release(held)
+    for _ in tasks:
+        await asyncio.sleep(0)
+        # Each admitted waiter finishes straight away and hands its slot on
+        scheduler.release()
+    await asyncio.gather(*tasks)
+
+    assert order == ["high", "normal-1", "normal-2", "low"]
+    assert scheduler.running == 0
+    assert scheduler.stats().admitted == 5
+
+
+@pytest.mark.anyio
+async def test_concurrency_is_bounded():
+    scheduler = PageScheduler(max_concurrent_pages=2)
+    active = 0
+    peak = 0
+
+    async def work():
+        nonlocal active, peak
+        async with scheduler.slot():
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    await asyncio.gather(*(work() for _ in range(6)))
+
+    stats = scheduler.stats()
+    assert peak == 2
+    assert stats.running == 0
+    assert stats.admitted == 6
+    assert stats.max_wait > 0
+    assert stats.mean_hold > 0
+
+
+@pytest.mark.anyio
+async def test_deadline_expiry_rejects_and_frees_the_queue_entry():
+    scheduler = PageScheduler(max_concurrent_pages=1)
+    await scheduler.acquire()
+
+    with pytest.raises(AdmissionRejected, match="not admitted within"):
+        await scheduler.acquire(deadline=0.01)
+
+    stats = scheduler.stats()
+    assert stats.queue_depth == 0
+    assert stats.rejected == 1
+
+
+@pytest.mark.anyio
+async def test_deadline_shorter_than_estimated_wait_is_rejected_up_front():
+    scheduler = PageScheduler(max_concurrent_pages=1)
+    scheduler.mean_hold = 5.0
+    await scheduler.acquire()
+
+    with pytest.raises(AdmissionRejected, match="estimated wait"):
+        await scheduler.acquire(deadline=1.0)
+
+
+@pytest.mark.anyio
+async def test_full_queue_rejects():
+    scheduler = PageScheduler(max_concurrent_pages=1, max_queue=1)
+    await scheduler.acquire()
+    waiter = asyncio.create_task(scheduler.acquire())
+    await asyncio.sleep(0)
+
+    with pytest.raises(AdmissionRejected, match="queue is full"):
+        await scheduler.acquire()
+    waiter.cancel()
+    await asyncio.gather(waiter, return_exceptions=True)
+    assert scheduler.queue_depth() == 0
+
+
+@pytest.mark.anyio
+async def test_default_scheduler_admits_everything():
+    scheduler = PageScheduler()
+    for _ in range(100):
+        await asyncio.wait_for(scheduler.acquire(), 1)
+
+    assert scheduler.running == 100
+    assert scheduler.estimated_wait() == 0.0
+
+
+@pytest.mark.anyio
+async def test_exempt_slots_skip_the_queue_without_over_admitting():
+    scheduler = PageScheduler(max_concurrent_pages=1)
+    held = await scheduler.acquire()
+    nested = await scheduler.acquire(exempt=True)
+    assert scheduler.running == 2
+
+    waiter = asyncio.create_task(scheduler.acquire())
+    await asyncio.sleep(0)
+    # Still over the cap after this release, so the waiter keeps queueing
+    scheduler.release(nested)
+    await asyncio.sleep(0)
+    assert not waiter.done()
+    assert scheduler.running == 1
+
+    scheduler.release(held)
+    await waiter
+    assert scheduler.running == 1
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import weakref
+from types import SimpleNamespace
+
+import pytest
+
+import brui_core.browser.playwright_driver as driver_module
+from brui_core.browser.playwright_driver import get_playwright, get_playwright_driver, stop_playwright
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+class FakePlaywright:
+    def __init__(self) -> None:
+        self._impl_obj = SimpleNamespace(_connection=SimpleNamespace(
+            _closed_error=None,
+            _transport=SimpleNamespace(_proc=SimpleNamespace(returncode=None)),
+        ))
+        self.stopped = False
+
+    async def stop(self) -> None:
+        self.stopped = True
+
+
+class FakePlaywrightStarter:
+    async def start(self) -> FakePlaywright:
+        return FakePlaywright()
+
+
+@pytest.fixture(autouse=True)
+def fake_driver(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(driver_module, "async_playwright", FakePlaywrightStarter)
+    monkeypatch.setattr(driver_module, "_drivers", weakref.WeakKeyDictionary())
+
+
+@pytest.mark.anyio
+async def test_driver_is_started_once_and_shared():
+    first = await get_playwright()
+
+    assert await get_playwright() is first
+    assert get_playwright_driver().starts == 1
+
+
+@pytest.mark.anyio
+async def test_driver_is_restarted_only_after_it_dies():
+    first = await get_playwright()
+    first._impl_obj._connection._transport._proc.returncode = 1
+
+    second = await get_playwright()
+
+    assert second is not first
+    assert first.stopped is True
+    assert get_playwright_driver().starts == 2
+
+
+@pytest.mark.anyio
+async def test_closed_connection_counts_as_dead():
+    first = await get_playwright()
+    first._impl_obj._connection._closed_error = RuntimeError("closed")
+
+    assert driver_module.is_driver_alive(first) is False
+    assert await get_playwright() is not first
+
+
+@pytest.mark.anyio
+async def test_stop_playwright_stops_the_shared_driver():
+    playwright = await get_playwright()
+
+    await stop_playwright()
+
+    assert playwright.stopped is True
+    assert get_playwright_driver().playwright is None
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import pytest
+
+import brui_core.browser.process_scanner as scanner
+from brui_core.browser.browser_launcher import find_main_chrome_parent
+from brui_core.browser.process_scanner import ChromeProcess, ChromeProcessTable
+
+CHROME = "/opt/google/chrome/chrome"
+
+
+def write_proc_entry(root, pid: int, ppid: int, argv: list[str], comm: str = "chrome") -> None:
+    entry = root / str(pid)
+    entry.mkdir()
+    (entry / "cmdline").write_bytes(b"\0".join(arg.encode() for arg in argv) + b"\0")
+    (entry / "stat").write_bytes(f"{pid} ({comm}) S {ppid} {pid} {pid} 0 -1".encode())
+
+
+@pytest.fixture
+def fake_proc(monkeypatch: pytest.MonkeyPatch, tmp_path):
+    monkeypatch.setattr(scanner, "PROC_ROOT", str(tmp_path))
+    (tmp_path / "self").mkdir()
+    write_proc_entry(tmp_path, 1, 0, ["/sbin/init"], comm="init")
+    write_proc_entry(tmp_path, 100, 1, [CHROME, "--remote-debugging-port=9222"])
+    write_proc_entry(tmp_path, 101, 100, [CHROME, "--type=zygote"], comm="chrome (zygote)")
+    write_proc_entry(tmp_path, 102, 101, [CHROME, "--type=renderer", "--lang=en-US"])
+    write_proc_entry(tmp_path, 200, 1, ["/usr/bin/python3", "worker.py"], comm="python3")
+    (tmp_path / "300").mkdir()  # kernel thread style entry without files
+    return tmp_path
+
+
+def test_scan_from_proc_matches_chrome_processes_only(fake_proc):
+    table = scanner.scan_processes(CHROME)
+
+    assert {p.pid for p in table} == {100, 101, 102}
+    assert table.by_pid[101].ppid == 100
+    assert table.by_pid[102].cmd == f"{CHROME} --type=renderer --lang=en-US"
+
+
+def test_table_indexes_parent_child_tree(fake_proc):
+    table = scanner.scan_processes(CHROME)
+
+    assert table.roots() == {table.by_pid[100]}
+    assert [p.pid for p in table.descendants(100)] == [101, 102]
+    assert find_main_chrome_parent(table).pid == 100
+
+
+def test_find_main_chrome_parent_accepts_plain_sets():
+    processes = {
+        ChromeProcess(pid=10, ppid=1, cmd=f"{CHROME} --remote-debugging-port=9222"),
+        ChromeProcess(pid=11, ppid=10, cmd=f"{CHROME} --type=renderer"),
+    }
+
+    assert find_main_chrome_parent(processes).pid == 10
+    assert find_main_chrome_parent(ChromeProcessTable()) is None
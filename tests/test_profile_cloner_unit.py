@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+import brui_core.browser.browser_launcher as launcher
+from brui_core.browser.profile_cloner import CLONE_MARKER, clone_profile, collect_stale_profile_clones
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+def template(tmp_path):
+    template_dir = tmp_path / "template"
+    (template_dir / "Default" / "Local Storage").mkdir(parents=True)
+    (template_dir / "Default" / "Cookies").write_bytes(b"session=1")
+    (template_dir / "Default" / "Local Storage" / "leveldb.log").write_bytes(b"x" * 4096)
+    (template_dir / "Local State").write_text("{}")
+    (template_dir / "SingletonLock").symlink_to("somehost-1234")
+    (template_dir / "Last Version").symlink_to("Local State")
+    return template_dir
+
+
+def test_clone_copies_profile_without_lock_files(template, tmp_path):
+    clone = clone_profile(str(template), clone_root=str(tmp_path / "clones"))
+
+    assert os.path.dirname(clone.path) == str(tmp_path / "clones")
+    assert open(os.path.join(clone.path, "Default", "Cookies"), "rb").read() == b"session=1"
+    assert os.path.getsize(os.path.join(clone.path, "Default", "Local Storage", "leveldb.log")) == 4096
+    assert not os.path.lexists(os.path.join(clone.path, "SingletonLock"))
+    assert os.readlink(os.path.join(clone.path, "Last Version")) == "Local State"
+    assert clone.link_mode in ("reflink", "copy")
+
+    # Writes to the clone never reach the template
+    with open(os.path.join(clone.path, "Default", "Cookies"), "wb") as f:
+        f.write(b"session=2")
+    assert (template / "Default" / "Cookies").read_bytes() == b"session=1"
+
+    clone.remove()
+    assert not os.path.exists(clone.path)
+
+
+def test_hardlink_mode_shares_inodes(template, tmp_path):
+    clone = clone_profile(str(template), clone_root=str(tmp_path / "clones"), link_mode="hardlink")
+
+    cloned = os.stat(os.path.join(clone.path, "Default", "Cookies"))
+    original = os.stat(template / "Default" / "Cookies")
+    assert cloned.st_ino == original.st_ino
+    assert clone.link_mode == "hardlink"
+
+
+def test_stale_clones_of_dead_processes_are_collected(template, tmp_path):
+    clone_root = tmp_path / "clones"
+    live = clone_profile(str(template), clone_root=str(clone_root))
+    stale = clone_profile(str(template), clone_root=str(clone_root))
+    dead = subprocess.Popen([sys.executable, "-c", "pass"])
+    dead.wait()
+    with open(os.path.join(stale.path, CLONE_MARKER), "w") as marker:
+        marker.write(str(dead.pid))
+
+    assert collect_stale_profile_clones(str(clone_root)) == 1
+    assert os.path.exists(live.path)
+    assert not os.path.exists(stale.path)
+
+
+@pytest.mark.anyio
+async def test_launch_browser_uses_and_cleans_up_template_clone(template, tmp_path, monkeypatch: pytest.MonkeyPatch):
+    fake_chrome = tmp_path / "fake-chrome"
+    fake_chrome.write_text(
+        "#!/bin/sh\n"
+        "echo \"DevTools listening on ws://127.0.0.1:9555/devtools/browser/x\" >&2\n"
+        "exec sleep 30\n"
+    )
+    fake_chrome.chmod(0o755)
+    monkeypatch.setattr(launcher, "get_chrome_startup_path", lambda: str(fake_chrome))
+    monkeypatch.setenv("CHROME_LOG_PATH", str(tmp_path / "chrome.log"))
+
+    launched = await launcher.launch_browser(
+        remote_debugging_port=9555,
+        profile_template_dir=str(template),
+    )
+    try:
+        assert launched.profile_clone is not None
+        assert launched.user_data_dir == launched.profile_clone.path
+        assert os.path.exists(os.path.join(launched.user_data_dir, "Default", "Cookies"))
+    finally:
+        await launcher.terminate_launched_browser(launched)
+
+    assert not os.path.exists(launched.user_data_dir)
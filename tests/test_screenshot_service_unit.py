@@ -0,0 +1,290 @@
+from __future__ import annotations
+
+import asyncio
+import base64
+import io
+from pathlib import Path
+
+import pytest
+from PIL import Image, ImageDraw
+
+import brui_core.ui_integrator as ui_module
+from brui_core.browser.page_scheduler import PageScheduler
+from brui_core.screenshot.screenshot_service import ScreenshotService
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+def png_frame(color: str, size: tuple[int, int] = (200, 100), box: bool = False) -> str:
+    image = Image.new("RGB", size, color)
+    if box:
+        ImageDraw.Draw(image).rectangle((10, 10, 90, 60), fill="black")
+    output = io.BytesIO()
+    image.save(output, format="PNG")
+    return base64.b64encode(output.getvalue()).decode()
+
+
+class FakeSession:
+    def __init__(self, frames: list[str]) -> None:
+        self.frames = list(frames)
+        self.sent: list[tuple[str, dict | None]] = []
+        self.listeners: dict = {}
+        self.detached = False
+
+    def on(self, event: str, handler) -> None:
+        self.listeners.setdefault(event, []).append(handler)
+
+    def remove_listener(self, event: str, handler) -> None:
+        self.listeners[event].remove(handler)
+
+    async def send(self, method: str, params: dict | None = None):
+        self.sent.append((method, params))
+        if method == "Page.captureScreenshot":
+            return {"data": self.frames.pop(0)}
+        if method == "Page.startScreencast":
+            for index, frame in enumerate(self.frames):
+                for handler in list(self.listeners.get("Page.screencastFrame", [])):
+                    handler({"data": frame, "sessionId": index})
+        return {}
+
+    async def detach(self) -> None:
+        self.detached = True
+
+
+class FakeContext:
+    def __init__(self, session: FakeSession) -> None:
+        self.session = session
+
+    async def new_cdp_session(self, page) -> FakeSession:
+        return self.session
+
+
+class FakePage:
+    def __init__(self, session: FakeSession) -> None:
+        self.context = FakeContext(session)
+        self.url = "about:blank"
+
+    def is_closed(self) -> bool:
+        return False
+
+    async def close(self) -> None:
+        pass
+
+
+@pytest.mark.anyio
+async def test_capture_writes_frames_and_skips_duplicates(tmp_path: Path) -> None:
+    session = FakeSession([png_frame("white"), png_frame("white"), png_frame("white", box=True)])
+    service = ScreenshotService(FakePage(session), output_dir=str(tmp_path), max_width=100)
+
+    first = await service.capture()
+    assert await service.capture() is None
+    third = await service.capture(path=str(tmp_path / "custom.png"))
+
+    assert (first.width, first.height) == (100, 50)
+    assert first.path == str(tmp_path / "frame-000001.png")
+    assert Image.open(first.path).size == (100, 50)
+    assert third.path == str(tmp_path / "custom.png")
+    assert third.hash != first.hash
+    assert (service.captured, service.skipped) == (2, 1)
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+@pytest.mark.anyio
+async def test_png_frames_are_passed_through_without_reencoding() -> None:
+    frame = png_frame("blue")
+    service = ScreenshotService(FakePage(FakeSession([frame])))
+
+    screenshot = await service.capture()
+    assert screenshot.data == base64.b64decode(frame)
+    assert screenshot.path is None
+
+
+@pytest.mark.anyio
+async def test_screencast_acks_frames_and_yields_distinct_ones(tmp_path: Path) -> None:
+    frames = [png_frame("white"), png_frame("white"), png_frame("white", box=True), png_frame("white", box=True)]
+    session = FakeSession(frames)
+    service = ScreenshotService(FakePage(session), output_dir=str(tmp_path), image_format="jpeg", quality=70)
+
+    stream = service.screencast(max_width=320, every_nth_frame=2)
+    shots = [await stream.__anext__(), await stream.__anext__()]
+    await stream.aclose()
+
+    assert [shot.path for shot in shots] == [str(tmp_path / "frame-000001.jpg"), str(tmp_path / "frame-000002.jpg")]
+    assert Image.open(shots[0].path).format == "JPEG"
+    methods = [method for method, _ in session.sent]
+    assert methods[0] == "Page.startScreencast"
+    assert session.sent[0][1] == {"format": "png", "everyNthFrame": 2, "maxWidth": 320}
+    assert methods.count("Page.screencastFrameAck") == 3
+    assert methods[-1] == "Page.stopScreencast"
+    assert session.listeners["Page.screencastFrame"] == []
+
+    await service.close()
+    assert session.detached is True
+
+
+class FakeBrowserContext:
+    def __init__(self, session: FakeSession) -> None:
+        self.session = session
+        self.pages: list[FakePage] = []
+
+    async def new_page(self) -> FakePage:
+        return FakePage(self.session)
+
+
+class FakeBrowserManager:
+    def __init__(self) -> None:
+        self.session = FakeSession([png_frame("red")])
+        self.page_scheduler = PageScheduler()
+
+    async def ensure_browser_launched(self) -> None:
+        pass
+
+    async def connect_browser(self):
+        return object()
+
+    async def get_browser_context(self, browser) -> FakeBrowserContext:
+        return FakeBrowserContext(self.session)
+
+
+@pytest.mark.anyio
+async def test_integrator_screenshot_service_follows_the_page(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(ui_module, "BrowserManager", FakeBrowserManager)
+    integrator = ui_module.UIIntegrator()
+    await integrator.initialize()
+
+    service = await integrator.get_screenshot_service(max_width=50)
+    assert await integrator.get_screenshot_service() is service
+    assert await integrator.get_screenshot_service(max_width=50) is service
+    assert (await service.capture()).width == 50
+    with pytest.raises(ValueError, match="already exists"):
+        await integrator.get_screenshot_service(max_width=80)
+
+    await integrator.reopen_page()
+    replacement = await integrator.get_screenshot_service()
+    assert replacement is not service and replacement.page is integrator.page
+    assert replacement.max_width == 50
+
+    await integrator.close()
+    assert integrator.screenshots is None
+    assert integrator.browser_manager.session.detached is True
+
+
+class TimedSession(FakeSession):
+    """Paints `frames` one per `interval` once the screencast starts."""
+
+    def __init__(self, frames: list[str], interval: float = 0.01) -> None:
+        super().__init__(frames)
+        self.interval = interval
+        self.painter: asyncio.Task | None = None
+
+    async def paint(self) -> None:
+        for index, frame in enumerate(self.frames):
+            await asyncio.sleep(self.interval)
+            for handler in list(self.listeners.get("Page.screencastFrame", [])):
+                handler({"data": frame, "sessionId": index})
+
+    async def send(self, method: str, params: dict | None = None):
+        self.sent.append((method, params))
+        if method == "Page.startScreencast":
+            self.painter = asyncio.create_task(self.paint())
+        elif method == "Page.stopScreencast" and self.painter is not None:
+            self.painter.cancel()
+        return {}
+
+
+@pytest.mark.anyio
+async def test_stability_after_consecutive_matching_frames() -> None:
+    frames = [png_frame("white"), png_frame("white", box=True)] + [png_frame("gray")] * 3 + [png_frame("white")] * 50
+    session = TimedSession(frames)
+    service = ScreenshotService(FakePage(session))
+
+    elapsed = await service.wait_for_stability(stable_frames=3, quiet_period=5, timeout=5)
+
+    assert elapsed < 1
+    assert [method for method, _ in session.sent].count("Page.screencastFrameAck") == 5
+    assert session.sent[0][1] == {"format": "png", "everyNthFrame": 1, "maxWidth": 320, "maxHeight": 240}
+    assert session.sent[-1][0] == "Page.stopScreencast"
+
+
+@pytest.mark.anyio
+async def test_stability_after_quiet_period() -> None:
+    session = TimedSession([png_frame("white"), png_frame("white", box=True)])
+    service = ScreenshotService(FakePage(session))
+
+    elapsed = await service.wait_for_stability(stable_frames=3, quiet_period=0.1, timeout=5)
+    assert 0.1 <= elapsed < 1
+
+
+class StaticSession(TimedSession):
+    """A page Chrome sends no screencast frames for, e.g. a background tab that never repaints."""
+
+    async def send(self, method: str, params: dict | None = None):
+        self.sent.append((method, params))
+        if method == "Page.captureScreenshot":
+            return {"data": png_frame("white")}
+        return {}
+
+
+@pytest.mark.anyio
+async def test_stability_of_a_page_that_sends_no_frames() -> None:
+    session = StaticSession([])
+    service = ScreenshotService(FakePage(session))
+
+    elapsed = await service.wait_for_stability(quiet_period=0.05, timeout=5)
+
+    assert elapsed < 0.5
+    assert [method for method, _ in session.sent].count("Page.captureScreenshot") == 1
+
+
+@pytest.mark.anyio
+async def test_stability_times_out_while_the_page_keeps_changing() -> None:
+    session = TimedSession([png_frame("white"), png_frame("white", box=True)] * 100)
+    service = ScreenshotService(FakePage(session))
+
+    with pytest.raises(asyncio.TimeoutError):
+        await service.wait_for_stability(quiet_period=0.5, timeout=0.2)
+    assert session.listeners["Page.screencastFrame"] == []
+
+
+@pytest.mark.anyio
+async def test_integrator_waits_for_visual_stability(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(ui_module, "BrowserManager", FakeBrowserManager)
+    integrator = ui_module.UIIntegrator()
+    await integrator.initialize()
+    integrator.page.context.session = TimedSession([png_frame("white")] * 3)
+
+    assert await integrator.wait_for_visual_stability(quiet_period=5, timeout=5) < 1
+
+
+class SessionPerCallContext:
+    def __init__(self, frames: list[str]) -> None:
+        self.frames = frames
+        self.sessions: list[TimedSession] = []
+
+    async def new_cdp_session(self, page) -> TimedSession:
+        self.sessions.append(TimedSession(self.frames))
+        return self.sessions[-1]
+
+
+@pytest.mark.anyio
+async def test_concurrent_screencasts_use_their_own_sessions() -> None:
+    page = FakePage(FakeSession([]))
+    page.context = SessionPerCallContext([png_frame("white")] * 20)
+    service = ScreenshotService(page)
+
+    stream = service.screencast()
+    await stream.__anext__()
+    assert await service.wait_for_stability(quiet_period=5, timeout=5) < 1
+
+    streaming, settling = page.context.sessions
+    # Stopping the stability screencast left the stream running
+    assert [method for method, _ in streaming.sent].count("Page.stopScreencast") == 0
+    await stream.aclose()
+    assert [method for method, _ in streaming.sent].count("Page.stopScreencast") == 1
+    assert [method for method, _ in settling.sent].count("Page.stopScreencast") == 1
+    assert streaming.detached and settling.detached
+    acks = [params["sessionId"] for method, params in settling.sent if method == "Page.screencastFrameAck"]
+    assert acks == [0, 1, 2]
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import asyncio
+import os
+
+import pytest
+
+from brui_core.browser.page_scheduler import PageScheduler
+from brui_core.sharded_runner import ShardedRunner, WorkerCrashed, WorkerStartFailed
+from brui_core.ui_integrator import UIIntegrator
+
+
+class FakePage:
+    pass
+
+
+class FakePagePool:
+    async def acquire(self) -> FakePage:
+        return FakePage()
+
+    async def release(self, page: FakePage, clear_storage: bool | None = None, discard: bool = False) -> None:
+        pass
+
+
+class FakeBrowserManager:
+    def __init__(self) -> None:
+        self.page_scheduler = PageScheduler()
+
+    def get_page_pool(self, context) -> FakePagePool:
+        return FakePagePool()
+
+
+class FakeIntegrator(UIIntegrator):
+    """Runs in the worker process without a real Chrome."""
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(browser_manager=FakeBrowserManager(), **kwargs)
+
+    async def initialize(self) -> None:
+        self.context = object()
+        self.initialized = True
+
+    async def close(self, **_kwargs) -> None:
+        self.initialized = False
+
+
+class BrokenIntegrator(FakeIntegrator):
+    async def initialize(self) -> None:
+        raise ConnectionError("no chrome here")
+
+
+async def worker_task(page, item):
+    await asyncio.sleep(0.01)
+    if item == 3:
+        raise ValueError("bad item")
+    return os.getpid(), os.environ["CHROME_REMOTE_DEBUGGING_PORT"], item * 2
+
+
+def test_tasks_are_sharded_over_worker_processes(tmp_path):
+    with ShardedRunner(worker_task, workers=2, concurrency_per_worker=2, base_port=9400,
+                       user_data_root=str(tmp_path), integrator_factory=FakeIntegrator) as runner:
+        results = runner.run(range(20))
+
+    assert [result.index for result in results] == list(range(20))
+    failed = [result for result in results if not result.ok]
+    assert [result.input for result in failed] == [3]
+    assert isinstance(failed[0].error, ValueError)
+
+    values = [result.value for result in results if result.ok]
+    assert [value[2] for value in values] == [item * 2 for item in range(20) if item != 3]
+    assert {value[1] for value in values} <= {"9400", "9401"}
+    assert os.getpid() not in {value[0] for value in values}
+
+
+def test_runner_can_be_used_for_several_calls(tmp_path):
+    with ShardedRunner(worker_task, workers=2, concurrency_per_worker=2, base_port=9400,
+                       user_data_root=str(tmp_path), integrator_factory=FakeIntegrator) as runner:
+        first = runner.run(range(4))
+        # Abandon a call while its items are still running; their results must not leak into the next call
+        abandoned = runner.map(range(100, 120))
+        next(abandoned)
+        abandoned.close()
+        second = runner.run(range(10, 14))
+
+    assert [result.input for result in first] == [0, 1, 2, 3]
+    assert [result.input for result in second] == [10, 11, 12, 13]
+    assert [result.value[2] for result in second] == [20, 22, 24, 26]
+
+
+def test_worker_ports_leave_room_for_hot_spares(monkeypatch: pytest.MonkeyPatch, tmp_path):
+    monkeypatch.setenv("CHROME_REMOTE_DEBUGGING_PORT", "9222")
+    monkeypatch.setenv("CHROME_HOT_SPARE", "1")
+    runner = ShardedRunner(worker_task, workers=3, user_data_root=str(tmp_path))
+
+    # 9223 is the parent's standby, and each worker's standby takes the port after its own
+    assert [runner.worker_port(i) for i in range(3)] == [9224, 9226, 9228]
+
+    monkeypatch.setenv("CHROME_HOT_SPARE", "0")
+    runner = ShardedRunner(worker_task, workers=3, user_data_root=str(tmp_path))
+    assert [runner.worker_port(i) for i in range(3)] == [9223, 9224, 9225]
+
+
+def test_runner_fails_when_no_worker_starts(tmp_path):
+    with ShardedRunner(worker_task, workers=2, base_port=9400, user_data_root=str(tmp_path),
+                       integrator_factory=BrokenIntegrator) as runner:
+        with pytest.raises(WorkerStartFailed, match="no chrome here"):
+            runner.run(range(3))
+
+
+class SecondWorkerBrokenIntegrator(FakeIntegrator):
+    async def initialize(self) -> None:
+        if os.environ["CHROME_REMOTE_DEBUGGING_PORT"] == "9401":
+            raise ConnectionError("no chrome here")
+        await super().initialize()
+
+
+async def crashing_task(page, item):
+    await asyncio.sleep(0.01)
+    if item == 5:
+        os._exit(3)
+    return item
+
+
+def test_items_of_a_worker_that_failed_to_start_go_to_the_others(tmp_path):
+    with ShardedRunner(worker_task, workers=2, concurrency_per_worker=2, base_port=9400,
+                       user_data_root=str(tmp_path), integrator_factory=SecondWorkerBrokenIntegrator) as runner:
+        results = runner.run(range(10))
+
+    assert [result.index for result in results] == list(range(10))
+    assert {result.value[1] for result in results if result.ok} == {"9400"}
+
+
+def test_items_of_a_crashed_worker_are_reported(tmp_path):
+    with ShardedRunner(crashing_task, workers=2, concurrency_per_worker=2, base_port=9400,
+                       user_data_root=str(tmp_path), integrator_factory=FakeIntegrator) as runner:
+        results = runner.run(range(20))
+
+    assert [result.index for result in results] == list(range(20))
+    crashed = [result for result in results if isinstance(result.error, WorkerCrashed)]
+    assert 5 in [result.input for result in crashed]
+    assert all(result.value == result.input for result in results if result.ok)
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import threading
+import time
+
+from brui_core.singleton_meta import SingletonMeta
+
+
+def test_concurrent_first_calls_create_one_instance():
+    created: list[object] = []
+
+    class Slow(metaclass=SingletonMeta):
+        def __init__(self) -> None:
+            time.sleep(0.01)
+            created.append(self)
+
+    barrier = threading.Barrier(8)
+    results: list[object] = []
+
+    def create() -> None:
+        barrier.wait()
+        results.append(Slow())
+
+    threads = [threading.Thread(target=create) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(created) == 1
+    assert all(result is created[0] for result in results)
+
+
+def test_singleton_key_hook_keeps_one_instance_per_key():
+    class Keyed(metaclass=SingletonMeta):
+        @classmethod
+        def singleton_key(cls, name: str) -> str:
+            return name
+
+        def __init__(self, name: str) -> None:
+            self.name = name
+
+    assert Keyed("a") is Keyed("a")
+    assert Keyed("a") is not Keyed("b")
+    assert Keyed("b").name == "b"
+
+
+def test_expired_instances_are_dropped_when_a_new_one_is_created():
+    class Session(metaclass=SingletonMeta):
+        @classmethod
+        def singleton_key(cls, name: str) -> str:
+            return name
+
+        def __init__(self, name: str) -> None:
+            self.closed = False
+
+        def singleton_expired(self) -> bool:
+            return self.closed
+
+    first = Session("a")
+    first.closed = True
+    assert Session("a") is first
+
+    Session("b")
+    assert Session("a") is not first
+    assert first not in Session._instances.values()
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 
 import brui_core.ui_integrator as ui_module
+from brui_core.browser.page_scheduler import AdmissionRejected, PageScheduler
 
 
 class FakePage:
@@ -31,12 +34,25 @@ class FakeContext:
         self.closed = True
 
 
+class FakePagePool:
+    def __init__(self, context: FakeContext) -> None:
+        self.context = context
+        self.released: list[FakePage] = []
+
+    async def acquire(self) -> FakePage:
+        return await self.context.new_page()
+
+    async def release(self, page: FakePage, clear_storage: bool | None = None, discard: bool = False) -> None:
+        self.released.append(page)
+
+
 class FakeBrowserManager:
     def __init__(self) -> None:
         self.context = FakeContext()
         self.stopped = False
         self.launched = False
         self.connected = False
+        self.page_scheduler = PageScheduler(max_concurrent_pages=4)
 
     async def ensure_browser_launched(self) -> None:
         self.launched = True
@@ -48,6 +64,17 @@ class FakeBrowserManager:
     async def get_browser_context(self, _browser) -> FakeContext:
         return self.context
 
+    async def acquire_context(self) -> FakeContext:
+        self.acquired = FakeContext()
+        return self.acquired
+
+    async def release_context(self, context, recycle: bool = False) -> None:
+        self.released = (context, recycle)
+
+    def get_page_pool(self, context) -> FakePagePool:
+        self.page_pool = FakePagePool(context)
+        return self.page_pool
+
     async def stop_browser(self) -> None:
         self.stopped = True
 
@@ -101,3 +128,195 @@ async def test_close_respects_close_flags(fake_integrator):
 async def test_reopen_page_requires_initialized(fake_integrator):
     with pytest.raises(RuntimeError, match="UIIntegrator is not initialized"):
         await fake_integrator.reopen_page()
+
+
+@pytest.mark.anyio
+async def test_isolated_mode_acquires_and_releases_pooled_context(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(ui_module, "BrowserManager", FakeBrowserManager)
+    integrator = ui_module.UIIntegrator(context_mode="isolated")
+    manager = integrator.browser_manager
+
+    await integrator.initialize()
+    context = integrator.context
+
+    assert context is manager.acquired
+    assert context is not manager.context
+
+    await integrator.close()
+
+    assert manager.released == (context, False)
+    assert context.closed is False
+    assert integrator.context is None
+
+
+@pytest.mark.anyio
+async def test_isolated_close_without_page_keeps_the_context_lease(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(ui_module, "BrowserManager", FakeBrowserManager)
+    integrator = ui_module.UIIntegrator(context_mode="isolated")
+    manager = integrator.browser_manager
+    await integrator.initialize()
+    page, context = integrator.page, integrator.context
+
+    with pytest.raises(ValueError, match="requires close_page"):
+        await integrator.close(close_page=False, close_context=True)
+    await integrator.close(close_page=False)
+
+    assert integrator.page is page and page.is_closed() is False
+    assert integrator.context is context
+    assert not hasattr(manager, "released")
+    assert manager.page_scheduler.running == 1
+
+
+def test_unknown_context_mode_is_rejected(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(ui_module, "BrowserManager", FakeBrowserManager)
+    with pytest.raises(ValueError, match="Unknown context_mode"):
+        ui_module.UIIntegrator(context_mode="private")
+
+
+@pytest.mark.anyio
+async def test_page_pool_mode_releases_pages_instead_of_closing(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(ui_module, "BrowserManager", FakeBrowserManager)
+    integrator = ui_module.UIIntegrator(use_page_pool=True)
+    await integrator.initialize()
+    first = integrator.page
+    pool = integrator.browser_manager.page_pool
+
+    await integrator.reopen_page()
+    second = integrator.page
+    await integrator.close()
+
+    assert pool.released == [first, second]
+    assert first.is_closed() is False and second.is_closed() is False
+    assert integrator.page is None
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_map_streams_results_with_bounded_concurrency(fake_integrator, anyio_backend):
+    await fake_integrator.initialize()
+    pulled: list[int] = []
+    active = 0
+    peak = 0
+
+    def inputs():
+        for item in range(6):
+            pulled.append(item)
+            yield item
+
+    async def task(page, item):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01 * (3 - item % 3))
+        active -= 1
+        if item == 4:
+            raise ValueError("boom")
+        return item * 10
+
+    stream = fake_integrator.map(task, inputs(), concurrency=2)
+    first = await stream.__anext__()
+    assert len(pulled) <= 3
+    results = [first] + [result async for result in stream]
+
+    assert peak == 2
+    assert sorted(result.index for result in results) == list(range(6))
+    failed = [result for result in results if not result.ok]
+    assert [result.input for result in failed] == [4]
+    assert isinstance(failed[0].error, ValueError)
+    assert len(fake_integrator.browser_manager.page_pool.released) == 6
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_map_yields_results_while_waiting_for_input(fake_integrator, anyio_backend):
+    await fake_integrator.initialize()
+    more_input = asyncio.Event()
+
+    async def inputs():
+        yield 1
+        # e.g. a work queue that is empty for now
+        await more_input.wait()
+        yield 2
+
+    async def task(page, item):
+        return item * 10
+
+    stream = fake_integrator.map(task, inputs(), concurrency=2)
+    first = await asyncio.wait_for(stream.__anext__(), 1)
+    assert first.value == 10
+    more_input.set()
+    assert [result.value async for result in stream] == [20]
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_run_batch_returns_results_in_input_order(fake_integrator, anyio_backend):
+    await fake_integrator.initialize()
+
+    async def task(page, item):
+        return item.upper()
+
+    results = await fake_integrator.run_batch(task, ["a", "b", "c"], concurrency=3)
+
+    assert [result.value for result in results] == ["A", "B", "C"]
+
+
+@pytest.mark.anyio
+async def test_page_holds_a_scheduler_slot_until_closed(fake_integrator):
+    scheduler = fake_integrator.browser_manager.page_scheduler
+
+    await fake_integrator.initialize()
+    await fake_integrator.reopen_page()
+    assert scheduler.running == 1
+
+    await fake_integrator.close()
+    assert scheduler.running == 0
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_map_items_run_under_the_integrators_own_slot(fake_integrator, anyio_backend):
+    fake_integrator.browser_manager.page_scheduler = PageScheduler(max_concurrent_pages=1)
+    await fake_integrator.initialize()
+
+    async def task(page, item):
+        return item * 2
+
+    results = await fake_integrator.run_batch(task, [1, 2, 3], concurrency=2)
+
+    assert [result.value for result in results] == [2, 4, 6]
+    assert fake_integrator.browser_manager.page_scheduler.running == 1
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_isolated_context_is_not_leased_when_admission_is_rejected(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(ui_module, "BrowserManager", FakeBrowserManager)
+    integrator = ui_module.UIIntegrator(context_mode="isolated", admission_deadline=0.01)
+    manager = integrator.browser_manager
+    manager.page_scheduler = PageScheduler(max_concurrent_pages=1)
+    await manager.page_scheduler.acquire()
+
+    with pytest.raises(AdmissionRejected):
+        await integrator.initialize()
+
+    assert not hasattr(manager, "acquired")
+    assert integrator.context is None
+
+
+@pytest.mark.anyio
+async def test_isolated_context_is_released_when_the_page_fails(monkeypatch: pytest.MonkeyPatch):
+    async def broken_new_page(self):
+        raise RuntimeError("target crashed")
+
+    monkeypatch.setattr(ui_module, "BrowserManager", FakeBrowserManager)
+    monkeypatch.setattr(FakeContext, "new_page", broken_new_page)
+    integrator = ui_module.UIIntegrator(context_mode="isolated")
+    manager = integrator.browser_manager
+
+    with pytest.raises(RuntimeError, match="target crashed"):
+        await integrator.initialize()
+
+    assert manager.released == (manager.acquired, True)
+    assert manager.page_scheduler.running == 0
+    assert integrator.context is None
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+import brui_core.ui_integrator as ui_module
+from brui_core.browser.page_pool import PagePool
+from brui_core.browser.page_scheduler import PageScheduler
+from brui_core.clipboard.virtual_clipboard import (
+    BINDING_NAME,
+    VIRTUAL_CLIPBOARD_SCRIPT,
+    attach_virtual_clipboard,
+)
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+class FakePage:
+    def __init__(self) -> None:
+        self.url = "about:blank"
+        self.bindings: dict = {}
+        self.init_scripts: list[str] = []
+        self.evaluated: list[tuple] = []
+        self._closed = False
+
+    async def expose_binding(self, name: str, callback) -> None:
+        assert name not in self.bindings, "binding exposed twice"
+        self.bindings[name] = callback
+
+    async def add_init_script(self, script: str) -> None:
+        self.init_scripts.append(script)
+
+    async def evaluate(self, expression: str, arg=None) -> None:
+        self.evaluated.append((expression, arg))
+
+    def copy(self, text: str) -> None:
+        """What the page script does when the page copies text."""
+        self.bindings[BINDING_NAME]({"page": self}, text)
+
+    def is_closed(self) -> bool:
+        return self._closed
+
+    async def close(self) -> None:
+        self._closed = True
+
+
+class FakeContext:
+    def __init__(self) -> None:
+        self.pages: list[FakePage] = []
+
+    async def new_page(self) -> FakePage:
+        page = FakePage()
+        self.pages.append(page)
+        return page
+
+
+class FakeBrowserManager:
+    def __init__(self) -> None:
+        self.context = FakeContext()
+        self.page_scheduler = PageScheduler()
+
+    async def ensure_browser_launched(self) -> None:
+        pass
+
+    async def connect_browser(self):
+        return object()
+
+    async def get_browser_context(self, browser) -> FakeContext:
+        return self.context
+
+    def get_page_pool(self, context) -> PagePool:
+        if not hasattr(self, "page_pool"):
+            self.page_pool = PagePool(context, size=0)
+        return self.page_pool
+
+
+@pytest.mark.anyio
+async def test_copied_text_is_queued_per_page() -> None:
+    first_page, second_page = FakePage(), FakePage()
+    first = await attach_virtual_clipboard(first_page)
+    second = await attach_virtual_clipboard(second_page)
+
+    assert first_page.init_scripts == [VIRTUAL_CLIPBOARD_SCRIPT]
+    assert first_page.evaluated == [(VIRTUAL_CLIPBOARD_SCRIPT, None)]
+
+    first_page.copy("from first")
+    second_page.copy("from second")
+    first_page.copy("again")
+
+    assert await second.wait_for_content(timeout=1) == "from second"
+    assert await first.wait_for_content(timeout=1) == "from first"
+    assert await first.wait_for_content(timeout=1) == "again"
+    assert first.last_text == "again"
+    with pytest.raises(asyncio.TimeoutError):
+        await first.wait_for_content(timeout=0.01)
+
+
+@pytest.mark.anyio
+async def test_reattaching_keeps_binding_and_drops_stale_text() -> None:
+    page = FakePage()
+    clipboard = await attach_virtual_clipboard(page)
+    page.copy("left over")
+
+    # e.g. the page was returned to a page pool and leased again
+    assert await attach_virtual_clipboard(page) is clipboard
+    assert len(page.init_scripts) == 1
+    assert clipboard.queue.empty()
+
+    waiter = asyncio.create_task(clipboard.wait_for_content(timeout=1))
+    await asyncio.sleep(0)
+    page.copy("fresh")
+    assert await waiter == "fresh"
+
+
+@pytest.mark.anyio
+async def test_integrator_waits_on_its_own_page_in_virtual_mode(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(ui_module, "BrowserManager", FakeBrowserManager)
+    integrator = ui_module.UIIntegrator(clipboard_mode=ui_module.CLIPBOARD_MODE_VIRTUAL)
+    await integrator.initialize()
+
+    integrator.page.copy("copied in page")
+    assert await integrator.wait_for_clipboard_content(timeout=1) == "copied in page"
+
+    await integrator.reopen_page()
+    integrator.page.copy("copied in reopened page")
+    assert await integrator.wait_for_clipboard_content(timeout=1) == "copied in reopened page"
+
+    await integrator.close()
+    assert integrator.clipboard is None
+
+
+@pytest.mark.anyio
+async def test_pooled_pages_with_a_virtual_clipboard_are_not_reused(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(ui_module, "BrowserManager", FakeBrowserManager)
+    manager = FakeBrowserManager()
+    virtual = ui_module.UIIntegrator(use_page_pool=True, clipboard_mode=ui_module.CLIPBOARD_MODE_VIRTUAL,
+                                     browser_manager=manager)
+    await virtual.initialize()
+    page = virtual.page
+    await virtual.close()
+    assert page.is_closed() is True
+
+    system = ui_module.UIIntegrator(use_page_pool=True, browser_manager=manager)
+    await system.initialize()
+    assert system.page is not page
+    assert system.page.bindings == {}
+
+
+def test_unknown_clipboard_mode_is_rejected(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(ui_module, "BrowserManager", FakeBrowserManager)
+    with pytest.raises(ValueError, match="clipboard_mode"):
+        ui_module.UIIntegrator(clipboard_mode="shared")